@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from swarm.config import SwarmConfig
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def bench_config(root: Path) -> SwarmConfig:
+    """A SwarmConfig whose database and outputs live under ``root`` (MockLLM, no step cache)."""
+    config = SwarmConfig.from_repo_root(REPO_ROOT)
+    config.db_path = root / "swarm.db"
+    config.artifacts_dir = root / "artifacts"
+    config.output_root = root / "output"
+    config.filesystem_allowlist = [REPO_ROOT, config.artifacts_dir, config.output_root]
+    config.step_cache = False
+    return config
+
+
+def measure(fn: Callable[[], Any], repeats: int) -> dict[str, float]:
+    """Call ``fn`` ``repeats`` times and summarise the wall-clock seconds per call."""
+    samples: list[float] = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return {
+        "repeats": repeats,
+        "min_s": round(min(samples), 6),
+        "median_s": round(statistics.median(samples), 6),
+        "max_s": round(max(samples), 6),
+    }
@@ -0,0 +1,30 @@
+"""CPU cost of the coder's artifact generation: scene GIF encoding and landing page render."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from benchmarks._common import measure
+from swarm.agents.coder import _generate_scene_gif, _landing_page_project
+
+
+def run(quick: bool = False) -> dict[str, Any]:
+    repeats = 2 if quick else 5
+    gif_bytes = len(_generate_scene_gif("rocket launch", width=180, height=260, frames=48))
+    return {
+        "scene_gif": {
+            "frames": 48,
+            "size": "180x260",
+            "bytes": gif_bytes,
+            **measure(lambda: _generate_scene_gif("rocket launch", width=180, height=260, frames=48), repeats),
+        },
+        "landing_page": measure(
+            lambda: _landing_page_project(
+                "Design a landing page for a small indie bookstore.",
+                "Draft the page.",
+                "Readers want events and staff picks.",
+                None,
+            ),
+            repeats * 20,
+        ),
+    }
@@ -0,0 +1,106 @@
+"""Micro-benchmark: per-event cost and memory of EventLog before/after compact events.
+
+Run with ``python -m benchmarks.event_log``. The "legacy" log reproduces the
+previous representation (timezone-aware datetime plus dataclass per event) so
+both numbers come from the same interpreter and payloads.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from swarm.bus import EventLog
+
+PROMPT = "ROLE: Coder\n" + "Objective: build a landing page for a bookstore.\n" * 80
+
+
+@dataclass(slots=True)
+class _LegacyEvent:
+    timestamp: datetime
+    event_type: str
+    payload: dict[str, Any]
+
+
+class _LegacyEventLog:
+    def __init__(self) -> None:
+        self._events: list[_LegacyEvent] = []
+
+    def log(self, event_type: str, payload: dict[str, Any]) -> None:
+        self._events.append(
+            _LegacyEvent(
+                timestamp=datetime.now(timezone.utc),
+                event_type=event_type,
+                payload=payload,
+            )
+        )
+
+
+def _workload(log: Any, count: int) -> None:
+    for index in range(count):
+        if index % 2:
+            log.log("llm_prompt", {"agent": "coder", "role": "Coder", "prompt": PROMPT})
+        else:
+            log.log("step_started", {"step_id": index, "agent": "coder"})
+
+
+def _time_per_event(factory: Callable[[], Any], count: int, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        log = factory()
+        gc.disable()
+        started = time.perf_counter_ns()
+        _workload(log, count)
+        elapsed = time.perf_counter_ns() - started
+        gc.enable()
+        best = min(best, elapsed / count)
+    return best
+
+
+def _bytes_per_event(factory: Callable[[], Any], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    log = factory()
+    before, _ = tracemalloc.get_traced_memory()
+    _workload(log, count)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del log
+    return (after - before) / count
+
+
+def run(count: int = 50_000, repeats: int = 5) -> dict[str, Any]:
+    variants = {"legacy": _LegacyEventLog, "compact": EventLog}
+    results: dict[str, Any] = {}
+    for name, factory in variants.items():
+        results[name] = {
+            "ns_per_event": round(_time_per_event(factory, count, repeats), 1),
+            "bytes_per_event": round(_bytes_per_event(factory, count), 1),
+        }
+    results["speedup"] = round(
+        results["legacy"]["ns_per_event"] / results["compact"]["ns_per_event"], 2
+    )
+    results["memory_ratio"] = round(
+        results["compact"]["bytes_per_event"] / results["legacy"]["bytes_per_event"], 2
+    )
+    return {
+        "benchmark": "event_log",
+        "events": count,
+        "python": platform.python_version(),
+        "results": results,
+    }
+
+
+def main() -> int:
+    print(json.dumps(run(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+"""OllamaLLM and OpenAICompatibleLLM transport cost end to end against the local stub server."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from swarm.llm import OllamaLLM, OllamaStubServer, OpenAICompatibleLLM, RemoteLLM
+from swarm.net import HttpClient
+
+PROMPT = "Role: planner\nObjective: benchmark the Ollama transport"
+
+
+def _requests_per_s(server: OllamaStubServer, endpoint: str, concurrency: int, requests: int) -> dict[str, Any]:
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            await llm.complete(PROMPT)
+
+    async def run_all() -> None:
+        per_worker = max(1, requests // concurrency)
+        await asyncio.gather(*(worker(per_worker) for _ in range(concurrency)))
+
+    client = HttpClient()
+    llm: RemoteLLM
+    if endpoint == "/v1/chat/completions":
+        llm = OpenAICompatibleLLM(
+            model="llama3.1", base_url=server.url, timeout=30, retries=1, client=client
+        )
+    else:
+        llm = OllamaLLM(
+            model="llama3.1", base_url=server.url, endpoint=endpoint, timeout=30, retries=1, client=client
+        )
+    before = server.stats.requests + server.stats.not_found
+    connections = server.stats.connections
+    started = time.perf_counter()
+    asyncio.run(run_all())
+    elapsed = time.perf_counter() - started
+    sent = server.stats.requests + server.stats.not_found - before
+    return {
+        "endpoint": endpoint,
+        "concurrency": concurrency,
+        "http_requests": sent,
+        "connections": server.stats.connections - connections,
+        "seconds": round(elapsed, 4),
+        "requests_per_s": round(max(1, requests // concurrency) * concurrency / elapsed, 1),
+        "pool": llm.pool_stats().as_dict(),
+    }
+
+
+def run(quick: bool = False) -> dict[str, Any]:
+    requests = 40 if quick else 400
+    results: dict[str, Any] = {}
+    with OllamaStubServer() as server:
+        results["generate"] = [_requests_per_s(server, "/api/generate", c, requests) for c in (1, 8)]
+        results["chat"] = [_requests_per_s(server, "/api/chat", c, requests) for c in (1, 8)]
+        results["openai_chat"] = [
+            _requests_per_s(server, "/v1/chat/completions", c, requests) for c in (1, 8, 32)
+        ]
+    # Every call first hits a 404 on /api/generate, then falls back to /api/chat.
+    with OllamaStubServer(endpoints=["/api/chat"]) as server:
+        results["generate_404_fallback"] = [_requests_per_s(server, "/api/generate", 8, requests)]
+    return results
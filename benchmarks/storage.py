@@ -0,0 +1,59 @@
+"""Write rate of PersistentMemory and operation rate of the Feature Factory BatchStore."""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from projects.feature_factory.api.store import BatchStore, StorePaths
+from swarm.memory import PersistentMemory
+
+
+def persistent_writes(count: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        memory = PersistentMemory(Path(tmp) / "swarm.db")
+        created_at = datetime.now(timezone.utc).isoformat()
+        content = '{"summary": "benchmark payload", "files": []}'
+        started = time.perf_counter()
+        for index in range(count):
+            memory.put_message(f"run-{index % 10}", "coder", "Coder", content, created_at)
+        elapsed = time.perf_counter() - started
+        memory.close()
+    return {"writes": count, "seconds": round(elapsed, 4), "writes_per_s": round(count / elapsed, 1)}
+
+
+def batch_store_ops(batches: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = BatchStore(StorePaths(root=Path(tmp)))
+        ops = 0
+        started = time.perf_counter()
+        for index in range(batches):
+            batch_id = f"batch-{index}"
+            features = [
+                {"feature_id": f"{batch_id}-{item}", "objective": "bench", "status": "queued"}
+                for item in range(3)
+            ]
+            store.create_batch({"batch_id": batch_id, "status": "queued", "features": features})
+            store.update_batch(batch_id, {"status": "running"})
+            store.get_batch(batch_id)
+            store.get_feature(features[0]["feature_id"])
+            ops += 4
+        store.list_batches()
+        ops += 1
+        elapsed = time.perf_counter() - started
+    return {
+        "batches": batches,
+        "ops": ops,
+        "seconds": round(elapsed, 4),
+        "ops_per_s": round(ops / elapsed, 1),
+    }
+
+
+def run(quick: bool = False) -> dict[str, Any]:
+    return {
+        "persistent_memory": persistent_writes(100 if quick else 1000),
+        "batch_store": batch_store_ops(25 if quick else 200),
+    }
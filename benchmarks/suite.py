@@ -0,0 +1,81 @@
+"""Run the swarm benchmark suite and write machine-readable results.
+
+Usage: ``python -m benchmarks [--quick] [--only NAME ...] [-o results.json]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks import artifacts, event_log, ollama_transport, storage, swarm_runs
+from benchmarks._common import REPO_ROOT
+
+BENCHMARKS: dict[str, Callable[[bool], dict[str, Any]]] = {
+    "swarm_runs": swarm_runs.run,
+    "storage": storage.run,
+    "artifacts": artifacts.run,
+    "ollama_transport": ollama_transport.run,
+    "event_log": lambda quick: event_log.run(count=5_000 if quick else 50_000, repeats=2 if quick else 5),
+}
+
+
+def environment() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": commit or None,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run the swarm benchmark suite.")
+    parser.add_argument("--quick", action="store_true", help="Smaller workloads for a fast smoke run")
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=sorted(BENCHMARKS),
+        default=None,
+        help="Run only the named benchmarks",
+    )
+    parser.add_argument("-o", "--output", type=str, default=None, help="Write JSON results to this path")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    selected = args.only or list(BENCHMARKS)
+    results: dict[str, Any] = {}
+    for name in selected:
+        started = time.perf_counter()
+        results[name] = BENCHMARKS[name](args.quick)
+        print(f"{name}: {time.perf_counter() - started:.2f}s", file=sys.stderr)
+    report = {"environment": environment(), "quick": args.quick, "results": results}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
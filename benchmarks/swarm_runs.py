@@ -0,0 +1,78 @@
+"""Coordinator per-step overhead and SwarmRunner throughput using MockLLM."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks._common import bench_config
+from swarm.coordinator import Coordinator
+from swarm.runner import RunSpec, SwarmRunner
+
+SIMULATED_BACKEND = {"distribution": "lognormal", "latency": 0.02, "jitter": 0.5, "max_concurrency": 4}
+
+
+def coordinator_overhead(runs: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        coordinator = Coordinator(config=bench_config(Path(tmp)))
+        steps = 0
+
+        async def run_all() -> None:
+            nonlocal steps
+            for index in range(runs):
+                result = await coordinator.run(objective=f"overhead {index}", dry_run=True)
+                steps += sum(1 for event in result["events"] if event.event_type == "step_completed")
+
+        started = time.perf_counter()
+        asyncio.run(run_all())
+        elapsed = time.perf_counter() - started
+        coordinator.close()
+    return {
+        "runs": runs,
+        "steps": steps,
+        "seconds": round(elapsed, 4),
+        "ms_per_run": round(elapsed / runs * 1000, 3),
+        "ms_per_step": round(elapsed / max(steps, 1) * 1000, 3),
+    }
+
+
+def runner_throughput(
+    concurrency: int, runs: int, simulated: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        config = bench_config(Path(tmp))
+        if simulated is not None:
+            config.llm_provider = "simulated"
+            config.simulated_llm = simulated
+        runner = SwarmRunner(config=config, concurrency=concurrency)
+        specs = [RunSpec(objective=f"throughput {index}", dry_run=True) for index in range(runs)]
+        started = time.perf_counter()
+        asyncio.run(runner.run(specs))
+        elapsed = time.perf_counter() - started
+        runner.close()
+    return {
+        "concurrency": concurrency,
+        "runs": runs,
+        "seconds": round(elapsed, 4),
+        "runs_per_s": round(runs / elapsed, 2),
+    }
+
+
+def run(quick: bool = False) -> dict[str, Any]:
+    runs = 8 if quick else 40
+    return {
+        "coordinator_overhead": coordinator_overhead(runs),
+        "runner_throughput": [
+            runner_throughput(concurrency, max(runs, concurrency * (1 if quick else 2)))
+            for concurrency in (1, 4, 16, 64)
+        ],
+        # Same workload against a backend that serves 4 requests at a time with
+        # lognormal latency, to show queueing on LLM waits rather than CPU cost.
+        "simulated_llm_throughput": [
+            runner_throughput(concurrency, runs, SIMULATED_BACKEND)
+            for concurrency in (1, 4, 16)
+        ],
+    }
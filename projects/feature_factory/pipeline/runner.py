@@ -70,7 +70,6 @@ def normalize_batch(payload: dict[str, Any]) -> BatchSpec:
 
 def run_batch(batch: BatchSpec, repo_root: Path, concurrency: int = 4) -> list[RunResult]:
     config = SwarmConfig.from_repo_root(repo_root)
-    runner = SwarmRunner(config=config, concurrency=concurrency)
     run_specs = [
         RunSpec(
             objective=feature.objective,
@@ -80,7 +79,11 @@ def run_batch(batch: BatchSpec, repo_root: Path, concurrency: int = 4) -> list[R
         )
         for feature in batch.features
     ]
-    return _run_specs(runner, run_specs)
+    runner = SwarmRunner(config=config, concurrency=concurrency)
+    try:
+        return _run_specs(runner, run_specs)
+    finally:
+        runner.close()
 
 
 def _run_specs(runner: SwarmRunner, run_specs: list[RunSpec]) -> list[RunResult]:
@@ -3,5 +3,6 @@
 from .coordinator import Coordinator
 from .config import SwarmConfig
 from .runner import RunResult, RunSpec, SwarmRunner
+from .runtime import SwarmRuntime
 
-__all__ = ["Coordinator", "RunResult", "RunSpec", "SwarmConfig", "SwarmRunner"]
+__all__ = ["Coordinator", "RunResult", "RunSpec", "SwarmConfig", "SwarmRunner", "SwarmRuntime"]
@@ -6,9 +6,10 @@ from typing import Any, Awaitable, Callable, TYPE_CHECKING
 
 from swarm.bus import EventLog
 from swarm.config import SwarmConfig
-from swarm.llm import LLM
+from swarm.llm import LLM, LLMProfile, agent_scope, profile_scope, until_json_object
 from swarm.memory import PersistentMemory, ShortTermMemory
 from swarm.tools import FilesystemTool, HttpTool, ShellTool
+from swarm.tracing import span
 
 if TYPE_CHECKING:
     from swarm.runner import RunResult, RunSpec
@@ -50,10 +51,11 @@ class BaseAgent:
         )
 
     async def complete(self, context: AgentContext, prompt: str) -> str:
-        context.event_log.log(
-            "llm_prompt",
-            {"agent": self.name, "role": self.role, "prompt": prompt},
-        )
+        profile = self.llm_profile(context.config)
+        payload: dict[str, Any] = {"agent": self.name, "role": self.role, "prompt": prompt}
+        if profile is not None:
+            payload["profile"] = profile.as_dict()
+        context.event_log.log("llm_prompt", payload)
         if context.config.log_llm and not context.dry_run:
             log_path = context.output_dir / "llm.log"
             context.filesystem.append_text(
@@ -67,10 +69,16 @@ class BaseAgent:
                     ]
                 ),
             )
-        response = await context.llm.complete(prompt)
+        with span("llm.complete", agent=self.name, prompt_chars=len(prompt)) as active:
+            with agent_scope(self.name), profile_scope(profile):
+                if context.config.llm_stream or context.config.llm_stop_at_json:
+                    content = await self._stream(context, prompt)
+                else:
+                    content = (await context.llm.complete(prompt)).content
+            active.set(response_chars=len(content))
         context.event_log.log(
             "llm_response",
-            {"agent": self.name, "role": self.role, "response": response.content},
+            {"agent": self.name, "role": self.role, "response": content},
         )
         if context.config.log_llm and not context.dry_run:
             log_path = context.output_dir / "llm.log"
@@ -80,9 +88,27 @@ class BaseAgent:
                     [
                         "=== RESPONSE ===",
                         f"agent={self.name} role={self.role}",
-                        response.content,
+                        content,
                         "",
                     ]
                 ),
             )
-        return response.content
+        return content
+
+    def llm_profile(self, config: SwarmConfig) -> LLMProfile | None:
+        """This agent's entry in ``config.agent_llm``, if any."""
+        values = config.agent_llm.get(self.name)
+        return LLMProfile.from_dict(values) if values else None
+
+    async def _stream(self, context: AgentContext, prompt: str) -> str:
+        chunks = context.llm.stream(prompt)
+        if context.config.llm_stop_at_json:
+            chunks = until_json_object(chunks)
+        parts: list[str] = []
+        async for chunk in chunks:
+            context.event_log.log(
+                "llm_chunk",
+                {"agent": self.name, "role": self.role, "index": len(parts), "chunk": chunk},
+            )
+            parts.append(chunk)
+        return "".join(parts)
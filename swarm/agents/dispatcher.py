@@ -35,7 +35,7 @@ class DispatcherAgent(BaseAgent):
             if endpoint:
                 # perform HTTP POST
                 try:
-                    resp = context.http.post(endpoint, sub)
+                    resp = await context.http.apost(endpoint, sub)
                     results[i] = {"endpoint": endpoint, "status": resp.status, "text": resp.text}
                 except Exception as exc:  # defensive
                     results[i] = {"endpoint": endpoint, "error": str(exc)}
@@ -27,7 +27,7 @@ class ResearcherAgent(BaseAgent):
         http_notes = ""
         if context.config.enable_http and not context.dry_run:
             try:
-                search_summary, search_refs, search_error = _fetch_search_results(
+                search_summary, search_refs, search_error = await _fetch_search_results(
                     context.http, context.objective, context.config
                 )
                 if search_refs:
@@ -66,7 +66,7 @@ class ResearcherAgent(BaseAgent):
 
         if context.config.enable_http and not context.dry_run and not search_summary:
             try:
-                summary_text, refs = _fetch_wikipedia_summary(context.http, context.objective)
+                summary_text, refs = await _fetch_wikipedia_summary(context.http, context.objective)
                 references.extend(refs)
                 if summary_text:
                     http_notes = (
@@ -152,7 +152,7 @@ def _slugify(value: str) -> str:
     return cleaned.strip("-")[:64]
 
 
-def _fetch_wikipedia_summary(http: Any, objective: str) -> tuple[str, list[str]]:
+async def _fetch_wikipedia_summary(http: Any, objective: str) -> tuple[str, list[str]]:
     query = objective.strip()
     if not query:
         return "", []
@@ -161,7 +161,7 @@ def _fetch_wikipedia_summary(http: Any, objective: str) -> tuple[str, list[str]]
         + _url_escape(query)
         + "&limit=1&namespace=0&format=json"
     )
-    response = http.get(search_url, timeout=6.0)
+    response = await http.aget(search_url, timeout=6.0)
     try:
         payload = json.loads(response.text)
     except json.JSONDecodeError:
@@ -170,7 +170,7 @@ def _fetch_wikipedia_summary(http: Any, objective: str) -> tuple[str, list[str]]
         return "", [response.url]
     title = str(payload[1][0]).replace(" ", "_")
     summary_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{title}"
-    summary_response = http.get(summary_url, timeout=6.0)
+    summary_response = await http.aget(summary_url, timeout=6.0)
     try:
         summary_payload = json.loads(summary_response.text)
         extract = summary_payload.get("extract") or ""
@@ -179,7 +179,7 @@ def _fetch_wikipedia_summary(http: Any, objective: str) -> tuple[str, list[str]]
     return extract[:500], [response.url, summary_response.url]
 
 
-def _fetch_search_results(
+async def _fetch_search_results(
     http: Any, objective: str, config: Any
 ) -> tuple[str, list[str], str | None]:
     max_queries = _search_max_queries(config)
@@ -194,7 +194,7 @@ def _fetch_search_results(
     grouped_results: list[tuple[str, list[dict[str, Any]]]] = []
     last_error = None
     for query in queries:
-        results, search_error = _run_search_query(http, provider, query, endpoint, api_key)
+        results, search_error = await _run_search_query(http, provider, query, endpoint, api_key)
         if search_error:
             last_error = search_error
             continue
@@ -299,7 +299,7 @@ def _dedupe_queries(queries: list[str]) -> list[str]:
     return output
 
 
-def _run_search_query(
+async def _run_search_query(
     http: Any,
     provider: str,
     query: str,
@@ -307,7 +307,7 @@ def _run_search_query(
     api_key: str | None,
 ) -> tuple[list[dict[str, Any]], str | None]:
     if provider == "duckduckgo":
-        return _duckduckgo_search(http, query)
+        return await _duckduckgo_search(http, query)
     if provider == "searxng":
         if not endpoint:
             return [], "Searxng provider selected but no endpoint configured."
@@ -316,7 +316,7 @@ def _run_search_query(
             url = f"{base}?q={_url_escape(query)}&format=json"
         else:
             url = f"{base}/search?q={_url_escape(query)}&format=json"
-        payload, error = _fetch_json(http, url)
+        payload, error = await _fetch_json(http, url)
         if error:
             return [], error
         items = payload.get("results", []) if isinstance(payload, dict) else []
@@ -338,7 +338,7 @@ def _run_search_query(
             + "&api_key="
             + _url_escape(api_key)
         )
-        payload, error = _fetch_json(http, url)
+        payload, error = await _fetch_json(http, url)
         if error:
             return [], error
         items = payload.get("organic_results", []) if isinstance(payload, dict) else []
@@ -354,7 +354,7 @@ def _run_search_query(
     if provider == "serper":
         if not api_key:
             return [], "SERPER_API_KEY is required for serper."
-        payload, error = _fetch_json(
+        payload, error = await _fetch_json(
             http,
             "https://google.serper.dev/search",
             payload={"q": query},
@@ -376,7 +376,7 @@ def _run_search_query(
         if not api_key:
             return [], "BING_API_KEY is required for bing."
         url = "https://api.bing.microsoft.com/v7.0/search?q=" + _url_escape(query)
-        payload, error = _fetch_json(
+        payload, error = await _fetch_json(
             http, url, headers={"Ocp-Apim-Subscription-Key": api_key}
         )
         if error:
@@ -395,7 +395,7 @@ def _run_search_query(
         if not api_key:
             return [], "BRAVE_API_KEY is required for brave."
         url = "https://api.search.brave.com/res/v1/web/search?q=" + _url_escape(query)
-        payload, error = _fetch_json(
+        payload, error = await _fetch_json(
             http, url, headers={"X-Subscription-Token": api_key}
         )
         if error:
@@ -502,16 +502,16 @@ def _search_max_queries(config: Any) -> int:
     return max(1, min(value, 12))
 
 
-def _fetch_json(
+async def _fetch_json(
     http: Any,
     url: str,
     payload: dict[str, Any] | None = None,
     headers: dict[str, str] | None = None,
 ) -> tuple[dict[str, Any], str | None]:
     if payload is None:
-        response = http.get(url, timeout=8.0, headers=headers)
+        response = await http.aget(url, timeout=8.0, headers=headers)
     else:
-        response = http.post(url, payload, timeout=10.0, headers=headers)
+        response = await http.apost(url, payload, timeout=10.0, headers=headers)
     if response.status < 200 or response.status >= 300:
         detail = response.text.replace("\n", " ").strip()
         detail = detail[:200] + "..." if len(detail) > 200 else detail
@@ -522,13 +522,13 @@ def _fetch_json(
         return {}, f"Invalid JSON from {response.url}: {exc}"
 
 
-def _duckduckgo_search(http: Any, query: str) -> tuple[list[dict[str, str]], str | None]:
+async def _duckduckgo_search(http: Any, query: str) -> tuple[list[dict[str, str]], str | None]:
     headers = {"Accept-Language": "en-US,en;q=0.8"}
     html_url = "https://html.duckduckgo.com/html/?q=" + _url_escape(query)
-    response = http.get(html_url, timeout=8.0, headers=headers)
+    response = await http.aget(html_url, timeout=8.0, headers=headers)
     if response.status < 200 or response.status >= 300:
         lite_url = "https://lite.duckduckgo.com/lite/?q=" + _url_escape(query)
-        response = http.get(lite_url, timeout=8.0, headers=headers)
+        response = await http.aget(lite_url, timeout=8.0, headers=headers)
     if response.status < 200 or response.status >= 300:
         return [], f"HTTP {response.status} from {response.url}"
     results = _duckduckgo_results_from_html(response.text)
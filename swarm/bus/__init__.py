@@ -1,3 +1,4 @@
 from .event_log import EventLog, Event
+from .subscriptions import EventHub, Subscription, SubscriptionClosed
 
-__all__ = ["EventLog", "Event"]
+__all__ = ["EventLog", "Event", "EventHub", "Subscription", "SubscriptionClosed"]
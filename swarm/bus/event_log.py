@@ -1,29 +1,225 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import time
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator
 
+from swarm.bus.subscriptions import EventHub, Subscription
 
-@dataclass(slots=True)
+# Wall-clock anchor for monotonic event timestamps, captured once per process.
+_WALL_ANCHOR_NS = time.time_ns()
+_MONO_ANCHOR_NS = time.monotonic_ns()
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Strings at least this long are written once per spill segment and referenced by digest.
+LARGE_TEXT_BYTES = 1024
+
+_EVENT_TYPES: list[str] = []
+_EVENT_CODES: dict[str, int] = {}
+
+
+def event_code(event_type: str) -> int:
+    """Return the interned integer code for ``event_type``, registering it on first use."""
+    code = _EVENT_CODES.get(event_type)
+    if code is None:
+        code = len(_EVENT_TYPES)
+        _EVENT_TYPES.append(event_type)
+        _EVENT_CODES[event_type] = code
+    return code
+
+
+@dataclass(slots=True, init=False)
 class Event:
-    timestamp: datetime
-    event_type: str
+    """One logged event: a monotonic timestamp, an interned type code and the caller's payload.
+
+    The payload is stored by reference, never copied. ``timestamp`` and
+    ``event_type`` are derived on access so logging stays allocation-light.
+    The earlier form, ``Event(timestamp=..., event_type=..., payload=...)``,
+    still works.
+    """
+
+    ts_ns: int
+    code: int
     payload: dict[str, Any]
+    run_id: str | None
+
+    def __init__(
+        self,
+        ts_ns: int | None = None,
+        code: int | None = None,
+        payload: dict[str, Any] | None = None,
+        run_id: str | None = None,
+        *,
+        timestamp: datetime | None = None,
+        event_type: str | None = None,
+    ) -> None:
+        if timestamp is not None:
+            ts_ns = _MONO_ANCHOR_NS + (timestamp - _EPOCH) // timedelta(microseconds=1) * 1000 - _WALL_ANCHOR_NS
+        if event_type is not None:
+            code = event_code(event_type)
+        if ts_ns is None or code is None or payload is None:
+            raise TypeError("Event needs ts_ns (or timestamp), code (or event_type) and payload")
+        self.ts_ns = ts_ns
+        self.code = code
+        self.payload = payload
+        self.run_id = run_id
+
+    @property
+    def event_type(self) -> str:
+        return _EVENT_TYPES[self.code]
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.wall_ns / 1e9, tz=timezone.utc)
+
+    @property
+    def wall_ns(self) -> int:
+        return _WALL_ANCHOR_NS + (self.ts_ns - _MONO_ANCHOR_NS)
 
 
 class EventLog:
-    def __init__(self) -> None:
-        self._events: list[Event] = []
+    """Append-only event log with a bounded in-memory ring buffer.
+
+    With ``max_events`` set, only the newest events stay in memory. Older ones
+    are appended to ``spill_path`` as JSON lines (or dropped when no path is
+    given). ``list_events`` returns the in-memory tail; iterating the log
+    yields every event, spilled ones first. With ``append`` (a resumed run),
+    events already in ``spill_path`` are kept and count as spilled.
+
+    Every event is also published to ``hub`` so async subscribers can stream
+    it as it happens; several run logs may share one hub.
+    """
+
+    def __init__(
+        self,
+        max_events: int | None = None,
+        spill_path: Path | None = None,
+        run_id: str | None = None,
+        hub: EventHub | None = None,
+        append: bool = False,
+    ) -> None:
+        if max_events is not None and max_events < 1:
+            raise ValueError("max_events must be >= 1")
+        self._events: deque[Event] = deque()
+        self._max_events = max_events
+        self._spill_path = spill_path
+        self._spill_handle: IO[str] | None = None
+        self._spilled_texts: set[str] = set()
+        self.run_id = run_id
+        self.hub = hub or EventHub()
+        self.spilled = 0
+        self.dropped = 0
+        if append and spill_path is not None and spill_path.exists():
+            self._adopt_spill(spill_path)
+
+    @property
+    def spill_path(self) -> Path | None:
+        return self._spill_path if self.spilled else None
 
     def log(self, event_type: str, payload: dict[str, Any]) -> None:
-        self._events.append(
-            Event(
-                timestamp=datetime.now(timezone.utc),
-                event_type=event_type,
-                payload=payload,
-            )
-        )
+        if self._max_events is not None and len(self._events) >= self._max_events:
+            self._evict(self._events.popleft())
+        code = _EVENT_CODES.get(event_type)
+        if code is None:
+            code = event_code(event_type)
+        event = Event(time.monotonic_ns(), code, payload, self.run_id)
+        self._events.append(event)
+        self.hub.publish(event)
+
+    def subscribe(
+        self,
+        event_types: Iterable[str] | None = None,
+        max_queue: int = 1000,
+        policy: str = "drop_oldest",
+    ) -> Subscription:
+        return self.hub.subscribe(event_types, self.run_id, max_queue, policy)
 
     def list_events(self) -> list[Event]:
         return list(self._events)
+
+    def __iter__(self) -> Iterator[Event]:
+        if self.spilled and self._spill_path is not None:
+            if self._spill_handle is not None:
+                self._spill_handle.flush()
+            texts: dict[str, str] = {}
+            with self._spill_path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    record = json.loads(line)
+                    if "text" in record:
+                        texts[record["text"]] = record["value"]
+                    else:
+                        yield _decode(record, texts)
+        yield from list(self._events)
+
+    def __len__(self) -> int:
+        return self.spilled + self.dropped + len(self._events)
+
+    def close(self) -> None:
+        if self._spill_handle is not None:
+            self._spill_handle.close()
+            self._spill_handle = None
+
+    def _evict(self, event: Event) -> None:
+        if self._spill_path is None:
+            self.dropped += 1
+            return
+        if self._spill_handle is None:
+            self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+            mode = "a" if self.spilled else "w"
+            self._spill_handle = self._spill_path.open(mode, encoding="utf-8")
+        self._spill_handle.write(self._encode(event))
+        self.spilled += 1
+
+    def _adopt_spill(self, path: Path) -> None:
+        """Count the events an earlier run spilled and remember the texts it already wrote."""
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                record = json.loads(line)
+                if "text" in record:
+                    self._spilled_texts.add(record["text"])
+                else:
+                    self.spilled += 1
+
+    def _encode(self, event: Event) -> str:
+        """One JSON line per event; a large string is left as null in ``payload`` and named in ``texts``."""
+        lines: list[str] = []
+        payload: dict[str, Any] = {}
+        refs: dict[str, str] = {}
+        for key, value in event.payload.items():
+            if isinstance(value, str) and len(value) >= LARGE_TEXT_BYTES:
+                digest = hashlib.sha1(value.encode("utf-8")).hexdigest()
+                if digest not in self._spilled_texts:
+                    self._spilled_texts.add(digest)
+                    lines.append(json.dumps({"text": digest, "value": value}))
+                refs[key] = digest
+                payload[key] = None
+            else:
+                payload[key] = value
+        record: dict[str, Any] = {
+            "wall_ns": event.wall_ns,
+            "event_type": event.event_type,
+            "payload": payload,
+            "run_id": event.run_id,
+        }
+        if refs:
+            record["texts"] = refs
+        lines.append(json.dumps(record, default=str))
+        return "\n".join(lines) + "\n"
+
+
+def _decode(record: dict[str, Any], texts: dict[str, str]) -> Event:
+    payload = record["payload"]
+    refs = record.get("texts")
+    if refs:
+        payload = {key: texts[refs[key]] if key in refs else value for key, value in payload.items()}
+    return Event(
+        ts_ns=record["wall_ns"] - _WALL_ANCHOR_NS + _MONO_ANCHOR_NS,
+        code=event_code(record["event_type"]),
+        payload=payload,
+        run_id=record.get("run_id"),
+    )
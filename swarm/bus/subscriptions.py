@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from swarm.bus.event_log import Event
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "disconnect")
+
+
+class SubscriptionClosed(Exception):
+    """Raised by Subscription.get() once the subscription is closed and drained."""
+
+
+class Subscription:
+    """Bounded, filtered stream of events delivered by an EventHub.
+
+    When the queue is full, ``policy`` decides what happens to a new event:
+    ``drop_oldest`` discards the oldest queued event, ``drop_newest`` discards
+    the new one, and ``disconnect`` closes the subscription so a slow consumer
+    learns it missed events instead of silently skipping them.
+    """
+
+    def __init__(
+        self,
+        hub: "EventHub",
+        event_types: Iterable[str] | None,
+        run_id: str | None,
+        max_queue: int,
+        policy: str,
+    ) -> None:
+        if max_queue < 1:
+            raise ValueError("max_queue must be >= 1")
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        self._hub = hub
+        self._event_types = frozenset(event_types) if event_types is not None else None
+        self._run_id = run_id
+        self._max_queue = max_queue
+        self._policy = policy
+        self._queue: deque[Event] = deque()
+        self._waiter: asyncio.Future[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.closed = False
+        self.overflowed = False
+        self.delivered = 0
+        self.dropped = 0
+
+    def matches(self, event: "Event") -> bool:
+        if self._event_types is not None and event.event_type not in self._event_types:
+            return False
+        return self._run_id is None or event.run_id == self._run_id
+
+    def offer(self, event: "Event") -> None:
+        if self.closed:
+            return
+        if len(self._queue) >= self._max_queue:
+            self.dropped += 1
+            if self._policy == "drop_newest":
+                return
+            if self._policy == "disconnect":
+                self.overflowed = True
+                self.close()
+                return
+            self._queue.popleft()
+        self._queue.append(event)
+        self._wake()
+
+    def get_nowait(self) -> "Event | None":
+        if self._queue:
+            self.delivered += 1
+            return self._queue.popleft()
+        return None
+
+    async def get(self) -> "Event":
+        while True:
+            event = self.get_nowait()
+            if event is not None:
+                return event
+            if self.closed:
+                raise SubscriptionClosed()
+            self._loop = asyncio.get_running_loop()
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._hub.unsubscribe(self)
+        self._wake()
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> "Event":
+        try:
+            return await self.get()
+        except SubscriptionClosed:
+            raise StopAsyncIteration from None
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def _wake(self) -> None:
+        waiter = self._waiter
+        if waiter is None or waiter.done() or self._loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            waiter.set_result(None)
+        else:
+            self._loop.call_soon_threadsafe(_resolve, waiter)
+
+
+class EventHub:
+    """Fan-out point shared by the EventLogs of many runs."""
+
+    def __init__(self) -> None:
+        self._subscriptions: list[Subscription] = []
+
+    def subscribe(
+        self,
+        event_types: Iterable[str] | None = None,
+        run_id: str | None = None,
+        max_queue: int = 1000,
+        policy: str = "drop_oldest",
+    ) -> Subscription:
+        subscription = Subscription(self, event_types, run_id, max_queue, policy)
+        self._subscriptions = [*self._subscriptions, subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions = [item for item in self._subscriptions if item is not subscription]
+
+    def publish(self, event: "Event") -> None:
+        for subscription in self._subscriptions:
+            if subscription.matches(event):
+                subscription.offer(event)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def close(self) -> None:
+        for subscription in list(self._subscriptions):
+            subscription.close()
+
+
+def _resolve(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Sequence
 
 
 @dataclass(slots=True)
@@ -16,16 +16,50 @@ class SwarmConfig:
     enable_http: bool = False
     llm_provider: str = "mock"
     ollama_url: str = "http://localhost:11434"
+    ollama_urls: list[str] = field(default_factory=list)
+    llm_route_strategy: str = "least_outstanding"
+    llm_route_pin_runs: bool = False
     ollama_endpoint: str = "/api/generate"
     log_llm: bool = False
     ollama_timeout: int = 120
     ollama_retries: int = 1
     ollama_model: str = "llama3.1"
+    ollama_pool_size: int = 8
+    ollama_backoff: float = 0.5
+    ollama_backoff_max: float = 10.0
+    ollama_adaptive_timeout: bool = True
+    ollama_breaker_threshold: int = 5
+    ollama_breaker_reset: float = 10.0
+    ollama_chat_sessions: bool = False
+    openai_url: str = "http://localhost:8000"
+    openai_model: str = "default"
+    openai_api_key: str | None = None
+    openai_pool_size: int = 32
+    llm_stream: bool = False
+    llm_stop_at_json: bool = False
+    simulated_llm: dict[str, Any] = field(default_factory=dict)
+    agent_llm: dict[str, dict[str, Any]] = field(default_factory=dict)
     search_provider: str | None = None
     search_endpoint: str | None = None
     search_api_key: str | None = None
     search_max_results: int = 5
     search_max_queries: int = 6
+    event_buffer_size: int | None = 10_000
+    trace: bool = False
+    llm_coalesce: bool = True
+    llm_adaptive_limit: bool = True
+    llm_limit_initial: int = 4
+    llm_limit_max: int = 64
+    llm_hedge: bool = False
+    llm_hedge_percentile: float = 0.95
+    llm_hedge_budget: float = 0.1
+    llm_cache: bool = False
+    llm_cache_max_entries: int = 5000
+    llm_cache_ttl: int | None = None
+    step_cache: bool = True
+    step_cache_max_entries: int = 1000
+    step_cache_ttl: int | None = 7 * 24 * 3600
+    agent_concurrency: dict[str, int] = field(default_factory=dict)
     shell_allowlist: Sequence[str] = field(default_factory=lambda: ["ls", "rg", "cat"])
     filesystem_allowlist: Sequence[Path] = field(default_factory=list)
 
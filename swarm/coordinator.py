@@ -1,29 +1,25 @@
 from __future__ import annotations
 
-import asyncio
+import base64
+import hashlib
 import json
 import re
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Awaitable, Callable, TYPE_CHECKING
-
-from swarm.agents import (
-    AgentContext,
-    BaseAgent,
-    CoderAgent,
-    CriticAgent,
-    DispatcherAgent,
-    PlannerAgent,
-    ResearcherAgent,
-)
-from swarm.agents.instructions import load_agent_instructions
+from typing import Any, Awaitable, Callable, Coroutine, TYPE_CHECKING
+
+from swarm import tracing
+from swarm.agents import AgentContext, BaseAgent
 from swarm.bus import EventLog
 from swarm.config import SwarmConfig
-from swarm.llm import LLM, MockLLM, OllamaLLM
-from swarm.memory import PersistentMemory, ShortTermMemory
-from swarm.tools import FilesystemTool, HttpTool, ShellTool
+from swarm.llm import LLM, run_scope
+from swarm.memory import ShortTermMemory
+from swarm.runtime import SwarmRuntime, llm_identity
+from swarm.scheduler import PlanError, StepGraph, StepScheduler
+from swarm.tracing import Tracer
 
 if TYPE_CHECKING:
     from swarm.runner import RunResult, RunSpec
@@ -46,44 +42,27 @@ class Coordinator:
         config: SwarmConfig,
         llm: LLM | None = None,
         spawner: Spawner | None = None,
+        runtime: SwarmRuntime | None = None,
     ) -> None:
         self.config = config
+        self._owns_runtime = runtime is None
+        self.runtime = runtime or SwarmRuntime(config, llm=llm)
         self.event_log = EventLog()
         self.short_term = ShortTermMemory()
-        self.persistent = PersistentMemory(config.db_path)
-        self.filesystem = FilesystemTool(list(config.filesystem_allowlist))
-        self.shell = ShellTool(list(config.shell_allowlist))
-        self.http = HttpTool()
-        self.llm = llm or self._build_llm()
+        self.persistent = self.runtime.persistent
+        self.filesystem = self.runtime.filesystem
+        self.shell = self.runtime.shell
+        self.http = self.runtime.http
+        # A runtime built here already wraps ``llm`` (e.g. in the response cache).
+        self.llm = llm if llm is not None and runtime is not None else self.runtime.llm
+        self._llm_identity = llm_identity(config, llm) if llm is not None else self.runtime.llm_identity
+        self.step_cache = self.runtime.step_cache
         self.spawner = spawner
-        self.agents: dict[str, BaseAgent] = {
-            "researcher": ResearcherAgent(
-                instructions=load_agent_instructions(self.config.repo_root, "researcher")
-            ),
-            "planner": PlannerAgent(
-                instructions=load_agent_instructions(self.config.repo_root, "planner")
-            ),
-            "coder": CoderAgent(
-                instructions=load_agent_instructions(self.config.repo_root, "coder")
-            ),
-            "dispatcher": DispatcherAgent(
-                instructions=load_agent_instructions(self.config.repo_root, "dispatcher")
-            ),
-            "critic": CriticAgent(
-                instructions=load_agent_instructions(self.config.repo_root, "critic")
-            ),
-        }
+        self.agents: dict[str, BaseAgent] = self.runtime.agents
 
-    def _build_llm(self) -> LLM:
-        if self.config.llm_provider == "ollama":
-            return OllamaLLM(
-                model=self.config.ollama_model,
-                base_url=self.config.ollama_url,
-                endpoint=self.config.ollama_endpoint,
-                timeout=self.config.ollama_timeout,
-                retries=self.config.ollama_retries,
-            )
-        return MockLLM(seed=self.config.seed)
+    def close(self) -> None:
+        if self._owns_runtime:
+            self.runtime.close()
 
     def _context(
         self, run_id: str, objective: str, output_dir: Path, dry_run: bool, verbose: bool
@@ -115,14 +94,34 @@ class Coordinator:
         verbose: bool = False,
     ) -> dict[str, Any]:
         run_id = run_id or uuid.uuid4().hex
+        return await self._traced(
+            run_id, "run", self._run(objective, run_id, output_dir, max_steps, dry_run, verbose)
+        )
+
+    async def _run(
+        self,
+        objective: str,
+        run_id: str,
+        output_dir: str | Path | None,
+        max_steps: int | None,
+        dry_run: bool,
+        verbose: bool,
+    ) -> dict[str, Any]:
         resolved_output = self._resolve_output_dir(objective, run_id, output_dir)
         created_at = datetime.now(timezone.utc).isoformat()
+        self.event_log = self._new_event_log(run_id)
         self.persistent.put_run(run_id, objective, created_at)
         self.event_log.log("run_started", {"run_id": run_id, "objective": objective})
 
         context = self._context(run_id, objective, resolved_output, dry_run, verbose)
         planner = self.agents["planner"]
-        plan_output = await planner.run(objective, context)
+        plan_key = self._step_cache_key("plan", planner.name, objective, context, [])
+        cached_plan = self._replay_cached(plan_key, context, "plan")
+        if cached_plan is not None:
+            plan_output = cached_plan["output"]
+        else:
+            plan_output = await planner.run(objective, context)
+            self._store_cached(plan_key, context, [planner.name], plan_output, None)
         plan_payload = plan_output.get("plan", {})
         if isinstance(plan_payload, dict) and "plan" in plan_payload:
             plan = plan_payload.get("plan", {})
@@ -130,45 +129,239 @@ class Coordinator:
             plan = plan_payload if isinstance(plan_payload, dict) else {}
         self.event_log.log("plan_created", {"run_id": run_id, "plan": plan})
         self.persistent.put_message(run_id, planner.name, planner.role, json.dumps(plan_payload), created_at)
+        self.persistent.put_checkpoint(
+            run_id,
+            json.dumps(plan),
+            str(resolved_output),
+            json.dumps(self.short_term.snapshot(run_id), default=str),
+            created_at,
+        )
+        return await self._execute_plan(context, plan, max_steps, {})
+
+    async def resume(
+        self,
+        run_id: str,
+        output_dir: str | Path | None = None,
+        max_steps: int | None = None,
+        dry_run: bool = False,
+        verbose: bool = False,
+    ) -> dict[str, Any]:
+        """Continue an interrupted run, executing only the steps without a stored result."""
+        return await self._traced(
+            run_id, "resume", self._resume(run_id, output_dir, max_steps, dry_run, verbose)
+        )
 
-        steps = plan.get("steps", [])
+    async def _resume(
+        self,
+        run_id: str,
+        output_dir: str | Path | None,
+        max_steps: int | None,
+        dry_run: bool,
+        verbose: bool,
+    ) -> dict[str, Any]:
+        run = self.persistent.get_run(run_id)
+        if run is None:
+            raise ValueError(f"Unknown run_id: {run_id}")
+        objective = run["objective"]
+        checkpoint = self.persistent.get_checkpoint(run_id)
+        if checkpoint is None:
+            return await self._run(objective, run_id, output_dir, max_steps, dry_run, verbose)
+
+        resolved_output = (
+            self._resolve_output_dir(objective, run_id, output_dir)
+            if output_dir is not None
+            else Path(checkpoint["output_dir"])
+        )
+        self.event_log = self._new_event_log(run_id, resume=True)
+        self.short_term.restore(run_id, json.loads(checkpoint["short_term"]))
+        completed = {
+            json.loads(row["step_id"]): StepResult(
+                step_id=json.loads(row["step_id"]),
+                agent=row["agent"],
+                task=row["task"],
+                output=json.loads(row["output"]),
+                critic=json.loads(row["critic"]) if row["critic"] is not None else None,
+            )
+            for row in self.persistent.list_step_results(run_id)
+        }
+        self.event_log.log(
+            "run_resumed",
+            {"run_id": run_id, "objective": objective, "completed_steps": sorted(completed, key=str)},
+        )
+        context = self._context(run_id, objective, resolved_output, dry_run, verbose)
+        return await self._execute_plan(context, json.loads(checkpoint["plan"]), max_steps, completed)
+
+    async def _traced(
+        self, run_id: str, name: str, job: Coroutine[Any, Any, dict[str, Any]]
+    ) -> dict[str, Any]:
+        try:
+            with run_scope(run_id):
+                if not self.config.trace:
+                    return await job
+                tracer = Tracer(run_id)
+                token = tracing.activate(tracer)
+                try:
+                    with tracer.span(name, run_id=run_id):
+                        result = await job
+                finally:
+                    tracing.deactivate(token)
+                    trace_path = tracer.export_chrome(
+                        self.config.artifacts_dir / "traces" / f"{run_id}.trace.json"
+                    )
+        finally:
+            if self.runtime.llm_sessions is not None:
+                # Also drops the sessions of a run that failed before logging its counts.
+                self.runtime.llm_sessions.forget(run_id)
+        result["trace_path"] = str(trace_path)
+        return result
+
+    async def _execute_plan(
+        self,
+        context: AgentContext,
+        plan: dict[str, Any],
+        max_steps: int | None,
+        completed: dict[Any, StepResult],
+    ) -> dict[str, Any]:
+        run_id = context.run_id
         limit = max_steps or self.config.max_steps
-        steps = steps[:limit]
-        steps = [step for step in steps if step.get("agent") != "critic"]
-        pending = {step["id"]: step for step in steps}
-        completed: dict[int, StepResult] = {}
-
-        while pending:
-            ready = [
-                step
-                for step in pending.values()
-                if all(dep in completed for dep in step.get("depends_on", []))
-            ]
-            if not ready:
-                break
-            tasks = [self._run_step(step, context) for step in ready]
-            results = await asyncio.gather(*tasks)
-            for result in results:
-                completed[result.step_id] = result
-                pending.pop(result.step_id, None)
+        try:
+            graph = StepGraph.from_plan(plan.get("steps", []), limit=limit, exclude_agents=("critic",))
+        except PlanError as exc:
+            self.event_log.log("plan_rejected", {"run_id": run_id, "error": str(exc)})
+            raise
+        for step_id in graph.skipped:
+            self.event_log.log(
+                "step_skipped",
+                {"step_id": step_id, "reason": "dependency outside max_steps"},
+            )
 
+        scheduler = StepScheduler(
+            graph,
+            priorities=graph.critical_path_weights(self.persistent.agent_durations()),
+            agent_limits=self._agent_limits(),
+        )
+        results = dict(completed)
+
+        async def run_step(step: dict[str, Any]) -> StepResult:
+            upstream = [results[dep] for dep in graph.dependencies[step["id"]]]
+            with tracing.span("step", step_id=step["id"], agent=step.get("agent")):
+                result = await self._run_step(step, context, upstream=upstream)
+            results[step["id"]] = result
+            return result
+
+        completed = await scheduler.run(
+            run_step,
+            completed={key: value for key, value in completed.items() if key in graph.steps},
+        )
+
+        if self.step_cache is not None:
+            self.event_log.log("step_cache_stats", {"run_id": run_id, **self.step_cache.stats.as_dict()})
+        if self.runtime.llm_cache is not None:
+            self.event_log.log(
+                "llm_cache_stats", {"run_id": run_id, **self.runtime.llm_cache.stats.as_dict()}
+            )
+        if self.runtime.llm_coalescer is not None:
+            self.event_log.log(
+                "llm_coalesce_stats",
+                {"run_id": run_id, **self.runtime.llm_coalescer.stats.as_dict()},
+            )
+        if self.runtime.llm_router is not None:
+            self.event_log.log(
+                "llm_route_stats", {"run_id": run_id, "routes": self.runtime.llm_router.route_stats()}
+            )
+        if self.runtime.llm_hedger is not None:
+            self.event_log.log(
+                "llm_hedge_stats", {"run_id": run_id, **self.runtime.llm_hedger.stats.as_dict()}
+            )
+        if self.runtime.llm_limiter is not None:
+            self.event_log.log(
+                "llm_limiter_stats", {"run_id": run_id, **self.runtime.llm_limiter.snapshot()}
+            )
+        if self.runtime.llm_sessions is not None:
+            self.event_log.log(
+                "llm_prefill_stats",
+                {
+                    "run_id": run_id,
+                    "chat_sessions": self.runtime.llm_sessions.resume,
+                    **self.runtime.llm_sessions.forget(run_id).as_dict(),
+                },
+            )
         final_text = self._compose_final_output(completed)
         self.event_log.log("run_completed", {"run_id": run_id, "final": final_text})
+        self.event_log.close()
+        spill_path = self.event_log.spill_path
         return {
             "run_id": run_id,
-            "objective": objective,
+            "objective": context.objective,
             "final": final_text,
-            "output_dir": str(resolved_output),
+            "output_dir": str(context.output_dir),
             "events": self.event_log.list_events(),
+            "events_total": len(self.event_log),
+            "events_path": str(spill_path) if spill_path is not None else None,
         }
 
-    async def _run_step(self, step: dict[str, Any], context: AgentContext) -> StepResult:
+    def _new_event_log(self, run_id: str, resume: bool = False) -> EventLog:
+        return EventLog(
+            max_events=self.config.event_buffer_size,
+            spill_path=self.config.artifacts_dir / "events" / f"{run_id}.jsonl",
+            run_id=run_id,
+            hub=self.runtime.event_hub,
+            append=resume,
+        )
+
+    def _agent_limits(self) -> dict[str, int]:
+        limits = dict(self.config.agent_concurrency)
+        unknown = sorted(set(limits) - set(self.agents))
+        if unknown:
+            raise ValueError(f"Concurrency limits set for unknown agents: {', '.join(unknown)}")
+        return limits
+
+    async def _run_step(
+        self,
+        step: dict[str, Any],
+        context: AgentContext,
+        upstream: list[StepResult] | None = None,
+    ) -> StepResult:
         agent_name = step.get("agent", "")
         task = step.get("task", "")
         agent = self.agents.get(agent_name)
         if agent is None:
             raise ValueError(f"Unknown agent: {agent_name}")
         self.event_log.log("step_started", {"step_id": step.get("id"), "agent": agent_name})
+        started = time.perf_counter()
+        cache_key = self._step_cache_key(step.get("id"), agent_name, task, context, upstream or [])
+        cached = self._replay_cached(cache_key, context, step.get("id"))
+        if cached is not None:
+            output, critic_result = cached["output"], cached["critic"]
+            created_at = datetime.now(timezone.utc).isoformat()
+            self.persistent.put_message(context.run_id, agent.name, agent.role, json.dumps(output), created_at)
+            self.event_log.log(
+                "step_completed", {"step_id": step.get("id"), "agent": agent_name, "cached": True}
+            )
+        else:
+            output, critic_result = await self._execute_step(step, agent, task, context)
+            self._store_cached(cache_key, context, [agent_name], output, critic_result)
+            self.persistent.put_step_timing(
+                context.run_id,
+                str(step.get("id")),
+                agent_name,
+                time.perf_counter() - started,
+                datetime.now(timezone.utc).isoformat(),
+            )
+        result = StepResult(
+            step_id=step.get("id", 0),
+            agent=agent_name,
+            task=task,
+            output=output,
+            critic=critic_result,
+        )
+        self._checkpoint_step(context.run_id, result, datetime.now(timezone.utc).isoformat())
+        return result
+
+    async def _execute_step(
+        self, step: dict[str, Any], agent: BaseAgent, task: str, context: AgentContext
+    ) -> tuple[dict[str, Any], dict[str, Any] | None]:
+        agent_name = agent.name
         output = await agent.run(task, context)
         created_at = datetime.now(timezone.utc).isoformat()
         self.persistent.put_message(context.run_id, agent.name, agent.role, json.dumps(output), created_at)
@@ -200,12 +393,115 @@ class Coordinator:
                     "critic_review",
                     {"step_id": step.get("id"), "approved": critic_result.get("approved")},
                 )
-        return StepResult(
-            step_id=step.get("id", 0),
-            agent=agent_name,
-            task=task,
-            output=output,
-            critic=critic_result,
+        return output, critic_result
+
+    def _step_cache_key(
+        self,
+        step_id: Any,
+        agent_name: str,
+        task: str,
+        context: AgentContext,
+        upstream: list[StepResult],
+    ) -> str:
+        upstream_hash = hashlib.sha256(
+            json.dumps(
+                [[item.step_id, item.agent, item.output] for item in upstream],
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+        material = {
+            "step_id": step_id,
+            "agent": agent_name,
+            "task": task,
+            "objective": context.objective,
+            "upstream": upstream_hash,
+            "llm": self._llm_identity,
+            "stop_at_json": self.config.llm_stop_at_json,
+            "dry_run": context.dry_run,
+            "http": [
+                self.config.enable_http,
+                self.config.search_provider,
+                self.config.search_endpoint,
+                self.config.search_max_results,
+                self.config.search_max_queries,
+            ],
+            "instructions": self._instructions_hash(step_id, agent_name),
+        }
+        if self.config.agent_llm:
+            material["agent_llm"] = self.config.agent_llm
+        return hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _instructions_hash(self, step_id: Any, agent_name: str) -> str:
+        names = [agent_name]
+        # Plan steps other than the critic's own carry the critic's review in their cached result.
+        if step_id != "plan" and agent_name != "critic":
+            names.append("critic")
+        instructions = [self.agents[name].instructions for name in names if name in self.agents]
+        return hashlib.sha256(json.dumps(instructions).encode("utf-8")).hexdigest()
+
+    def _replay_cached(self, key: str, context: AgentContext, step_id: Any) -> dict[str, Any] | None:
+        if self.step_cache is None:
+            return None
+        raw = self.step_cache.get(key)
+        if raw is None:
+            self.event_log.log("step_cache_miss", {"step_id": step_id})
+            return None
+        entry = json.loads(raw)
+        old_dir = entry["output_dir"]
+        new_dir = str(context.output_dir)
+        if not context.dry_run:
+            for relative, encoded in entry["files"].items():
+                context.filesystem.write_bytes(context.output_dir / relative, base64.b64decode(encoded))
+        self.short_term.restore(context.run_id, entry["short_term"])
+        self.event_log.log("step_cache_hit", {"step_id": step_id, "files": len(entry["files"])})
+        return {
+            "output": _relocate(entry["output"], old_dir, new_dir),
+            "critic": _relocate(entry["critic"], old_dir, new_dir),
+        }
+
+    def _store_cached(
+        self,
+        key: str,
+        context: AgentContext,
+        agent_names: list[str],
+        output: dict[str, Any],
+        critic_result: dict[str, Any] | None,
+    ) -> None:
+        if self.step_cache is None:
+            return
+        files: dict[str, str] = {}
+        if not context.dry_run:
+            for payload in (output, critic_result or {}):
+                for name in payload.get("files", []) or []:
+                    path = Path(str(name))
+                    if context.output_dir.resolve() not in path.resolve().parents or not path.is_file():
+                        continue
+                    relative = str(path.resolve().relative_to(context.output_dir.resolve()))
+                    files[relative] = base64.b64encode(path.read_bytes()).decode("ascii")
+        entry = {
+            "output": output,
+            "critic": critic_result,
+            "output_dir": str(context.output_dir),
+            "files": files,
+            "short_term": {
+                name: self.short_term.list(context.run_id, name) for name in agent_names
+            },
+        }
+        self.step_cache.put(key, json.dumps(entry, default=str))
+
+    def _checkpoint_step(self, run_id: str, result: StepResult, created_at: str) -> None:
+        self.persistent.put_step_result(
+            run_id,
+            json.dumps(result.step_id),
+            result.agent,
+            result.task,
+            json.dumps(result.output),
+            json.dumps(result.critic) if result.critic is not None else None,
+            created_at,
+        )
+        self.persistent.update_checkpoint_state(
+            run_id, json.dumps(self.short_term.snapshot(run_id), default=str), created_at
         )
 
     def _compose_final_output(self, results: dict[int, StepResult]) -> str:
@@ -240,3 +536,13 @@ def _slugify(value: str) -> str:
         return ""
     cleaned = re.sub(r"[^a-z0-9]+", "-", lowered)
     return cleaned.strip("-")[:64]
+
+
+def _relocate(value: Any, old_prefix: str, new_prefix: str) -> Any:
+    if isinstance(value, str):
+        return new_prefix + value[len(old_prefix):] if value.startswith(old_prefix) else value
+    if isinstance(value, list):
+        return [_relocate(item, old_prefix, new_prefix) for item in value]
+    if isinstance(value, dict):
+        return {key: _relocate(item, old_prefix, new_prefix) for key, item in value.items()}
+    return value
@@ -0,0 +1,52 @@
+from .base import LLM, LLMResponse
+from .caching import CachingLLM
+from .coalescing import CoalesceStats, CoalescingLLM
+from .context import agent_scope, current_agent, current_profile, current_run_id, profile_scope, run_scope
+from .hedging import HedgedLLM, HedgeStats
+from .limiter import AimdLimiter, LimitedLLM, LimiterStats, shared_limiter
+from .mock import MockLLM
+from .ollama import OllamaLLM
+from .openai_compat import OpenAICompatibleLLM
+from .profile import LLMProfile
+from .remote import RemoteLLM
+from .router import RouteStats, RouterLLM
+from .sessions import ChatSessions, PrefillStats
+from .simulated import LatencyProfile, SimulatedLLM, SimulatedStats
+from .streaming import JsonObjectScanner, until_json_object
+from .stub_server import OllamaStubServer, StubStats
+
+__all__ = [
+    "LLM",
+    "LLMResponse",
+    "CachingLLM",
+    "CoalescingLLM",
+    "CoalesceStats",
+    "HedgedLLM",
+    "HedgeStats",
+    "AimdLimiter",
+    "LimitedLLM",
+    "LimiterStats",
+    "shared_limiter",
+    "MockLLM",
+    "OllamaLLM",
+    "OpenAICompatibleLLM",
+    "RemoteLLM",
+    "LLMProfile",
+    "current_profile",
+    "profile_scope",
+    "RouteStats",
+    "RouterLLM",
+    "ChatSessions",
+    "PrefillStats",
+    "agent_scope",
+    "current_agent",
+    "current_run_id",
+    "run_scope",
+    "LatencyProfile",
+    "SimulatedLLM",
+    "SimulatedStats",
+    "JsonObjectScanner",
+    "until_json_object",
+    "OllamaStubServer",
+    "StubStats",
+]
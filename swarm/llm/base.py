@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+
+@dataclass(slots=True)
+class LLMResponse:
+    content: str
+
+
+class LLM:
+    async def complete(self, prompt: str) -> LLMResponse:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        """Yield the response text as it is generated.
+
+        Backends without incremental output yield the whole completion as one chunk.
+        """
+        response = await self.complete(prompt)
+        yield response.content
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, AsyncGenerator, AsyncIterator
+
+from swarm.llm.base import LLM, LLMResponse
+from swarm.llm.context import current_profile
+from swarm.llm.streaming import JsonObjectScanner
+from swarm.memory import CacheStats, SqliteCache
+
+
+class CachingLLM(LLM):
+    """Memoizes completions of ``inner`` in a :class:`SqliteCache`.
+
+    Keys hash ``identity`` (provider, model and generation options) and the
+    calling agent's :class:`LLMProfile` together with the prompt, so changing
+    any of them misses. Streams are stored when the caller reads them to the
+    end, or closes them after a complete top-level JSON object (as
+    ``--stop-at-json`` does), in which case the text up to the end of that
+    object is stored. A cache hit streams as one chunk.
+    """
+
+    def __init__(self, inner: LLM, cache: SqliteCache, identity: dict[str, Any]) -> None:
+        self.inner = inner
+        self.cache = cache
+        self._identity = json.dumps(identity, sort_keys=True, default=str)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    def key(self, prompt: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(self._identity.encode("utf-8"))
+        digest.update(b"\0")
+        profile = current_profile()
+        if profile is not None:
+            digest.update(json.dumps(profile.as_dict(), sort_keys=True).encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        key = self.key(prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return LLMResponse(content=cached)
+        response = await self.inner.complete(prompt)
+        self.cache.put(key, response.content)
+        return response
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        key = self.key(prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+        parts: list[str] = []
+        scanner = JsonObjectScanner()
+        received = 0
+        object_end: int | None = None
+        chunks: AsyncGenerator[str, None] = self.inner.stream(prompt)  # type: ignore[assignment]
+        try:
+            async for chunk in chunks:
+                parts.append(chunk)
+                if object_end is None:
+                    end = scanner.feed(chunk)
+                    if end is not None:
+                        object_end = received + end
+                received += len(chunk)
+                yield chunk
+        except GeneratorExit:
+            if object_end is not None:
+                self.cache.put(key, "".join(parts)[:object_end])
+            raise
+        finally:
+            await chunks.aclose()
+        self.cache.put(key, "".join(parts))
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+from swarm.llm.base import LLM, LLMResponse
+from swarm.llm.context import current_profile
+
+
+@dataclass(slots=True)
+class CoalesceStats:
+    requests: int = 0
+    leaders: int = 0
+    collapsed: int = 0
+    abandoned: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "leaders": self.leaders,
+            "collapsed": self.collapsed,
+            "abandoned": self.abandoned,
+        }
+
+
+@dataclass(slots=True)
+class _Flight:
+    task: asyncio.Task[LLMResponse]
+    waiters: int = 0
+
+
+class CoalescingLLM(LLM):
+    """Single-flight wrapper: concurrent identical prompts share one ``inner`` call.
+
+    The shared call runs in its own task, so cancelling one caller does not
+    cancel it for the others; it is cancelled only once every caller waiting
+    on it has gone. Errors reach every waiter. Streams are not coalesced.
+    """
+
+    def __init__(self, inner: LLM) -> None:
+        self.inner = inner
+        self.stats = CoalesceStats()
+        self._flights: dict[str, _Flight] = {}
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        self.stats.requests += 1
+        key = _flight_key(prompt)
+        flight = self._flights.get(key)
+        if flight is not None and flight.task.get_loop() is not asyncio.get_running_loop():
+            flight = None
+        if flight is None:
+            flight = _Flight(task=asyncio.ensure_future(self.inner.complete(prompt)))
+            flight.task.add_done_callback(lambda task, key=key: self._land(key, task))
+            self._flights[key] = flight
+            self.stats.leaders += 1
+        else:
+            self.stats.collapsed += 1
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                # Nobody else wants the result; later callers start a fresh flight.
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                flight.task.cancel()
+                self.stats.abandoned += 1
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def stream(self, prompt: str) -> AsyncIterator[str]:
+        return self.inner.stream(prompt)
+
+    def _land(self, key: str, task: asyncio.Task[LLMResponse]) -> None:
+        flight = self._flights.get(key)
+        if flight is not None and flight.task is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # Mark the error as retrieved; waiters re-raise it through shield().
+            task.exception()
+
+
+def _flight_key(prompt: str) -> str:
+    """Calls only share a flight when their agent profiles match too."""
+    profile = current_profile()
+    if profile is None:
+        return prompt
+    return f"{json.dumps(profile.as_dict(), sort_keys=True)}\0{prompt}"
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from swarm.llm.profile import LLMProfile
+
+_RUN_ID: ContextVar[str | None] = ContextVar("swarm_llm_run_id", default=None)
+_PROFILE: ContextVar[LLMProfile | None] = ContextVar("swarm_llm_profile", default=None)
+_AGENT: ContextVar[str | None] = ContextVar("swarm_llm_agent", default=None)
+
+
+def current_run_id() -> str | None:
+    """The run the current task is working for, if the Coordinator set one."""
+    return _RUN_ID.get()
+
+
+@contextmanager
+def run_scope(run_id: str) -> Iterator[None]:
+    token = _RUN_ID.set(run_id)
+    try:
+        yield
+    finally:
+        _RUN_ID.reset(token)
+
+
+def current_profile() -> LLMProfile | None:
+    """Generation settings of the agent whose call is in progress, if it has any."""
+    return _PROFILE.get()
+
+
+@contextmanager
+def profile_scope(profile: LLMProfile | None) -> Iterator[None]:
+    token = _PROFILE.set(profile)
+    try:
+        yield
+    finally:
+        _PROFILE.reset(token)
+
+
+def current_agent() -> str | None:
+    """Name of the agent whose call is in progress, if an agent made it."""
+    return _AGENT.get()
+
+
+@contextmanager
+def agent_scope(name: str) -> Iterator[None]:
+    token = _AGENT.set(name)
+    try:
+        yield
+    finally:
+        _AGENT.reset(token)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+from swarm.llm.base import LLM, LLMResponse
+
+
+@dataclass(slots=True)
+class HedgeStats:
+    requests: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    skipped: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "skipped": self.skipped,
+            "hedge_rate": round(self.hedges / self.requests, 4) if self.requests else 0.0,
+            "win_rate": round(self.hedge_wins / self.hedges, 4) if self.hedges else 0.0,
+        }
+
+
+class HedgedLLM(LLM):
+    """Sends a duplicate call when the first one is slower than usual.
+
+    Once ``min_samples`` calls have completed, a call still running after the
+    ``percentile`` of recent latencies gets a second copy on ``hedge`` (the
+    same backend by default, i.e. another slot; behind a :class:`RouterLLM`
+    the copy lands on a less busy server). The first successful answer wins and
+    the other call is cancelled. ``budget`` caps hedges at that share of
+    requests so a slow backend is not buried under duplicates. Streams are not
+    hedged.
+    """
+
+    def __init__(
+        self,
+        inner: LLM,
+        hedge: LLM | None = None,
+        percentile: float = 0.95,
+        budget: float = 0.1,
+        min_samples: int = 20,
+        window: int = 200,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0 <= budget <= 1:
+            raise ValueError("budget must be between 0 and 1")
+        self.inner = inner
+        self.hedge = hedge or inner
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.stats = HedgeStats()
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    def hedge_delay(self) -> float | None:
+        """Seconds to wait before hedging, or None while there is too little history."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(self.percentile * len(ordered)))]
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        self.stats.requests += 1
+        started = time.monotonic()
+        delay = self.hedge_delay()
+        primary = asyncio.ensure_future(self.inner.complete(prompt))
+        if delay is None:
+            response = await primary
+            self._latencies.append(time.monotonic() - started)
+            return response
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                if self.stats.hedges < self.budget * self.stats.requests:
+                    self.stats.hedges += 1
+                    tasks.add(asyncio.ensure_future(self.hedge.complete(prompt)))
+                else:
+                    self.stats.skipped += 1
+            winner = await _first_success(tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        if winner is not primary:
+            self.stats.hedge_wins += 1
+        self._latencies.append(time.monotonic() - started)
+        return winner.result()
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        chunks = self.inner.stream(prompt)
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()  # type: ignore[attr-defined]
+
+
+async def _first_success(tasks: set[asyncio.Future[LLMResponse]]) -> asyncio.Future[LLMResponse]:
+    """The first task to succeed; if all fail, re-raise the first failure."""
+    pending = set(tasks)
+    first_error: asyncio.Future[LLMResponse] | None = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None:
+                return task
+            if first_error is None:
+                first_error = task
+    assert first_error is not None
+    raise first_error.exception()  # type: ignore[misc]
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Hashable
+
+from swarm.llm.base import LLM, LLMResponse
+from swarm.llm.context import current_agent
+from swarm.net import HttpError
+
+# HTTP statuses a backend uses to say it is saturated.
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+
+@dataclass(slots=True)
+class LimiterStats:
+    acquired: int = 0
+    waits: int = 0
+    wait_seconds: float = 0.0
+    peak_queued: int = 0
+    increases: int = 0
+    decreases: int = 0
+    overloads: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "waits": self.waits,
+            "wait_seconds": round(self.wait_seconds, 6),
+            "peak_queued": self.peak_queued,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "overloads": self.overloads,
+        }
+
+
+class AimdLimiter:
+    """Adaptive concurrency limit using additive increase, multiplicative decrease.
+
+    While callers are queueing, the limit grows by one per limit's worth of
+    completions. A timeout, an overload status or a latency spike cuts it by
+    ``backoff``, at most once per round: calls started before the previous cut
+    do not cut again. Waiters are served in FIFO order.
+
+    Latency is judged per ``key`` (the caller's kind of call): each call is
+    compared with the best of the last ``window`` calls of its own kind, and a
+    spike is a moving average (``smoothing``) of that ratio above
+    ``tolerance``. Short and long prompts therefore do not read as overload
+    just because they take different times. A kind needs ``min_samples``
+    calls before it counts.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        tolerance: float = 2.0,
+        min_slowdown: float = 0.05,
+        window: int = 100,
+        min_samples: int = 5,
+        smoothing: float = 0.2,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        if tolerance <= 1:
+            raise ValueError("tolerance must be > 1")
+        if window < 1 or min_samples < 1:
+            raise ValueError("window and min_samples must be >= 1")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.min_slowdown = min_slowdown
+        self.window = window
+        self.min_samples = min_samples
+        self.smoothing = smoothing
+        self.stats = LimiterStats()
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._latencies: dict[Hashable, deque[float]] = {}
+        # Smoothed latency / baseline per key, so a spike in one kind of call is not diluted by others.
+        self._ratios: dict[Hashable, float] = {}
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current limit, in-flight and queued calls plus the cumulative stats."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queued": self.queued,
+            **self.stats.as_dict(),
+        }
+
+    async def acquire(self) -> float:
+        """Wait for a slot; returns the monotonic start time to pass back to :meth:`release`."""
+        self.stats.acquired += 1
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return time.monotonic()
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.stats.waits += 1
+        self.stats.peak_queued = max(self.stats.peak_queued, len(self._waiters))
+        queued_at = time.monotonic()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted a slot just as we were cancelled: hand it on.
+                self._in_flight -= 1
+                self._wake()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+        finally:
+            self.stats.wait_seconds += time.monotonic() - queued_at
+        return time.monotonic()
+
+    def release(
+        self,
+        started: float,
+        latency: float | None,
+        overloaded: bool = False,
+        key: Hashable = None,
+    ) -> None:
+        """Free a slot. ``latency`` is None when the call failed for reasons unrelated to load."""
+        saturated = bool(self._waiters) or self._in_flight >= self.limit
+        self._in_flight -= 1
+        if overloaded:
+            self.stats.overloads += 1
+            self._decrease(started)
+        elif latency is not None:
+            if self._spiked(latency, key):
+                self._decrease(started)
+            elif saturated and self._limit < self.max_limit:
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self.limit)
+                self.stats.increases += 1
+        self._wake()
+
+    def _spiked(self, latency: float, key: Hashable) -> bool:
+        history = self._latencies.get(key)
+        if history is None:
+            history = self._latencies[key] = deque(maxlen=self.window)
+        baseline = min(history) if history else latency
+        history.append(latency)
+        if len(history) <= self.min_samples:
+            return False
+        ratio = latency / baseline if baseline > 0 else 1.0
+        smoothed = self._ratios.get(key, 1.0)
+        smoothed += self.smoothing * (ratio - smoothed)
+        self._ratios[key] = smoothed
+        return smoothed > self.tolerance and latency - baseline > self.min_slowdown
+
+    def _decrease(self, started: float) -> None:
+        if started < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        # Later calls have to show the slowdown again before the next cut.
+        self._ratios.clear()
+        self._limit = max(float(self.min_limit), self._limit * self.backoff)
+        self.stats.decreases += 1
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+
+class LimitedLLM(LLM):
+    """Runs ``inner`` calls through an :class:`AimdLimiter`.
+
+    Streams hold their slot until closed and report time to first chunk as
+    their latency. Latency is judged per agent and prompt size (see
+    :func:`latency_key`).
+    """
+
+    def __init__(self, inner: LLM, limiter: AimdLimiter) -> None:
+        self.inner = inner
+        self.limiter = limiter
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        key = latency_key(prompt)
+        started = await self.limiter.acquire()
+        latency: float | None = None
+        overloaded = False
+        try:
+            response = await self.inner.complete(prompt)
+            latency = time.monotonic() - started
+            return response
+        except Exception as exc:
+            overloaded = is_overload(exc)
+            raise
+        finally:
+            self.limiter.release(started, latency, overloaded, key)
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        key = latency_key(prompt)
+        started = await self.limiter.acquire()
+        latency: float | None = None
+        overloaded = False
+        chunks = self.inner.stream(prompt)
+        try:
+            async for chunk in chunks:
+                if latency is None:
+                    latency = time.monotonic() - started
+                yield chunk
+        except Exception as exc:
+            overloaded = is_overload(exc)
+            raise
+        finally:
+            await chunks.aclose()  # type: ignore[attr-defined]
+            self.limiter.release(started, latency, overloaded, key)
+
+
+def latency_key(prompt: str) -> tuple[str | None, int]:
+    """Calls of one kind: the calling agent and the prompt length to within a factor of two."""
+    return current_agent(), len(prompt).bit_length()
+
+
+def is_overload(exc: BaseException) -> bool:
+    """True when ``exc`` (or an exception it wraps) says the backend is saturated."""
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, TimeoutError):
+            return True
+        if isinstance(current, HttpError) and current.status in OVERLOAD_STATUSES:
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+_SHARED: dict[str, AimdLimiter] = {}
+
+
+def shared_limiter(key: str, **options: Any) -> AimdLimiter:
+    """The process-wide limiter for backend ``key``; ``options`` apply on first use."""
+    limiter = _SHARED.get(key)
+    if limiter is None:
+        limiter = _SHARED[key] = AimdLimiter(**options)
+    return limiter
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+
+from swarm.llm.base import LLM, LLMResponse
+
+
+class MockLLM(LLM):
+    def __init__(self, seed: int = 42) -> None:
+        self._seed = seed
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        return LLMResponse(content=self.respond(prompt))
+
+    def respond(self, prompt: str) -> str:
+        """Return the canned response text for ``prompt`` (shared with the Ollama stub server)."""
+        lowered = prompt.lower()
+        if "role: planner" in lowered:
+            plan = {
+                "steps": [
+                    {
+                        "id": 1,
+                        "agent": "researcher",
+                        "task": "Gather relevant context for the objective.",
+                        "depends_on": [],
+                    },
+                    {
+                        "id": 2,
+                        "agent": "coder",
+                        "task": "Draft an output artifact based on the research.",
+                        "depends_on": [1],
+                    },
+                    {
+                        "id": 3,
+                        "agent": "critic",
+                        "task": "Review the drafted output for completeness and clarity.",
+                        "depends_on": [2],
+                    },
+                ],
+                "seed": self._seed,
+            }
+            return json.dumps(plan, indent=2)
+        if "role: researcher" in lowered:
+            objective = _extract_line(prompt, "objective")
+            if "animation" in objective or "movie" in objective:
+                payload = {
+                    "summary": "Animation work needs a renderable deliverable with a short arc.",
+                    "deliverable": "gif",
+                    "needs": ["gif encoder"],
+                }
+            else:
+                payload = {
+                    "summary": "Provide general guidance and assumptions based on the objective.",
+                    "deliverable": "html",
+                    "needs": [],
+                }
+            return json.dumps(payload)
+        if "role: coder" in lowered:
+            objective = _extract_line(prompt, "objective")
+            if "animation" in objective or "movie" in objective:
+                payload = {
+                    "deliverable": "gif",
+                    "subject": objective,
+                    "project_type": "animation",
+                }
+            else:
+                payload = {
+                    "deliverable": "html",
+                    "subject": objective,
+                    "project_type": "landing_page",
+                }
+            return json.dumps(payload)
+        if "role: critic" in lowered:
+            payload = {"approved": True, "notes": "Looks good."}
+            return json.dumps(payload)
+        return json.dumps({"summary": "Unrecognized prompt."})
+
+
+def _extract_line(prompt: str, prefix: str) -> str:
+    prefix_lower = f"{prefix.lower()}:"
+    for line in prompt.splitlines():
+        if line.lower().startswith(prefix_lower):
+            return line.split(":", 1)[-1].strip().lower()
+    return ""
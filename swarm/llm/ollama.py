@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+
+from swarm.llm.base import LLMResponse
+from swarm.llm.context import current_profile
+from swarm.llm.profile import LLMProfile
+from swarm.llm.remote import RemoteLLM
+from swarm.llm.sessions import ChatSessions, Turn
+from swarm.net import CircuitBreaker, HttpClient, HttpError, RetryPolicy
+
+T = TypeVar("T")
+
+CHAT = "/api/chat"
+
+
+class OllamaLLM(RemoteLLM):
+    """Ollama's ``/api/generate`` or ``/api/chat`` over the shared :class:`RemoteLLM` transport.
+
+    A 404 from ``/api/generate`` (older or proxied servers) falls back to
+    ``/api/chat``. With ``sessions``, each call's ``prompt_eval_count`` is
+    counted per run, and resuming sessions send an agent's calls as turns of
+    one ``/api/chat`` conversation (see :class:`ChatSessions`).
+    """
+
+    service = "Ollama"
+
+    def __init__(
+        self,
+        model: str,
+        base_url: str,
+        endpoint: str,
+        timeout: int,
+        retries: int,
+        pool_size: int = 8,
+        client: HttpClient | None = None,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        adaptive_timeout: bool = True,
+        sessions: ChatSessions | None = None,
+    ) -> None:
+        super().__init__(
+            model=model,
+            base_url=base_url,
+            endpoint=endpoint,
+            timeout=timeout,
+            retries=retries,
+            pool_size=pool_size,
+            client=client,
+            retry=retry,
+            breaker=breaker,
+            adaptive_timeout=adaptive_timeout,
+        )
+        self.sessions = sessions
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        turn = self._open_turn(prompt)
+        response = await self._send(self._post, prompt, turn)
+        content = _record_text(response)
+        self._close_turn(turn, content, response)
+        return LLMResponse(content=content)
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        """Yield response text from Ollama's NDJSON stream as chunks arrive.
+
+        Closing the iterator early closes the connection, which makes Ollama
+        stop generating. Retries only cover opening the stream.
+        """
+        turn = self._open_turn(prompt)
+        response = await self._send(self._open, prompt, turn, stream=True)
+        parts: list[str] = []
+        final: dict[str, Any] | None = None
+        try:
+            async for line in response.iter_lines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get("error"):
+                    raise RuntimeError(f"Ollama stream failed: {record['error']}")
+                text = _record_text(record)
+                if text:
+                    parts.append(text)
+                    yield text
+                if record.get("done"):
+                    final = record
+                    break
+        except GeneratorExit:
+            # Closed early by the caller: the answer so far joins the session but is not counted.
+            self._close_turn(turn, "".join(parts), None)
+            raise
+        finally:
+            await response.aclose()
+        self._close_turn(turn, "".join(parts), final)
+
+    def _payload(self, endpoint: str, prompt: str, stream: bool = False) -> dict[str, Any]:
+        profile = current_profile()
+        model = self._current_model()
+        if endpoint == CHAT:
+            payload: dict[str, Any] = {
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                "stream": stream,
+            }
+        else:
+            payload = {"model": model, "prompt": prompt, "stream": stream}
+        options = _options(profile)
+        if options:
+            payload["options"] = options
+        return payload
+
+    def _fallback(self, endpoint: str, exc: HttpError) -> str | None:
+        if exc.status == 404 and endpoint != CHAT:
+            return CHAT
+        return None
+
+    def _current_model(self) -> str:
+        profile = current_profile()
+        return (profile.model if profile is not None else None) or self._model
+
+    def _open_turn(self, prompt: str) -> Turn | None:
+        return self.sessions.open(self._current_model(), prompt) if self.sessions is not None else None
+
+    def _close_turn(self, turn: Turn | None, content: str, record: dict[str, Any] | None) -> None:
+        if self.sessions is not None and turn is not None:
+            self.sessions.close(self._current_model(), turn, content, record)
+
+    async def _send(
+        self,
+        send: Callable[[str, dict[str, Any], float], Awaitable[T]],
+        prompt: str,
+        turn: Turn | None,
+        stream: bool = False,
+    ) -> T:
+        """Send ``prompt``, or a session turn's whole conversation to ``/api/chat``."""
+        if turn is None or turn.messages is None:
+            return await self._with_retries(send, prompt, stream=stream)
+        messages = [dict(message) for message in turn.messages]
+
+        async def send_turn(endpoint: str, payload: dict[str, Any], timeout: float) -> T:
+            return await send(endpoint, {**payload, "messages": messages}, timeout)
+
+        return await self._with_retries(send_turn, prompt, stream=stream, endpoint=CHAT)
+
+
+def _options(profile: LLMProfile | None) -> dict[str, Any]:
+    if profile is None:
+        return {}
+    options: dict[str, Any] = {}
+    if profile.max_tokens is not None:
+        options["num_predict"] = profile.max_tokens
+    if profile.temperature is not None:
+        options["temperature"] = profile.temperature
+    if profile.stop:
+        options["stop"] = list(profile.stop)
+    if profile.num_ctx is not None:
+        options["num_ctx"] = profile.num_ctx
+    return options
+
+
+def _record_text(record: dict[str, Any]) -> str:
+    content = record.get("response")
+    if content is None:
+        content = (record.get("message") or {}).get("content", "")
+    return content or ""
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator
+
+from swarm.llm.base import LLMResponse
+from swarm.llm.context import current_profile
+from swarm.llm.remote import RemoteLLM
+from swarm.net import CircuitBreaker, HttpClient, RetryPolicy
+
+CHAT_COMPLETIONS = "/v1/chat/completions"
+
+
+class OpenAICompatibleLLM(RemoteLLM):
+    """``/v1/chat/completions`` servers such as llama.cpp server, vLLM or LM Studio.
+
+    These batch concurrent requests on the GPU, so they want many requests
+    in flight: give them a larger ``pool_size`` than Ollama. Streams use the
+    server-sent events format; profile ``max_tokens``, ``temperature`` and
+    ``stop`` map to the request fields of the same name (``num_ctx`` is a
+    server launch option there and is ignored).
+    """
+
+    service = "OpenAI-compatible"
+
+    def __init__(
+        self,
+        model: str,
+        base_url: str,
+        timeout: int,
+        retries: int,
+        api_key: str | None = None,
+        endpoint: str = CHAT_COMPLETIONS,
+        pool_size: int = 32,
+        client: HttpClient | None = None,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        adaptive_timeout: bool = True,
+    ) -> None:
+        super().__init__(
+            model=model,
+            base_url=base_url,
+            endpoint=endpoint,
+            timeout=timeout,
+            retries=retries,
+            pool_size=pool_size,
+            client=client,
+            retry=retry,
+            breaker=breaker,
+            adaptive_timeout=adaptive_timeout,
+            headers={"Authorization": f"Bearer {api_key}"} if api_key else None,
+        )
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        response = await self._with_retries(self._post, prompt)
+        choices = response.get("choices") or [{}]
+        return LLMResponse(content=(choices[0].get("message") or {}).get("content") or "")
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        """Yield ``delta.content`` from each ``data:`` event until ``[DONE]``.
+
+        Closing the iterator early closes the connection, which makes the
+        server stop generating. Retries only cover opening the stream.
+        """
+        response = await self._with_retries(self._open, prompt, stream=True)
+        try:
+            async for line in response.iter_lines():
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    break
+                event = json.loads(data)
+                if event.get("error"):
+                    raise RuntimeError(f"{self.service} stream failed: {event['error']}")
+                for choice in event.get("choices") or []:
+                    text = (choice.get("delta") or {}).get("content")
+                    if text:
+                        yield text
+        finally:
+            await response.aclose()
+
+    def _payload(self, endpoint: str, prompt: str, stream: bool = False) -> dict[str, Any]:
+        profile = current_profile()
+        payload: dict[str, Any] = {
+            "model": (profile.model if profile is not None else None) or self._model,
+            "messages": [{"role": "user", "content": prompt}],
+            "stream": stream,
+        }
+        if profile is not None:
+            if profile.max_tokens is not None:
+                payload["max_tokens"] = profile.max_tokens
+            if profile.temperature is not None:
+                payload["temperature"] = profile.temperature
+            if profile.stop:
+                payload["stop"] = list(profile.stop)
+        return payload
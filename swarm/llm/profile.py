@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class LLMProfile:
+    """Per-agent generation settings layered over the backend's defaults.
+
+    ``None`` (or an empty ``stop``) keeps the backend default. Backends map
+    the fields to their own options: Ollama uses ``model`` and
+    ``options.num_predict``/``temperature``/``stop``/``num_ctx``.
+    """
+
+    model: str | None = None
+    max_tokens: int | None = None
+    temperature: float | None = None
+    stop: tuple[str, ...] = ()
+    num_ctx: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_tokens is not None and self.max_tokens < 1:
+            raise ValueError("max_tokens must be >= 1")
+        if self.num_ctx is not None and self.num_ctx < 1:
+            raise ValueError("num_ctx must be >= 1")
+        if self.temperature is not None and self.temperature < 0:
+            raise ValueError("temperature must be >= 0")
+
+    @classmethod
+    def from_dict(cls, values: dict[str, Any]) -> "LLMProfile":
+        """Build a profile from config or CLI values, coercing strings to the field types.
+
+        ``stop`` accepts a list or a ``|``-separated string.
+        """
+        known = {item.name for item in fields(cls)}
+        unknown = set(values) - known
+        if unknown:
+            raise ValueError(f"Unknown LLM profile option(s): {', '.join(sorted(unknown))}")
+        coerced: dict[str, Any] = {}
+        for key, value in values.items():
+            if key == "stop":
+                items = value.split("|") if isinstance(value, str) else list(value or ())
+                coerced[key] = tuple(str(item) for item in items if item)
+            elif value is None or (isinstance(value, str) and value.lower() in {"", "none"}):
+                coerced[key] = None
+            elif key == "model":
+                coerced[key] = str(value)
+            elif key == "temperature":
+                coerced[key] = float(value)
+            else:
+                coerced[key] = int(value)
+        return cls(**coerced)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Only the fields that override something, for cache keys and logs."""
+        values: dict[str, Any] = {}
+        for item in fields(self):
+            value = getattr(self, item.name)
+            if value is not None and value != ():
+                values[item.name] = list(value) if item.name == "stop" else value
+        return values
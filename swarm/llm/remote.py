@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from swarm.llm.base import LLM
+from swarm.llm.limiter import latency_key
+from swarm.net import (
+    AdaptiveTimeout,
+    CircuitBreaker,
+    HttpClient,
+    HttpError,
+    PoolStats,
+    RetryPolicy,
+    RetryStats,
+    StreamingResponse,
+    is_retryable,
+    shared_breaker,
+    shared_client,
+)
+
+T = TypeVar("T")
+
+# Adaptive timeouts never go below this (or the configured timeout, if smaller).
+MIN_ADAPTIVE_TIMEOUT = 10.0
+
+
+class RemoteLLM(LLM):
+    """Transport shared by LLMs served over HTTP: pooling, retries, breaker, timeouts.
+
+    By default every instance shares the process-wide :func:`shared_client`,
+    so concurrent runs reuse one bounded pool (``pool_size`` connections) per
+    base URL.
+
+    Failed requests are retried per ``retry`` (exponential backoff with full
+    jitter). All instances for one base URL share a :class:`CircuitBreaker`
+    that fails fast while the server is down, and with ``adaptive_timeout``
+    each attempt's timeout follows recent latency instead of always waiting
+    the full ``timeout``. Subclasses build the request body in ``_payload``.
+    """
+
+    service = "LLM"
+
+    def __init__(
+        self,
+        model: str,
+        base_url: str,
+        endpoint: str,
+        timeout: int,
+        retries: int,
+        pool_size: int = 8,
+        client: HttpClient | None = None,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        adaptive_timeout: bool = True,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self._model = model
+        self._base_url = base_url.rstrip("/")
+        self._endpoint = endpoint
+        self._timeout = timeout
+        self._headers = dict(headers or {})
+        self._retry = retry or RetryPolicy(retries=max(0, retries))
+        self._client = client or shared_client()
+        self._client.set_limit(self._base_url, pool_size)
+        self.breaker = breaker or shared_breaker(self._base_url)
+        self.retry_stats = RetryStats()
+        # One tracker per kind of call: a stream's latency is time to headers, a completion's is
+        # the whole answer, and a short prompt's answer says little about a long one's.
+        self._adaptive_timeout = adaptive_timeout
+        self._timeouts: dict[tuple[bool, Hashable], AdaptiveTimeout] = {}
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    def pool_stats(self) -> PoolStats:
+        return self._client.stats(self._base_url)
+
+    def _payload(self, endpoint: str, prompt: str, stream: bool = False) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def _fallback(self, endpoint: str, exc: HttpError) -> str | None:
+        """Another endpoint to try after a non-retryable error, if the server has one."""
+        return None
+
+    async def _with_retries(
+        self,
+        send: Callable[[str, dict[str, Any], float], Awaitable[T]],
+        prompt: str,
+        stream: bool = False,
+        endpoint: str | None = None,
+    ) -> T:
+        endpoint = endpoint or self._endpoint
+        stats = self.retry_stats
+        last_exc: Exception | None = None
+        attempt = 0
+        while attempt <= self._retry.retries:
+            if attempt:
+                delay = self._retry.delay(attempt - 1)
+                stats.retries += 1
+                stats.backoff_seconds += delay
+                await asyncio.sleep(delay)
+            self.breaker.before_call()
+            timeout = self._attempt_timeout((stream, latency_key(prompt)), attempt)
+            stats.attempts += 1
+            started = time.monotonic()
+            try:
+                result = await send(endpoint, self._payload(endpoint, prompt, stream), timeout)
+            except HttpError as exc:
+                last_exc = exc
+                if not is_retryable(exc):
+                    # The server answered, so it is up; the request itself is at fault.
+                    self.breaker.record_success()
+                    fallback = self._fallback(endpoint, exc)
+                    if fallback is not None:
+                        endpoint = fallback
+                        last_exc = None
+                        continue
+                    break
+                self.breaker.record_failure()
+            except (TimeoutError, OSError) as exc:
+                last_exc = exc
+                if isinstance(exc, TimeoutError):
+                    stats.timeouts += 1
+                self.breaker.record_failure()
+            except BaseException:
+                self.breaker.record_ignored()
+                raise
+            else:
+                self.breaker.record_success()
+                if self._adaptive_timeout:
+                    self._tracker((stream, latency_key(prompt))).observe(time.monotonic() - started)
+                return result
+            attempt += 1
+        raise RuntimeError(f"{self.service} request failed: {last_exc}") from last_exc
+
+    def _attempt_timeout(self, key: tuple[bool, Hashable], attempt: int) -> float:
+        if not self._adaptive_timeout:
+            return self._timeout
+        return self._tracker(key).timeout(attempt)
+
+    def _tracker(self, key: tuple[bool, Hashable]) -> AdaptiveTimeout:
+        tracker = self._timeouts.get(key)
+        if tracker is None:
+            tracker = self._timeouts[key] = AdaptiveTimeout(float(self._timeout), floor=MIN_ADAPTIVE_TIMEOUT)
+        return tracker
+
+    async def _post(self, endpoint: str, payload: dict[str, Any], timeout: float) -> dict[str, Any]:
+        response = await self._client.request(
+            "POST", f"{self._base_url}{endpoint}", headers=self._headers, json=payload, timeout=timeout
+        )
+        if response.status >= 400:
+            raise HttpError(response.status, response.url, response.body)
+        return response.json()
+
+    async def _open(self, endpoint: str, payload: dict[str, Any], timeout: float) -> StreamingResponse:
+        response = await self._client.open(
+            "POST", f"{self._base_url}{endpoint}", headers=self._headers, json=payload, timeout=timeout
+        )
+        if response.status >= 400:
+            body = await response.read()
+            await response.aclose()
+            raise HttpError(response.status, response.url, body)
+        return response
+
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Sequence
+
+from swarm.llm.base import LLM, LLMResponse
+from swarm.llm.context import current_run_id
+from swarm.net import HttpError, is_retryable
+
+STRATEGIES = ("least_outstanding", "ewma")
+
+
+@dataclass(slots=True)
+class RouteStats:
+    name: str
+    requests: int = 0
+    failures: int = 0
+    ejections: int = 0
+    outstanding: int = 0
+    ewma_latency: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "requests": self.requests,
+            "failures": self.failures,
+            "ejections": self.ejections,
+            "outstanding": self.outstanding,
+            "ewma_latency": round(self.ewma_latency, 6),
+        }
+
+
+class _Route:
+    __slots__ = ("index", "llm", "stats", "consecutive_failures", "ejected_until")
+
+    def __init__(self, index: int, llm: LLM, name: str) -> None:
+        self.index = index
+        self.llm = llm
+        self.stats = RouteStats(name=name)
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+
+
+class RouterLLM(LLM):
+    """Spreads calls over several backends.
+
+    ``least_outstanding`` picks the backend with the fewest calls in flight
+    (ties go to the lower EWMA latency); ``ewma`` picks the lowest
+    ``(outstanding + 1) * ewma_latency``. ``failure_threshold`` consecutive
+    failures eject a backend for ``eject_seconds``; after that it is tried
+    again and a single further failure ejects it again. A failed call fails
+    over to another backend. With ``pin_runs`` every call made for one run
+    (see :func:`swarm.llm.context.run_scope`) goes to the same backend, chosen
+    by rendezvous hashing so ejections move only the runs that were pinned to
+    the ejected backend, which keeps that backend's prompt cache warm.
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[LLM],
+        names: Sequence[str] | None = None,
+        strategy: str = "least_outstanding",
+        pin_runs: bool = False,
+        failure_threshold: int = 3,
+        eject_seconds: float = 10.0,
+        ewma_decay: float = 0.3,
+    ) -> None:
+        if not backends:
+            raise ValueError("RouterLLM needs at least one backend")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {', '.join(STRATEGIES)}")
+        if names is not None and len(names) != len(backends):
+            raise ValueError("names must match backends")
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        labels = list(names) if names is not None else [f"backend-{i}" for i in range(len(backends))]
+        self.routes = [_Route(i, llm, label) for i, (llm, label) in enumerate(zip(backends, labels))]
+        self.strategy = strategy
+        self.pin_runs = pin_runs
+        self.failure_threshold = failure_threshold
+        self.eject_seconds = eject_seconds
+        self.ewma_decay = ewma_decay
+        self._next = 0
+
+    def route_stats(self) -> list[dict[str, Any]]:
+        now = time.monotonic()
+        return [
+            {**route.stats.as_dict(), "healthy": route.ejected_until <= now} for route in self.routes
+        ]
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        tried: set[int] = set()
+        while True:
+            route = self._pick(tried)
+            tried.add(route.index)
+            started = self._start(route)
+            try:
+                response = await route.llm.complete(prompt)
+            except Exception as exc:
+                if not self._finish(route, started, exc) or len(tried) == len(self.routes):
+                    raise
+                continue
+            except BaseException:
+                # Cancelled (a losing hedge, an abandoned waiter): free the slot without judging the backend.
+                route.stats.outstanding -= 1
+                raise
+            self._finish(route, started)
+            return response
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream from one backend; fails over only if nothing has been yielded yet."""
+        tried: set[int] = set()
+        while True:
+            route = self._pick(tried)
+            tried.add(route.index)
+            started = self._start(route)
+            chunks = route.llm.stream(prompt)
+            yielded = False
+            failure: Exception | None = None
+            finished = False
+            try:
+                async for chunk in chunks:
+                    yielded = True
+                    yield chunk
+                finished = True
+            except Exception as exc:
+                failure = exc
+            finally:
+                await chunks.aclose()  # type: ignore[attr-defined]
+                if not finished and failure is None:
+                    # Closed early or cancelled: free the slot without judging the backend.
+                    route.stats.outstanding -= 1
+            if failure is None:
+                self._finish(route, started)
+                return
+            if not self._finish(route, started, failure) or yielded or len(tried) == len(self.routes):
+                raise failure
+
+    def _start(self, route: _Route) -> float:
+        route.stats.requests += 1
+        route.stats.outstanding += 1
+        return time.monotonic()
+
+    def _finish(self, route: _Route, started: float, exc: Exception | None = None) -> bool:
+        """Record the outcome; returns whether ``exc`` is the backend's fault."""
+        stats = route.stats
+        stats.outstanding -= 1
+        if exc is None:
+            route.consecutive_failures = 0
+            latency = time.monotonic() - started
+            stats.ewma_latency = (
+                latency
+                if not stats.ewma_latency
+                else self.ewma_decay * latency + (1 - self.ewma_decay) * stats.ewma_latency
+            )
+            return False
+        if not _is_backend_failure(exc):
+            return False
+        stats.failures += 1
+        route.consecutive_failures += 1
+        if route.consecutive_failures >= self.failure_threshold:
+            route.ejected_until = time.monotonic() + self.eject_seconds
+            stats.ejections += 1
+        return True
+
+    def _pick(self, tried: set[int]) -> _Route:
+        now = time.monotonic()
+        untried = [route for route in self.routes if route.index not in tried]
+        candidates = [route for route in untried if route.ejected_until <= now]
+        if not candidates:
+            # Everything left is ejected: try the one that comes back soonest rather than fail.
+            return min(untried, key=lambda route: route.ejected_until)
+        run_id = current_run_id() if self.pin_runs else None
+        if run_id is not None:
+            return max(candidates, key=lambda route: _rendezvous(run_id, route.stats.name))
+        # Rotate the starting point so ties spread round-robin.
+        offset = self._next % len(candidates)
+        self._next += 1
+        rotated = candidates[offset:] + candidates[:offset]
+        if self.strategy == "ewma":
+            return min(
+                rotated,
+                key=lambda route: (route.stats.outstanding + 1) * route.stats.ewma_latency,
+            )
+        return min(rotated, key=lambda route: (route.stats.outstanding, route.stats.ewma_latency))
+
+
+def _rendezvous(run_id: str, name: str) -> int:
+    digest = hashlib.blake2b(f"{run_id}|{name}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _is_backend_failure(exc: BaseException) -> bool:
+    """False when a wrapped HTTP error says the request itself was bad."""
+    current: BaseException | None = exc
+    seen: set[int] = set()
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, HttpError):
+            return is_retryable(current)
+        current = current.__cause__
+    return True
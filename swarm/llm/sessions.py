@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from swarm.llm.context import current_agent, current_run_id
+from swarm.llm.simulated import token_count
+
+
+@dataclass(slots=True)
+class PrefillStats:
+    """Prompt tokens sent to the server versus tokens it actually evaluated.
+
+    ``sent_tokens`` is an estimate of every message in the requests, which is
+    what a server without a prompt cache has to prefill. ``evaluated_tokens``
+    sums Ollama's ``prompt_eval_count``. Only calls that reached the final
+    record are counted, so streams closed early are left out.
+    """
+
+    calls: int = 0
+    resumed_calls: int = 0
+    sent_tokens: int = 0
+    evaluated_tokens: int = 0
+
+    @property
+    def saved_ratio(self) -> float:
+        if not self.sent_tokens:
+            return 0.0
+        return max(0.0, 1.0 - self.evaluated_tokens / self.sent_tokens)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "resumed_calls": self.resumed_calls,
+            "sent_tokens": self.sent_tokens,
+            "evaluated_tokens": self.evaluated_tokens,
+            "saved_ratio": round(self.saved_ratio, 4),
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class Turn:
+    """One call's messages; ``messages`` is ``None`` when the call is not part of a session."""
+
+    key: tuple[str, str | None] | None
+    prompt: str
+    messages: tuple[dict[str, str], ...] | None
+    base: int = 0
+    version: int = 0
+
+
+@dataclass(slots=True)
+class _Session:
+    model: str
+    messages: list[dict[str, str]] = field(default_factory=list)
+    version: int = 0
+
+
+class ChatSessions:
+    """Prefill counts per run and, with ``resume``, one ``/api/chat`` session per (run, agent).
+
+    With ``resume`` an agent's calls within a run become turns of one chat:
+    each request resends the earlier turns before the new prompt, so the
+    server finds them in its prompt cache and evaluates only the new turn.
+    The model then sees the agent's earlier prompts and answers, so answers
+    depend on what came before in the run. Only the last ``max_turns``
+    exchanges are kept. When the same agent has two calls in flight, the one
+    that finishes second is not added to the history.
+
+    Without ``resume`` calls are sent as before and only counted, which gives
+    the baseline to compare against.
+    """
+
+    def __init__(self, resume: bool = False, max_turns: int = 8, max_sessions: int = 256) -> None:
+        if max_turns < 1:
+            raise ValueError("max_turns must be >= 1")
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be >= 1")
+        self.resume = resume
+        self.max_turns = max_turns
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[tuple[str, str | None], _Session] = OrderedDict()
+        self._stats: dict[str | None, PrefillStats] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def open(self, model: str, prompt: str) -> Turn:
+        """The messages to send for ``prompt``: the session's history, then the new turn."""
+        key = _session_key() if self.resume else None
+        if key is None:
+            return Turn(key=None, prompt=prompt, messages=None)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None or session.model != model:
+                history, version = [], -1
+            else:
+                history, version = list(session.messages), session.version
+        return Turn(
+            key=key,
+            prompt=prompt,
+            messages=(*history, {"role": "user", "content": prompt}),
+            base=len(history),
+            version=version,
+        )
+
+    def close(self, model: str, turn: Turn, answer: str, record: dict[str, Any] | None) -> None:
+        """Count a finished call and add it to its session; ``record`` is the server's final record."""
+        with self._lock:
+            if record is not None:
+                stats = self._stats.setdefault(current_run_id(), PrefillStats())
+                stats.calls += 1
+                stats.resumed_calls += 1 if turn.base else 0
+                messages = turn.messages or ({"content": turn.prompt},)
+                stats.sent_tokens += sum(token_count(message["content"]) for message in messages)
+                stats.evaluated_tokens += int(record.get("prompt_eval_count") or 0)
+            if turn.key is None or turn.messages is None:
+                return
+            session = self._sessions.get(turn.key)
+            if turn.version < 0:
+                # Opened without a session: start one unless another call already did.
+                if session is not None and session.model == model:
+                    return
+                session = self._sessions[turn.key] = _Session(model=model)
+            elif session is None or session.model != model or session.version != turn.version:
+                return
+            session.version += 1
+            session.messages.extend([turn.messages[-1], {"role": "assistant", "content": answer}])
+            del session.messages[: -2 * self.max_turns]
+            self._sessions.move_to_end(turn.key)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def stats(self, run_id: str | None = None) -> PrefillStats:
+        with self._lock:
+            stats = self._stats.get(run_id, PrefillStats())
+            return PrefillStats(stats.calls, stats.resumed_calls, stats.sent_tokens, stats.evaluated_tokens)
+
+    def forget(self, run_id: str) -> PrefillStats:
+        """Drop a finished run's sessions and return its counts."""
+        with self._lock:
+            for key in [key for key in self._sessions if key[0] == run_id]:
+                del self._sessions[key]
+            return self._stats.pop(run_id, None) or PrefillStats()
+
+
+def _session_key() -> tuple[str, str | None] | None:
+    run_id = current_run_id()
+    return None if run_id is None else (run_id, current_agent())
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field, fields
+from typing import Any, AsyncIterator
+
+from swarm.llm.base import LLM, LLMResponse
+from swarm.llm.context import current_profile
+from swarm.llm.mock import MockLLM
+
+DISTRIBUTIONS = ("fixed", "normal", "lognormal", "pareto")
+
+# Rough characters-per-token ratio used to turn response text into generation time.
+CHARS_PER_TOKEN = 4
+
+# Latencies kept for the percentiles in SimulatedStats; older calls drop out.
+LATENCY_WINDOW = 10_000
+
+
+@dataclass(slots=True)
+class LatencyProfile:
+    """How a simulated backend behaves under load.
+
+    ``latency`` is the per-call delay before the first token on top of ``ttft``:
+    the fixed value, the mean (normal), the median (lognormal) or the minimum
+    (pareto). ``jitter`` is the standard deviation for normal and the sigma of
+    the underlying normal for lognormal; ``tail_alpha`` is the pareto shape
+    (smaller means a heavier tail). After the first token the response is
+    generated at ``tokens_per_s`` (instantly when ``None``).
+    """
+
+    distribution: str = "lognormal"
+    latency: float = 0.5
+    jitter: float = 0.25
+    tail_alpha: float = 1.5
+    ttft: float = 0.0
+    tokens_per_s: float | None = None
+    failure_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout: float = 30.0
+    max_concurrency: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of {', '.join(DISTRIBUTIONS)}")
+        if self.latency < 0 or self.jitter < 0 or self.ttft < 0 or self.timeout < 0:
+            raise ValueError("latency, jitter, ttft and timeout must be >= 0")
+        if self.tail_alpha <= 0:
+            raise ValueError("tail_alpha must be > 0")
+        if self.tokens_per_s is not None and self.tokens_per_s <= 0:
+            raise ValueError("tokens_per_s must be > 0")
+        if not 0 <= self.failure_rate <= 1 or not 0 <= self.timeout_rate <= 1:
+            raise ValueError("failure_rate and timeout_rate must be between 0 and 1")
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+    @classmethod
+    def from_dict(cls, values: dict[str, Any]) -> "LatencyProfile":
+        """Build a profile from config or CLI values, coercing strings to the field types."""
+        known = {item.name for item in fields(cls)}
+        unknown = set(values) - known
+        if unknown:
+            raise ValueError(f"Unknown latency profile option(s): {', '.join(sorted(unknown))}")
+        coerced: dict[str, Any] = {}
+        for key, value in values.items():
+            if key == "distribution":
+                coerced[key] = str(value)
+            elif value is None or (isinstance(value, str) and value.lower() in {"", "none"}):
+                coerced[key] = None
+            elif key == "max_concurrency":
+                coerced[key] = int(value)
+            else:
+                coerced[key] = float(value)
+        return cls(**coerced)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "fixed":
+            return self.latency
+        if self.distribution == "normal":
+            return max(0.0, rng.gauss(self.latency, self.jitter))
+        if self.distribution == "lognormal":
+            if self.latency == 0:
+                return 0.0
+            return rng.lognormvariate(math.log(self.latency), self.jitter)
+        return self.latency * rng.paretovariate(self.tail_alpha)
+
+    def generation_time(self, text: str) -> float:
+        if self.tokens_per_s is None:
+            return 0.0
+        return token_count(text) / self.tokens_per_s
+
+
+@dataclass(slots=True)
+class SimulatedStats:
+    """Call counters, with p50/p99 over the last ``LATENCY_WINDOW`` latencies."""
+
+    calls: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    waiting: int = 0
+    peak_waiting: int = 0
+    queue_seconds: float = 0.0
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def as_dict(self) -> dict[str, Any]:
+        ordered = sorted(self.latencies)
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "peak_in_flight": self.peak_in_flight,
+            "peak_waiting": self.peak_waiting,
+            "queue_seconds": round(self.queue_seconds, 6),
+            "p50_s": round(_percentile(ordered, 0.5), 6),
+            "p99_s": round(_percentile(ordered, 0.99), 6),
+        }
+
+
+class SimulatedLLM(LLM):
+    """An LLM stand-in that answers like ``inner`` but with realistic timing.
+
+    Calls queue for one of ``profile.max_concurrency`` server slots, wait for
+    the sampled first-token delay, then "generate" at ``tokens_per_s``. A
+    ``failure_rate`` share of calls raises ``RuntimeError`` and a
+    ``timeout_rate`` share hangs for ``timeout`` seconds before raising
+    ``TimeoutError``, mirroring how the real backends surface errors. An
+    agent profile's ``max_tokens`` truncates the answer.
+    """
+
+    def __init__(
+        self,
+        profile: LatencyProfile | None = None,
+        inner: LLM | None = None,
+        seed: int = 42,
+        chunk_tokens: int = 8,
+    ) -> None:
+        if chunk_tokens < 1:
+            raise ValueError("chunk_tokens must be >= 1")
+        self.profile = profile or LatencyProfile()
+        self.stats = SimulatedStats()
+        self._inner = inner or MockLLM(seed=seed)
+        self._rng = random.Random(seed)
+        self._chunk_tokens = chunk_tokens
+        # One semaphore per event loop, so a shared instance survives repeated asyncio.run().
+        self._slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        started = time.perf_counter()
+        async with self._slot():
+            response = LLMResponse(content=_cap(await self._inner.complete(prompt)))
+            await self._first_token()
+            delay = self.profile.generation_time(response.content)
+            if delay:
+                await asyncio.sleep(delay)
+        self.stats.latencies.append(time.perf_counter() - started)
+        return response
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        """Yield the response in chunks of ``chunk_tokens`` tokens at the profile's token rate."""
+        started = time.perf_counter()
+        async with self._slot():
+            content = _cap(await self._inner.complete(prompt))
+            await self._first_token()
+            for chunk in chunk_text(content, self._chunk_tokens * CHARS_PER_TOKEN):
+                delay = self.profile.generation_time(chunk)
+                if delay:
+                    await asyncio.sleep(delay)
+                yield chunk
+        self.stats.latencies.append(time.perf_counter() - started)
+
+    async def _first_token(self) -> None:
+        profile = self.profile
+        roll = self._rng.random()
+        if roll < profile.timeout_rate:
+            self.stats.timeouts += 1
+            await asyncio.sleep(profile.timeout)
+            raise TimeoutError(f"Simulated LLM timed out after {profile.timeout}s")
+        if roll < profile.timeout_rate + profile.failure_rate:
+            self.stats.failures += 1
+            raise RuntimeError("Simulated LLM request failed")
+        delay = profile.ttft + profile.sample(self._rng)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _slot(self) -> "_Slot":
+        semaphore = None
+        if self.profile.max_concurrency is not None:
+            loop = asyncio.get_running_loop()
+            semaphore = self._slots.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.profile.max_concurrency)
+                self._slots[loop] = semaphore
+        return _Slot(self.stats, semaphore)
+
+
+class _Slot:
+    __slots__ = ("_stats", "_semaphore")
+
+    def __init__(self, stats: SimulatedStats, semaphore: asyncio.Semaphore | None) -> None:
+        self._stats = stats
+        self._semaphore = semaphore
+
+    async def __aenter__(self) -> None:
+        stats = self._stats
+        stats.calls += 1
+        if self._semaphore is not None and not self._semaphore.locked():
+            await self._semaphore.acquire()
+        elif self._semaphore is not None:
+            stats.waiting += 1
+            stats.peak_waiting = max(stats.peak_waiting, stats.waiting)
+            queued = time.perf_counter()
+            try:
+                await self._semaphore.acquire()
+            finally:
+                stats.waiting -= 1
+                stats.queue_seconds += time.perf_counter() - queued
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._stats.in_flight -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+def _cap(response: LLMResponse) -> str:
+    """Cut the answer at the calling agent's ``max_tokens``, as a real server would."""
+    profile = current_profile()
+    if profile is None or profile.max_tokens is None:
+        return response.content
+    return response.content[: profile.max_tokens * CHARS_PER_TOKEN]
+
+
+def token_count(text: str) -> int:
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+def chunk_text(text: str, size: int) -> list[str]:
+    return [text[index : index + size] for index in range(0, len(text), size)] or [""]
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import AsyncIterator
+
+
+class JsonObjectScanner:
+    """Finds where the first balanced top-level JSON object ends in streamed text.
+
+    Text before the opening brace is ignored; braces inside JSON strings
+    (including escaped quotes) do not count.
+    """
+
+    __slots__ = ("_depth", "_in_string", "_escape", "done")
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self.done = False
+
+    def feed(self, chunk: str) -> int | None:
+        """Consume ``chunk``; return the index just past the closing brace once the object completes."""
+        if self.done:
+            return 0
+        for index, char in enumerate(chunk):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                if self._depth:
+                    self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}" and self._depth:
+                self._depth -= 1
+                if not self._depth:
+                    self.done = True
+                    return index + 1
+        return None
+
+
+async def until_json_object(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Pass ``chunks`` through until a balanced top-level JSON object has been received.
+
+    The chunk containing the closing brace is truncated after it and the source
+    is closed, so a streaming backend stops generating trailing prose.
+    """
+    scanner = JsonObjectScanner()
+    try:
+        async for chunk in chunks:
+            end = scanner.feed(chunk)
+            if end is None:
+                yield chunk
+                continue
+            if end:
+                yield chunk[:end]
+            return
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
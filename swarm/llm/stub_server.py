@@ -0,0 +1,482 @@
+"""A local Ollama- and OpenAI-compatible HTTP server answering with MockLLM's role-based responses.
+
+Run it standalone with ``python -m swarm.llm.stub_server --port 11434`` or embed
+it in tests and benchmarks::
+
+    with OllamaStubServer(profile=LatencyProfile(distribution="fixed", latency=0.05)) as server:
+        llm = OllamaLLM("llama3.1", server.url, "/api/generate", timeout=5, retries=1)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterable
+
+from swarm.llm.mock import MockLLM
+from swarm.llm.simulated import CHARS_PER_TOKEN, LatencyProfile, chunk_text, token_count
+
+ENDPOINTS = ("/api/generate", "/api/chat", "/v1/chat/completions")
+OPENAI_CHAT = "/v1/chat/completions"
+
+# Prompt caches kept per model, like a server with this many parallel slots.
+CACHE_SLOTS = 4
+
+
+@dataclass(slots=True)
+class StubStats:
+    requests: int = 0
+    connections: int = 0
+    streamed: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    not_found: int = 0
+    prompt_tokens: int = 0
+    prompt_eval_tokens: int = 0
+    by_path: dict[str, int] = field(default_factory=dict)
+    by_model: dict[str, int] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "connections": self.connections,
+            "streamed": self.streamed,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "not_found": self.not_found,
+            "prompt_tokens": self.prompt_tokens,
+            "prompt_eval_tokens": self.prompt_eval_tokens,
+            "by_path": dict(self.by_path),
+            "by_model": dict(self.by_model),
+        }
+
+
+@dataclass(slots=True)
+class _Answer:
+    model: str
+    prompt: str
+    started_ns: int
+    reason: str
+    evaluated: int
+
+
+class OllamaStubServer:
+    """Serves ``/api/generate`` and ``/api/chat`` with ``stream`` true or false.
+
+    It also answers OpenAI-style ``/v1/chat/completions`` (JSON, or server-sent
+    events when ``stream`` is true) and ``/v1/models``, standing in for
+    llama.cpp server or vLLM.
+
+    Timing follows ``profile`` (the same :class:`LatencyProfile` used by
+    SimulatedLLM): failures answer HTTP 500 and timeouts hang for
+    ``profile.timeout`` seconds before closing the connection. Drop an endpoint
+    from ``endpoints`` to make it answer 404 and exercise client fallbacks.
+    Connections are HTTP/1.1 keep-alive.
+
+    Like Ollama, it renders requests through a chat template, answers the last
+    user message and keeps a prompt cache per model in ``CACHE_SLOTS`` slots.
+    ``prompt_eval_count`` counts only the tokens after the longest prefix a
+    slot already holds, so a chat that resends its earlier turns evaluates
+    only the new one.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        profile: LatencyProfile | None = None,
+        endpoints: Iterable[str] = ENDPOINTS,
+        model: str = "llama3.1",
+        seed: int = 42,
+        chunk_tokens: int = 8,
+    ) -> None:
+        if chunk_tokens < 1:
+            raise ValueError("chunk_tokens must be >= 1")
+        unknown = set(endpoints) - set(ENDPOINTS)
+        if unknown:
+            raise ValueError(f"Unsupported endpoint(s): {', '.join(sorted(unknown))}")
+        self.profile = profile or LatencyProfile(distribution="fixed", latency=0.0)
+        self.endpoints = frozenset(endpoints)
+        self.model = model
+        self.chunk_tokens = chunk_tokens
+        self.stats = StubStats()
+        self._mock = MockLLM(seed=seed)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._forced_failures: list[int] = []
+        self._prompt_caches: dict[str, list[str]] = {}
+        self._slots = (
+            threading.BoundedSemaphore(self.profile.max_concurrency)
+            if self.profile.max_concurrency is not None
+            else None
+        )
+        self._httpd = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "OllamaStubServer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                kwargs={"poll_interval": 0.05},
+                name="ollama-stub",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def serve_forever(self) -> None:
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def fail_next(self, count: int = 1, status: int = 500) -> None:
+        """Answer the next ``count`` requests with ``status`` regardless of the profile."""
+        with self._lock:
+            self._forced_failures.extend([status] * count)
+
+    def __enter__(self) -> "OllamaStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _count(self, path: str) -> int | None:
+        """Record a request and return a forced failure status, if any."""
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.by_path[path] = self.stats.by_path.get(path, 0) + 1
+            if self._forced_failures:
+                self.stats.errors += 1
+                return self._forced_failures.pop(0)
+        return None
+
+    def _roll(self) -> tuple[float, float]:
+        with self._lock:
+            return self._rng.random(), self.profile.sample(self._rng)
+
+    def _prefill(self, model: str, rendered: str, cached_after: str) -> int:
+        """Tokens of ``rendered`` no slot holds; the best slot then holds ``cached_after``."""
+        with self._lock:
+            slots = self._prompt_caches.setdefault(model, [])
+            best, shared = None, 0
+            for index, cached in enumerate(slots):
+                length = _common_prefix(cached, rendered)
+                if length > shared:
+                    best, shared = index, length
+            if best is not None:
+                slots.pop(best)
+            elif len(slots) >= CACHE_SLOTS:
+                slots.pop(0)
+            slots.append(cached_after)
+            evaluated = token_count(rendered[shared:]) if shared < len(rendered) else 1
+            self.stats.prompt_tokens += token_count(rendered)
+            self.stats.prompt_eval_tokens += evaluated
+            return evaluated
+
+
+def _handler_for(server: OllamaStubServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(_StubHandler):
+        stub = server
+
+    return Handler
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    stub: OllamaStubServer
+
+    def setup(self) -> None:
+        super().setup()
+        # Like Ollama's Go server: without this, keep-alive responses written in
+        # several segments stall on Nagle's algorithm and delayed ACKs.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.stub._lock:
+            self.stub.stats.connections += 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return None
+
+    def do_GET(self) -> None:
+        if self.path == "/api/tags":
+            self._send_json(200, {"models": [{"name": self.stub.model, "model": self.stub.model}]})
+            return
+        if self.path == "/v1/models":
+            self._send_json(200, {"object": "list", "data": [{"id": self.stub.model, "object": "model"}]})
+            return
+        self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        stub = self.stub
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if self.path not in stub.endpoints:
+            with stub._lock:
+                stub.stats.not_found += 1
+            self._send_json(404, {"error": f"{self.path} not found"})
+            return
+        forced = stub._count(self.path)
+        if forced is not None:
+            self._send_json(forced, {"error": "stub forced failure"})
+            return
+        try:
+            body = json.loads(raw or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": "invalid JSON body"})
+            return
+        openai = self.path == OPENAI_CHAT
+        if self.path in ("/api/chat", OPENAI_CHAT):
+            messages = [
+                {"role": str(item.get("role", "user")), "content": str(item.get("content", ""))}
+                for item in body.get("messages") or []
+            ]
+        else:
+            messages = [{"role": "user", "content": str(body.get("prompt", ""))}]
+        # Ollama streams unless told otherwise; the OpenAI API does the opposite.
+        stream = body.get("stream") is True if openai else body.get("stream", True) is not False
+        model = str(body.get("model") or stub.model)
+        num_predict = body.get("max_tokens") if openai else (body.get("options") or {}).get("num_predict")
+        with stub._lock:
+            stub.stats.by_model[model] = stub.stats.by_model.get(model, 0) + 1
+
+        if stub._slots is not None:
+            stub._slots.acquire()
+        try:
+            self._answer(messages, stream, model, num_predict)
+        finally:
+            if stub._slots is not None:
+                stub._slots.release()
+
+    def _answer(
+        self, messages: list[dict[str, str]], stream: bool, model: str, num_predict: int | None
+    ) -> None:
+        stub = self.stub
+        profile = stub.profile
+        started = time.perf_counter_ns()
+        roll, latency = stub._roll()
+        if roll < profile.timeout_rate:
+            with stub._lock:
+                stub.stats.timeouts += 1
+            time.sleep(profile.timeout)
+            self.close_connection = True
+            return
+        if roll < profile.timeout_rate + profile.failure_rate:
+            with stub._lock:
+                stub.stats.errors += 1
+            self._send_json(500, {"error": "stub injected failure"})
+            return
+        time.sleep(profile.ttft + latency)
+        last_user = next((item["content"] for item in reversed(messages) if item["role"] == "user"), "")
+        content = stub._mock.respond(last_user)
+        reason = "stop"
+        if num_predict is not None and token_count(content) > int(num_predict):
+            content = content[: int(num_predict) * CHARS_PER_TOKEN]
+            reason = "length"
+        chat = self.path == "/api/chat"
+        rendered = _render(messages)
+        answer = _Answer(
+            model=model,
+            prompt=rendered,
+            started_ns=started,
+            reason=reason,
+            evaluated=stub._prefill(model, rendered, f"{rendered}{content}\n"),
+        )
+        if self.path == OPENAI_CHAT:
+            self._answer_openai(answer, content, stream)
+            return
+        if not stream:
+            time.sleep(profile.generation_time(content))
+            self._send_json(200, self._record(answer, content, chat, True))
+            return
+
+        with stub._lock:
+            stub.stats.streamed += 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in chunk_text(content, stub.chunk_tokens * CHARS_PER_TOKEN):
+            time.sleep(profile.generation_time(chunk))
+            self._write_chunk(self._record(answer, chunk, chat, False))
+        self._write_chunk(self._record(answer, "", chat, True, total=content))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _answer_openai(self, answer: "_Answer", content: str, stream: bool) -> None:
+        stub = self.stub
+        completion_id = f"chatcmpl-{answer.started_ns:x}"
+        created = int(time.time())
+        if not stream:
+            time.sleep(stub.profile.generation_time(content))
+            prompt_tokens, completion_tokens = token_count(answer.prompt), token_count(content)
+            self._send_json(
+                200,
+                {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": answer.model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": answer.reason,
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens,
+                    },
+                },
+            )
+            return
+
+        with stub._lock:
+            stub.stats.streamed += 1
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def event(delta: dict[str, Any], finish_reason: str | None) -> bytes:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": answer.model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            return f"data: {json.dumps(payload)}\n\n".encode("utf-8")
+
+        self._write_raw_chunk(event({"role": "assistant"}, None))
+        for chunk in chunk_text(content, stub.chunk_tokens * CHARS_PER_TOKEN):
+            time.sleep(stub.profile.generation_time(chunk))
+            self._write_raw_chunk(event({"content": chunk}, None))
+        self._write_raw_chunk(event({}, answer.reason))
+        self._write_raw_chunk(b"data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _record(
+        self,
+        answer: "_Answer",
+        text: str,
+        chat: bool,
+        done: bool,
+        total: str | None = None,
+    ) -> dict[str, Any]:
+        record: dict[str, Any] = {
+            "model": answer.model,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if chat:
+            record["message"] = {"role": "assistant", "content": text}
+        else:
+            record["response"] = text
+        record["done"] = done
+        if done:
+            record.update(
+                {
+                    "done_reason": answer.reason,
+                    "total_duration": time.perf_counter_ns() - answer.started_ns,
+                    "prompt_eval_count": answer.evaluated,
+                    "eval_count": token_count(text if total is None else total),
+                }
+            )
+        return record
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _write_chunk(self, record: dict[str, Any]) -> None:
+        self._write_raw_chunk(json.dumps(record).encode("utf-8") + b"\n")
+
+    def _write_raw_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+def _render(messages: list[dict[str, str]]) -> str:
+    """A minimal chat template: each turn tagged with its role, ending where the answer starts."""
+    return "".join(f"<|{item['role']}|>\n{item['content']}\n" for item in messages) + "<|assistant|>\n"
+
+
+def _common_prefix(left: str, right: str) -> int:
+    length = min(len(left), len(right))
+    for index in range(length):
+        if left[index] != right[index]:
+            return index
+    return length
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve an Ollama- and OpenAI-compatible stub backed by MockLLM.")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--model", type=str, default="llama3.1")
+    parser.add_argument(
+        "--endpoint",
+        action="append",
+        choices=ENDPOINTS,
+        default=None,
+        help="Endpoint to serve (repeatable; default all)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="LatencyProfile option (repeatable, e.g. latency=0.5, tokens_per_s=40)",
+    )
+    args = parser.parse_args(argv)
+    options: dict[str, str] = {}
+    for value in args.profile:
+        key, sep, raw = value.partition("=")
+        if not sep:
+            parser.error(f"--profile expects KEY=VALUE, got {value!r}")
+        options[key.strip()] = raw.strip()
+    try:
+        profile = LatencyProfile.from_dict({"distribution": "fixed", "latency": 0.0, **options})
+    except ValueError as exc:
+        parser.error(str(exc))
+    server = OllamaStubServer(
+        host=args.host,
+        port=args.port,
+        profile=profile,
+        endpoints=args.endpoint or ENDPOINTS,
+        model=args.model,
+    )
+    print(f"Ollama stub listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
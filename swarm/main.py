@@ -2,16 +2,28 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import os
 from pathlib import Path
+from typing import Iterable
 
 from swarm.config import SwarmConfig
 from swarm.coordinator import Coordinator
+from swarm.llm import LatencyProfile, LLMProfile
+from swarm.profiling import build_report, profile_call, write_report
+from swarm.runtime import build_agents
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run the AI Swarm coordinator.")
-    parser.add_argument("objective", type=str, help="Objective for the swarm")
+    parser.add_argument("objective", type=str, nargs="?", default=None, help="Objective for the swarm")
     parser.add_argument("--run-id", type=str, default=None, help="Override run identifier")
+    parser.add_argument(
+        "--resume",
+        type=str,
+        default=None,
+        metavar="RUN_ID",
+        help="Resume an interrupted run, executing only its unfinished steps",
+    )
     parser.add_argument("-o", "--output-dir", type=str, default=None, help="Output directory")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     parser.add_argument("--max-steps", type=int, default=None, help="Maximum steps to execute")
@@ -20,14 +32,162 @@ def build_parser() -> argparse.ArgumentParser:
         "--llm-provider",
         type=str,
         default=None,
-        choices=["mock", "ollama"],
+        choices=["mock", "ollama", "openai-compatible", "simulated"],
         help="LLM provider to use",
     )
     parser.add_argument("--ollama-model", type=str, default=None, help="Ollama model name")
-    parser.add_argument("--ollama-url", type=str, default=None, help="Ollama base URL")
+    parser.add_argument(
+        "--ollama-url",
+        action="append",
+        default=[],
+        help="Ollama base URL; repeat to spread calls over several servers",
+    )
+    parser.add_argument(
+        "--route-strategy",
+        type=str,
+        default=None,
+        choices=["least_outstanding", "ewma"],
+        help="How to pick among several --ollama-url servers (default least_outstanding)",
+    )
+    parser.add_argument(
+        "--route-pin-runs",
+        action="store_true",
+        help="Send every call of a run to the same Ollama server to keep its prompt cache warm",
+    )
     parser.add_argument("--ollama-endpoint", type=str, default=None, help="Ollama endpoint")
     parser.add_argument("--ollama-timeout", type=int, default=None, help="Ollama request timeout (s)")
     parser.add_argument("--ollama-retries", type=int, default=None, help="Ollama retry count")
+    parser.add_argument(
+        "--openai-url",
+        type=str,
+        default=None,
+        help="Base URL of an OpenAI-compatible server (llama.cpp, vLLM) for --llm-provider openai-compatible",
+    )
+    parser.add_argument("--openai-model", type=str, default=None, help="Model name sent to that server")
+    parser.add_argument(
+        "--openai-api-key",
+        type=str,
+        default=None,
+        help="Bearer token for the OpenAI-compatible server (defaults to $OPENAI_API_KEY)",
+    )
+    parser.add_argument(
+        "--openai-pool-size",
+        type=int,
+        default=None,
+        help="Max keep-alive connections to the OpenAI-compatible server (default 32)",
+    )
+    parser.add_argument(
+        "--ollama-backoff",
+        type=float,
+        default=None,
+        help="Base delay (s) for jittered exponential backoff between Ollama retries (default 0.5)",
+    )
+    parser.add_argument(
+        "--no-adaptive-timeout",
+        action="store_true",
+        help="Always wait the full --ollama-timeout instead of deriving it from recent latency",
+    )
+    parser.add_argument(
+        "--ollama-chat-sessions",
+        action="store_true",
+        help="Send each agent's calls in a run as turns of one /api/chat conversation",
+    )
+    parser.add_argument(
+        "--ollama-pool-size",
+        type=int,
+        default=None,
+        help="Max keep-alive connections to the Ollama server (default 8)",
+    )
+    parser.add_argument(
+        "--llm-max-concurrency",
+        type=int,
+        default=None,
+        help="Upper bound for the adaptive LLM concurrency limit (default 64)",
+    )
+    parser.add_argument(
+        "--llm-hedge",
+        action="store_true",
+        help="Send a duplicate LLM call when one runs past the usual latency; first answer wins",
+    )
+    parser.add_argument(
+        "--hedge-percentile",
+        type=float,
+        default=None,
+        help="Latency percentile (0-1) after which --llm-hedge sends the duplicate (default 0.95)",
+    )
+    parser.add_argument(
+        "--no-adaptive-limit",
+        action="store_true",
+        help="Send every LLM call straight to the backend instead of through the adaptive limiter",
+    )
+    parser.add_argument(
+        "--llm-stream",
+        action="store_true",
+        help="Stream LLM output, logging each chunk as an llm_chunk event",
+    )
+    parser.add_argument(
+        "--stop-at-json",
+        action="store_true",
+        help="Stream and stop reading once a complete top-level JSON object has arrived",
+    )
+    parser.add_argument(
+        "--simulated-llm",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help=(
+            "Latency profile option for --llm-provider simulated (repeatable, e.g. "
+            "distribution=lognormal, latency=0.8, tokens_per_s=40, max_concurrency=4)"
+        ),
+    )
+    parser.add_argument(
+        "--agent-llm",
+        action="append",
+        default=[],
+        metavar="AGENT:KEY=VALUE",
+        help=(
+            "Per-agent LLM setting (repeatable): model, max_tokens, temperature, stop "
+            "(|-separated) or num_ctx, e.g. critic:model=llama3.2:1b critic:max_tokens=200"
+        ),
+    )
+    parser.add_argument(
+        "--agent-concurrency",
+        action="append",
+        default=[],
+        metavar="AGENT=N",
+        help="Max concurrent steps for an agent (repeatable, e.g. coder=2)",
+    )
+    parser.add_argument(
+        "--event-buffer",
+        type=int,
+        default=None,
+        help="Max events kept in memory per run; older events spill to artifacts/events/<run_id>.jsonl",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Write a Chrome trace of the run to artifacts/traces/<run_id>.trace.json",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the run; writes profile.pstats and profile.txt to the output directory",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        action="store_true",
+        help="Cache LLM responses in swarm.db keyed by provider, model, options and prompt",
+    )
+    parser.add_argument(
+        "--no-llm-coalesce",
+        action="store_true",
+        help="Send concurrent identical prompts separately instead of sharing one request",
+    )
+    parser.add_argument(
+        "--no-step-cache",
+        action="store_true",
+        help="Bypass the step result cache and always invoke agents",
+    )
     parser.add_argument("--enable-http", action="store_true", help="Enable HTTP for research")
     parser.add_argument("--log-llm", action="store_true", help="Log LLM prompts/responses")
     parser.add_argument(
@@ -63,9 +223,11 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if not args.objective and not args.resume:
+        parser.error("an objective is required unless --resume is given")
 
     repo_root = Path(__file__).resolve().parents[1]
     config = SwarmConfig.from_repo_root(repo_root)
@@ -74,13 +236,76 @@ def main() -> int:
     if args.ollama_model:
         config.ollama_model = args.ollama_model
     if args.ollama_url:
-        config.ollama_url = args.ollama_url
+        config.ollama_url = args.ollama_url[0]
+        config.ollama_urls = list(args.ollama_url) if len(args.ollama_url) > 1 else []
+    if args.route_strategy:
+        config.llm_route_strategy = args.route_strategy
+    if args.route_pin_runs:
+        config.llm_route_pin_runs = True
     if args.ollama_endpoint:
         config.ollama_endpoint = args.ollama_endpoint
     if args.ollama_timeout is not None:
         config.ollama_timeout = args.ollama_timeout
     if args.ollama_retries is not None:
         config.ollama_retries = args.ollama_retries
+    if args.openai_url:
+        config.openai_url = args.openai_url
+    if args.openai_model:
+        config.openai_model = args.openai_model
+    config.openai_api_key = args.openai_api_key or os.environ.get("OPENAI_API_KEY") or None
+    if args.openai_pool_size is not None:
+        if args.openai_pool_size < 1:
+            parser.error("--openai-pool-size must be >= 1")
+        config.openai_pool_size = args.openai_pool_size
+    if args.ollama_backoff is not None:
+        if args.ollama_backoff < 0:
+            parser.error("--ollama-backoff must be >= 0")
+        config.ollama_backoff = args.ollama_backoff
+    if args.no_adaptive_timeout:
+        config.ollama_adaptive_timeout = False
+    if args.ollama_chat_sessions:
+        config.ollama_chat_sessions = True
+    if args.ollama_pool_size is not None:
+        if args.ollama_pool_size < 1:
+            parser.error("--ollama-pool-size must be >= 1")
+        config.ollama_pool_size = args.ollama_pool_size
+    if args.llm_max_concurrency is not None:
+        if args.llm_max_concurrency < 1:
+            parser.error("--llm-max-concurrency must be >= 1")
+        config.llm_limit_max = args.llm_max_concurrency
+    if args.llm_hedge:
+        config.llm_hedge = True
+    if args.hedge_percentile is not None:
+        if not 0 < args.hedge_percentile < 1:
+            parser.error("--hedge-percentile must be between 0 and 1")
+        config.llm_hedge_percentile = args.hedge_percentile
+    if args.no_adaptive_limit:
+        config.llm_adaptive_limit = False
+    if args.llm_stream:
+        config.llm_stream = True
+    if args.stop_at_json:
+        config.llm_stop_at_json = True
+    if args.simulated_llm:
+        config.simulated_llm = _parse_options(parser, "--simulated-llm", args.simulated_llm)
+        try:
+            LatencyProfile.from_dict(config.simulated_llm)
+        except ValueError as exc:
+            parser.error(f"--simulated-llm: {exc}")
+    if args.agent_llm:
+        config.agent_llm = _parse_agent_llm(parser, args.agent_llm, build_agents(config))
+    if args.agent_concurrency:
+        config.agent_concurrency = _parse_agent_limits(parser, args.agent_concurrency)
+    if args.event_buffer is not None:
+        config.event_buffer_size = args.event_buffer
+    if args.trace:
+        config.trace = True
+    if args.llm_cache:
+        config.llm_cache = True
+    if args.no_llm_coalesce:
+        config.llm_coalesce = False
+    if args.no_step_cache or args.profile:
+        # Cached steps skip agent work entirely, which would hide it from the profile.
+        config.step_cache = False
     if args.enable_http:
         config.enable_http = True
     if args.log_llm:
@@ -96,18 +321,82 @@ def main() -> int:
     if args.search_max_queries is not None:
         config.search_max_queries = args.search_max_queries
     coordinator = Coordinator(config=config)
-
-    result = asyncio.run(
-        coordinator.run(
-            objective=args.objective,
-            run_id=args.run_id,
-            output_dir=args.output_dir,
-            max_steps=args.max_steps,
-            dry_run=args.dry_run,
-            verbose=args.verbose,
-        )
-    )
+    try:
+        if args.resume:
+            job = coordinator.resume(
+                run_id=args.resume,
+                output_dir=args.output_dir,
+                max_steps=args.max_steps,
+                dry_run=args.dry_run,
+                verbose=args.verbose,
+            )
+        else:
+            job = coordinator.run(
+                objective=args.objective,
+                run_id=args.run_id,
+                output_dir=args.output_dir,
+                max_steps=args.max_steps,
+                dry_run=args.dry_run,
+                verbose=args.verbose,
+            )
+        if args.profile:
+            result, profiler, wall_seconds, cpu_seconds = profile_call(lambda: asyncio.run(job))
+            report = write_report(
+                profiler,
+                build_report(profiler, wall_seconds, cpu_seconds),
+                Path(result["output_dir"]),
+            )
+        else:
+            result = asyncio.run(job)
+            report = None
+    finally:
+        coordinator.close()
 
     print(result["final"])
     print(f"Output: {result['output_dir']}")
+    if result.get("trace_path"):
+        print(f"Trace: {result['trace_path']}")
+    if report is not None:
+        print(f"Profile: {report.summary_path} ({report.stats_path.name})")
     return 0
+
+
+def _parse_agent_limits(parser: argparse.ArgumentParser, values: list[str]) -> dict[str, int]:
+    limits: dict[str, int] = {}
+    for value in values:
+        agent, sep, raw_limit = value.partition("=")
+        if not sep or not agent or not raw_limit.isdigit() or int(raw_limit) < 1:
+            parser.error(f"--agent-concurrency expects AGENT=N with N >= 1, got {value!r}")
+        limits[agent.strip()] = int(raw_limit)
+    return limits
+
+
+def _parse_agent_llm(
+    parser: argparse.ArgumentParser, values: list[str], agents: Iterable[str]
+) -> dict[str, dict[str, str]]:
+    known = sorted(agents)
+    profiles: dict[str, dict[str, str]] = {}
+    for value in values:
+        agent, sep, option = value.partition(":")
+        key, eq, raw = option.partition("=")
+        if not sep or not eq or not agent.strip() or not key.strip():
+            parser.error(f"--agent-llm expects AGENT:KEY=VALUE, got {value!r}")
+        if agent.strip() not in known:
+            parser.error(f"--agent-llm: unknown agent {agent.strip()!r} (choose from {', '.join(known)})")
+        profiles.setdefault(agent.strip(), {})[key.strip()] = raw
+    for agent, options in profiles.items():
+        try:
+            LLMProfile.from_dict(options)
+        except ValueError as exc:
+            parser.error(f"--agent-llm {agent}: {exc}")
+    return profiles
+
+
+def _parse_options(parser: argparse.ArgumentParser, flag: str, values: list[str]) -> dict[str, str]:
+    options: dict[str, str] = {}
+    for value in values:
+        key, sep, raw = value.partition("=")
+        if not sep or not key.strip():
+            parser.error(f"{flag} expects KEY=VALUE, got {value!r}")
+        options[key.strip()] = raw.strip()
+    return options
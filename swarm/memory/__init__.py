@@ -1,4 +1,5 @@
 from .short_term import ShortTermMemory
 from .persistent import PersistentMemory
+from .cache import CacheStats, SqliteCache
 
-__all__ = ["ShortTermMemory", "PersistentMemory"]
+__all__ = ["ShortTermMemory", "PersistentMemory", "CacheStats", "SqliteCache"]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class SqliteCache:
+    """String cache in SQLite with LRU eviction by entry count and optional TTL (seconds)."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        table: str,
+        max_entries: int = 1000,
+        ttl: float | None = None,
+    ) -> None:
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", table):
+            raise ValueError(f"Invalid cache table name: {table}")
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._table = table
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._conn = sqlite3.connect(db_path)
+        self.stats = CacheStats()
+        self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_last_used ON {table} (last_used)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> str | None:
+        row = self._conn.execute(
+            f"SELECT value, created_at FROM {self._table} WHERE key = ?", (key,)
+        ).fetchone()
+        now = time.time()
+        if row is not None and self._ttl is not None and now - row[1] > self._ttl:
+            self._conn.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+            self._conn.commit()
+            self.stats.evictions += 1
+            row = None
+        if row is None:
+            self.stats.misses += 1
+            return None
+        self._conn.execute(f"UPDATE {self._table} SET last_used = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        self.stats.hits += 1
+        return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        now = time.time()
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO {self._table} (key, value, created_at, last_used) VALUES (?, ?, ?, ?)",
+            (key, value, now, now),
+        )
+        self.stats.writes += 1
+        self._evict(now)
+        self._conn.commit()
+
+    def clear(self) -> None:
+        self._conn.execute(f"DELETE FROM {self._table}")
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        return self._conn.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()[0]
+
+    def _evict(self, now: float) -> None:
+        if self._ttl is not None:
+            expired = self._conn.execute(
+                f"DELETE FROM {self._table} WHERE created_at < ?", (now - self._ttl,)
+            )
+            self.stats.evictions += expired.rowcount
+        overflow = self._conn.execute(
+            f"""
+            DELETE FROM {self._table} WHERE key IN (
+                SELECT key FROM {self._table} ORDER BY last_used DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self._max_entries,),
+        )
+        self.stats.evictions += overflow.rowcount
+
+    def close(self) -> None:
+        self._conn.close()
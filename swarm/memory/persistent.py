@@ -4,6 +4,8 @@ import sqlite3
 from pathlib import Path
 from typing import Any, Iterable
 
+from swarm.tracing import span
+
 
 class PersistentMemory:
     def __init__(self, db_path: Path) -> None:
@@ -44,28 +46,154 @@ class PersistentMemory:
             )
             """
         )
-        self._conn.commit()
-
-    def put_run(self, run_id: str, objective: str, created_at: str) -> None:
         self._conn.execute(
-            "INSERT OR REPLACE INTO runs (run_id, objective, created_at) VALUES (?, ?, ?)",
-            (run_id, objective, created_at),
+            """
+            CREATE TABLE IF NOT EXISTS step_timings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                step_id TEXT NOT NULL,
+                agent TEXT NOT NULL,
+                duration REAL NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """
         )
-        self._conn.commit()
-
-    def put_message(self, run_id: str, agent: str, role: str, content: str, created_at: str) -> None:
         self._conn.execute(
-            "INSERT INTO messages (run_id, agent, role, content, created_at) VALUES (?, ?, ?, ?, ?)",
-            (run_id, agent, role, content, created_at),
+            "CREATE INDEX IF NOT EXISTS idx_step_timings_agent ON step_timings (agent, id)"
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                run_id TEXT PRIMARY KEY,
+                plan TEXT NOT NULL,
+                output_dir TEXT NOT NULL,
+                short_term TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS step_results (
+                run_id TEXT NOT NULL,
+                step_id TEXT NOT NULL,
+                agent TEXT NOT NULL,
+                task TEXT NOT NULL,
+                output TEXT NOT NULL,
+                critic TEXT,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (run_id, step_id)
+            )
+            """
         )
         self._conn.commit()
 
+    def put_run(self, run_id: str, objective: str, created_at: str) -> None:
+        with span("db.put_run"):
+            self._conn.execute(
+                "INSERT OR REPLACE INTO runs (run_id, objective, created_at) VALUES (?, ?, ?)",
+                (run_id, objective, created_at),
+            )
+            self._conn.commit()
+
+    def put_message(self, run_id: str, agent: str, role: str, content: str, created_at: str) -> None:
+        with span("db.put_message"):
+            self._conn.execute(
+                "INSERT INTO messages (run_id, agent, role, content, created_at) VALUES (?, ?, ?, ?, ?)",
+                (run_id, agent, role, content, created_at),
+            )
+            self._conn.commit()
+
     def put_artifact(self, run_id: str, name: str, path: str, created_at: str) -> None:
-        self._conn.execute(
-            "INSERT INTO artifacts (run_id, name, path, created_at) VALUES (?, ?, ?, ?)",
-            (run_id, name, path, created_at),
+        with span("db.put_artifact"):
+            self._conn.execute(
+                "INSERT INTO artifacts (run_id, name, path, created_at) VALUES (?, ?, ?, ?)",
+                (run_id, name, path, created_at),
+            )
+            self._conn.commit()
+
+    def put_step_timing(
+        self, run_id: str, step_id: str, agent: str, duration: float, created_at: str
+    ) -> None:
+        with span("db.put_step_timing"):
+            self._conn.execute(
+                "INSERT INTO step_timings (run_id, step_id, agent, duration, created_at) VALUES (?, ?, ?, ?, ?)",
+                (run_id, step_id, agent, duration, created_at),
+            )
+            self._conn.commit()
+
+    def agent_durations(self, window: int = 50) -> dict[str, float]:
+        """Mean step duration in seconds per agent over its last ``window`` steps."""
+        rows = self._conn.execute(
+            """
+            SELECT agent, AVG(duration) FROM (
+                SELECT agent, duration,
+                       ROW_NUMBER() OVER (PARTITION BY agent ORDER BY id DESC) AS recent
+                FROM step_timings
+            )
+            WHERE recent <= ?
+            GROUP BY agent
+            """,
+            (window,),
         )
-        self._conn.commit()
+        return {agent: float(duration) for agent, duration in rows}
+
+    def put_checkpoint(
+        self, run_id: str, plan: str, output_dir: str, short_term: str, updated_at: str
+    ) -> None:
+        with span("db.put_checkpoint"):
+            self._conn.execute("DELETE FROM step_results WHERE run_id = ?", (run_id,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (run_id, plan, output_dir, short_term, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (run_id, plan, output_dir, short_term, updated_at),
+            )
+            self._conn.commit()
+
+    def update_checkpoint_state(self, run_id: str, short_term: str, updated_at: str) -> None:
+        with span("db.update_checkpoint_state"):
+            self._conn.execute(
+                "UPDATE checkpoints SET short_term = ?, updated_at = ? WHERE run_id = ?",
+                (short_term, updated_at, run_id),
+            )
+            self._conn.commit()
+
+    def get_checkpoint(self, run_id: str) -> dict[str, Any] | None:
+        row = self._conn.execute(
+            "SELECT plan, output_dir, short_term, updated_at FROM checkpoints WHERE run_id = ?",
+            (run_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return {"plan": row[0], "output_dir": row[1], "short_term": row[2], "updated_at": row[3]}
+
+    def put_step_result(
+        self,
+        run_id: str,
+        step_id: str,
+        agent: str,
+        task: str,
+        output: str,
+        critic: str | None,
+        created_at: str,
+    ) -> None:
+        with span("db.put_step_result"):
+            self._conn.execute(
+                "INSERT OR REPLACE INTO step_results "
+                "(run_id, step_id, agent, task, output, critic, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (run_id, step_id, agent, task, output, critic, created_at),
+            )
+            self._conn.commit()
+
+    def list_step_results(self, run_id: str) -> list[dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT step_id, agent, task, output, critic FROM step_results WHERE run_id = ? ORDER BY rowid",
+            (run_id,),
+        )
+        return [
+            {"step_id": row[0], "agent": row[1], "task": row[2], "output": row[3], "critic": row[4]}
+            for row in rows
+        ]
 
     def list_messages(self, run_id: str) -> Iterable[tuple[str, str, str]]:
         rows = self._conn.execute(
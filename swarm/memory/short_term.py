@@ -16,3 +16,14 @@ class ShortTermMemory:
 
     def list(self, run_id: str, agent: str) -> dict[str, Any]:
         return dict(self._store.get((run_id, agent), {}))
+
+    def snapshot(self, run_id: str) -> dict[str, dict[str, Any]]:
+        return {
+            agent: dict(values)
+            for (stored_run, agent), values in self._store.items()
+            if stored_run == run_id
+        }
+
+    def restore(self, run_id: str, snapshot: dict[str, dict[str, Any]]) -> None:
+        for agent, values in snapshot.items():
+            self._store[(run_id, agent)].update(values)
@@ -0,0 +1,28 @@
+from .client import HttpClient, HttpError, HttpResponse, PoolStats, StreamingResponse, shared_client
+from .resilience import (
+    AdaptiveTimeout,
+    BreakerStats,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    RetryStats,
+    is_retryable,
+    shared_breaker,
+)
+
+__all__ = [
+    "HttpClient",
+    "HttpError",
+    "HttpResponse",
+    "PoolStats",
+    "StreamingResponse",
+    "shared_client",
+    "AdaptiveTimeout",
+    "BreakerStats",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RetryPolicy",
+    "RetryStats",
+    "is_retryable",
+    "shared_breaker",
+]
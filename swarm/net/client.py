@@ -0,0 +1,572 @@
+from __future__ import annotations
+
+import asyncio
+import json as jsonlib
+import ssl
+import threading
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+from urllib.parse import urljoin, urlsplit
+
+DEFAULT_USER_AGENT = "codex-swarm/0.1"
+_READ_SIZE = 64 * 1024
+_MAX_HEADERS = 100
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Dropped when a redirect leaves the original origin.
+_CREDENTIAL_HEADERS = {"authorization", "cookie", "proxy-authorization"}
+
+
+class HttpError(RuntimeError):
+    """An HTTP response with a 4xx/5xx status, raised by callers that need one."""
+
+    def __init__(self, status: int, url: str, body: bytes = b"") -> None:
+        super().__init__(f"HTTP {status} from {url}")
+        self.status = status
+        self.url = url
+        self.body = body
+
+
+@dataclass(slots=True)
+class PoolStats:
+    requests: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+    connections_closed: int = 0
+    open_connections: int = 0
+    peak_open_connections: int = 0
+    waits: int = 0
+    wait_seconds: float = 0.0
+
+    @property
+    def reuse_rate(self) -> float:
+        total = self.connections_opened + self.connections_reused
+        return self.connections_reused / total if total else 0.0
+
+    def merge(self, other: "PoolStats") -> None:
+        self.requests += other.requests
+        self.connections_opened += other.connections_opened
+        self.connections_reused += other.connections_reused
+        self.connections_closed += other.connections_closed
+        self.open_connections += other.open_connections
+        self.peak_open_connections += other.peak_open_connections
+        self.waits += other.waits
+        self.wait_seconds += other.wait_seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+            "connections_closed": self.connections_closed,
+            "open_connections": self.open_connections,
+            "peak_open_connections": self.peak_open_connections,
+            "reuse_rate": round(self.reuse_rate, 4),
+            "waits": self.waits,
+            "wait_seconds": round(self.wait_seconds, 6),
+        }
+
+
+@dataclass(slots=True)
+class HttpResponse:
+    status: int
+    reason: str
+    headers: dict[str, str]
+    body: bytes
+    url: str
+
+    def text(self, encoding: str = "utf-8") -> str:
+        return self.body.decode(encoding, errors="replace")
+
+    def json(self) -> Any:
+        return jsonlib.loads(self.body)
+
+
+@dataclass(slots=True)
+class _Origin:
+    scheme: str
+    host: str
+    port: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.scheme}://{self.host}:{self.port}"
+
+
+class _Connection:
+    __slots__ = ("reader", "writer", "idle_since")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.idle_since = 0.0
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+@dataclass(slots=True)
+class _Pool:
+    """Keep-alive connections to one origin on one event loop."""
+
+    origin: _Origin
+    stats: PoolStats
+    slots: asyncio.Semaphore
+    idle: deque[_Connection] = field(default_factory=deque)
+
+
+class StreamingResponse:
+    """A response whose body is read incrementally.
+
+    The connection goes back to the pool once the body has been read to the
+    end; closing the response earlier discards the connection instead.
+    """
+
+    def __init__(
+        self,
+        client: "HttpClient",
+        pool: _Pool,
+        connection: _Connection,
+        status: int,
+        reason: str,
+        headers: dict[str, str],
+        url: str,
+        method: str,
+        keep_alive: bool,
+        timeout: float | None,
+    ) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.url = url
+        self._client = client
+        self._pool = pool
+        self._connection: _Connection | None = connection
+        self._timeout = timeout
+        self._keep_alive = keep_alive
+        self._chunked = "chunked" in headers.get("transfer-encoding", "").lower()
+        length = headers.get("content-length")
+        self._remaining = int(length) if length is not None and not self._chunked else None
+        self._complete = method == "HEAD" or status in (204, 304) or 100 <= status < 200
+        if self._complete:
+            self._remaining = 0
+        elif not self._chunked and self._remaining is None:
+            # Body delimited by the server closing the connection.
+            self._keep_alive = False
+        encoding = headers.get("content-encoding", "").strip().lower()
+        # wbits=47 accepts both gzip and zlib-wrapped deflate streams.
+        self._decoder = zlib.decompressobj(47) if encoding in {"gzip", "x-gzip", "deflate"} else None
+
+    async def iter_bytes(self) -> AsyncIterator[bytes]:
+        """Yield the body as it arrives, decompressing gzip or deflate content."""
+        decoder = self._decoder
+        while True:
+            data = await self._read_next()
+            if not data:
+                break
+            if decoder is not None:
+                try:
+                    data = decoder.decompress(data)
+                except zlib.error as exc:
+                    raise ConnectionError(f"Invalid compressed response body: {exc}") from exc
+                if not data:
+                    continue
+            yield data
+        if decoder is not None:
+            tail = decoder.flush()
+            if tail:
+                yield tail
+
+    async def iter_lines(self) -> AsyncIterator[bytes]:
+        pending = b""
+        async for data in self.iter_bytes():
+            pending += data
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                yield line
+        if pending:
+            yield pending
+
+    async def read(self) -> bytes:
+        parts = [data async for data in self.iter_bytes()]
+        return b"".join(parts)
+
+    async def aclose(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        self._client._release(self._pool, connection, self._complete and self._keep_alive)
+
+    async def __aenter__(self) -> "StreamingResponse":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _read_next(self) -> bytes:
+        connection = self._connection
+        if self._complete or connection is None:
+            return b""
+        reader = connection.reader
+        try:
+            async with asyncio.timeout(self._timeout):
+                if self._chunked:
+                    size_line = await reader.readuntil(b"\r\n")
+                    size = int(size_line.split(b";", 1)[0].strip(), 16)
+                    if size == 0:
+                        # Skip trailers up to the blank line ending the message.
+                        while (await reader.readuntil(b"\r\n")) != b"\r\n":
+                            pass
+                        return self._finish()
+                    data = await reader.readexactly(size + 2)
+                    return data[:-2]
+                if self._remaining is not None:
+                    if self._remaining == 0:
+                        return self._finish()
+                    data = await reader.read(min(self._remaining, _READ_SIZE))
+                    if not data:
+                        raise ConnectionError("Connection closed before the response body was complete")
+                    self._remaining -= len(data)
+                    if self._remaining == 0:
+                        self._complete = True
+                    return data
+                data = await reader.read(_READ_SIZE)
+                if not data:
+                    return self._finish()
+                return data
+        except asyncio.IncompleteReadError as exc:
+            raise ConnectionError("Connection closed before the response body was complete") from exc
+
+    def _finish(self) -> bytes:
+        self._complete = True
+        return b""
+
+
+class HttpClient:
+    """A small asyncio HTTP/1.1 client with a bounded keep-alive pool per origin.
+
+    ``max_per_host`` bounds open connections per origin (override it per base
+    URL with :meth:`set_limit`); requests beyond it wait for a free
+    connection. Idle connections are reused until ``keepalive_expiry``
+    seconds old. ``timeout`` applies to connecting and to each read.
+    Redirects are followed and gzip/deflate bodies decoded transparently.
+    Connections belong to the event loop that opened them; one client may be
+    used from several threads, each running its own loop.
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = 10,
+        keepalive_expiry: float = 30.0,
+        timeout: float | None = 30.0,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ) -> None:
+        if max_per_host < 1:
+            raise ValueError("max_per_host must be >= 1")
+        self.max_per_host = max_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self._limits: dict[str, int] = {}
+        self._stats: dict[str, PoolStats] = {}
+        self._pools: dict[tuple[asyncio.AbstractEventLoop, str], _Pool] = {}
+        # Guards the pool and stats maps; each pool is only used from its own loop's thread.
+        self._lock = threading.Lock()
+        self._ssl: ssl.SSLContext | None = None
+
+    def set_limit(self, base_url: str, limit: int) -> None:
+        """Bound the pool for ``base_url``'s origin; applies to pools opened afterwards."""
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+        self._limits[_origin(base_url).key] = limit
+
+    def stats(self, base_url: str | None = None) -> PoolStats:
+        with self._lock:
+            if base_url is not None:
+                return self._stats.setdefault(_origin(base_url).key, PoolStats())
+            pools = list(self._stats.values())
+        total = PoolStats()
+        for stats in pools:
+            total.merge(stats)
+        return total
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        json: Any = None,
+        timeout: float | None = None,
+        follow_redirects: bool = True,
+    ) -> HttpResponse:
+        response = await self.open(
+            method,
+            url,
+            body=body,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+            follow_redirects=follow_redirects,
+        )
+        async with response:
+            data = await response.read()
+        return HttpResponse(response.status, response.reason, response.headers, data, response.url)
+
+    async def open(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        json: Any = None,
+        timeout: float | None = None,
+        follow_redirects: bool = True,
+        max_redirects: int = 5,
+    ) -> StreamingResponse:
+        """Send a request and return once the status line and headers have arrived.
+
+        Redirects are followed (303, and 301/302 after a non-GET, switch to GET
+        without a body); ``response.url`` is the final URL.
+        """
+        method = method.upper()
+        timeout = self.timeout if timeout is None else timeout
+        headers = dict(headers or {})
+        if json is not None:
+            body = jsonlib.dumps(json).encode("utf-8")
+            headers = {"Content-Type": "application/json", **headers}
+        for _ in range(max_redirects + 1):
+            response = await self._open_once(method, url, body, headers, timeout)
+            location = response.headers.get("location")
+            if not follow_redirects or response.status not in _REDIRECT_STATUSES or not location:
+                return response
+            # Drain the redirect body so its connection can go back to the pool.
+            await response.read()
+            await response.aclose()
+            next_url = urljoin(url, location)
+            if response.status == 303 or (response.status in (301, 302) and method not in {"GET", "HEAD"}):
+                method = "GET" if method != "HEAD" else method
+                body = None
+                headers = {
+                    name: value for name, value in headers.items() if name.lower() != "content-type"
+                }
+            if _origin(next_url).key != _origin(url).key:
+                headers = {
+                    name: value
+                    for name, value in headers.items()
+                    if name.lower() not in _CREDENTIAL_HEADERS
+                }
+            url = next_url
+        raise ConnectionError(f"Too many redirects (> {max_redirects}) ending at {url}")
+
+    async def _open_once(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float | None,
+    ) -> StreamingResponse:
+        parts = urlsplit(url)
+        origin = _origin(url)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        request = self._encode_request(method, origin, target, headers, body)
+
+        pool = self._pool(origin)
+        pool.stats.requests += 1
+        await self._acquire_slot(pool)
+        try:
+            while True:
+                connection, reused = self._idle_connection(pool)
+                if connection is None:
+                    connection = await self._connect(pool, timeout)
+                try:
+                    status, reason, response_headers, keep_alive = await self._send(
+                        connection, request, timeout
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError) as exc:
+                    self._discard(pool, connection, release=False)
+                    if reused:
+                        # The server closed an idle keep-alive connection; retry on a fresh one.
+                        continue
+                    raise ConnectionError(f"Connection to {origin.key} failed: {exc}") from exc
+                except BaseException:
+                    self._discard(pool, connection, release=False)
+                    raise
+                return StreamingResponse(
+                    self,
+                    pool,
+                    connection,
+                    status,
+                    reason,
+                    response_headers,
+                    url,
+                    method,
+                    keep_alive,
+                    timeout,
+                )
+        except BaseException:
+            pool.slots.release()
+            raise
+
+    async def aclose(self) -> None:
+        """Close idle connections opened on the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pools = [self._pools.pop(key) for key in list(self._pools) if key[0] is loop]
+        for pool in pools:
+            while pool.idle:
+                self._discard(pool, pool.idle.pop(), release=False)
+
+    def _pool(self, origin: _Origin) -> _Pool:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pool = self._pools.get((loop, origin.key))
+            if pool is None:
+                self._forget_closed_loops()
+                pool = _Pool(
+                    origin=origin,
+                    stats=self._stats.setdefault(origin.key, PoolStats()),
+                    slots=asyncio.Semaphore(self._limits.get(origin.key, self.max_per_host)),
+                )
+                self._pools[(loop, origin.key)] = pool
+        return pool
+
+    def _forget_closed_loops(self) -> None:
+        """Drop pools of event loops that have closed; the caller holds ``_lock``."""
+        for (loop, key), pool in list(self._pools.items()):
+            if loop.is_closed():
+                pool.stats.open_connections -= len(pool.idle)
+                pool.stats.connections_closed += len(pool.idle)
+                pool.idle.clear()
+                del self._pools[(loop, key)]
+
+    async def _acquire_slot(self, pool: _Pool) -> None:
+        if not pool.slots.locked():
+            await pool.slots.acquire()
+            return
+        pool.stats.waits += 1
+        started = time.perf_counter()
+        try:
+            await pool.slots.acquire()
+        finally:
+            pool.stats.wait_seconds += time.perf_counter() - started
+
+    def _idle_connection(self, pool: _Pool) -> tuple[_Connection | None, bool]:
+        now = time.monotonic()
+        while pool.idle:
+            connection = pool.idle.pop()
+            if now - connection.idle_since > self.keepalive_expiry or connection.reader.at_eof():
+                self._discard(pool, connection, release=False)
+                continue
+            pool.stats.connections_reused += 1
+            return connection, True
+        return None, False
+
+    async def _connect(self, pool: _Pool, timeout: float | None) -> _Connection:
+        origin = pool.origin
+        ssl_context = None
+        if origin.scheme == "https":
+            if self._ssl is None:
+                self._ssl = ssl.create_default_context()
+            ssl_context = self._ssl
+        try:
+            async with asyncio.timeout(timeout):
+                reader, writer = await asyncio.open_connection(
+                    origin.host, origin.port, ssl=ssl_context, limit=_READ_SIZE
+                )
+        except TimeoutError as exc:
+            raise TimeoutError(f"Timed out connecting to {origin.key}") from exc
+        stats = pool.stats
+        stats.connections_opened += 1
+        stats.open_connections += 1
+        stats.peak_open_connections = max(stats.peak_open_connections, stats.open_connections)
+        return _Connection(reader, writer)
+
+    async def _send(
+        self, connection: _Connection, request: bytes, timeout: float | None
+    ) -> tuple[int, str, dict[str, str], bool]:
+        connection.writer.write(request)
+        async with asyncio.timeout(timeout):
+            await connection.writer.drain()
+            status_line = await connection.reader.readuntil(b"\r\n")
+            headers: dict[str, str] = {}
+            while True:
+                line = await connection.reader.readuntil(b"\r\n")
+                if line == b"\r\n":
+                    break
+                if len(headers) >= _MAX_HEADERS:
+                    raise ConnectionError("Too many response headers")
+                name, _, value = line.decode("latin-1").partition(":")
+                key = name.strip().lower()
+                value = value.strip()
+                headers[key] = f"{headers[key]}, {value}" if key in headers else value
+        version, _, rest = status_line.decode("latin-1").strip().partition(" ")
+        code, _, reason = rest.partition(" ")
+        if not version.startswith("HTTP/") or not code.isdigit():
+            raise ConnectionError(f"Malformed status line: {status_line!r}")
+        tokens = {token.strip().lower() for token in headers.get("connection", "").split(",")}
+        keep_alive = "close" not in tokens and (version == "HTTP/1.1" or "keep-alive" in tokens)
+        return int(code), reason, headers, keep_alive
+
+    def _release(self, pool: _Pool, connection: _Connection, reusable: bool) -> None:
+        if reusable and not connection.writer.is_closing():
+            connection.idle_since = time.monotonic()
+            pool.idle.append(connection)
+            pool.slots.release()
+        else:
+            self._discard(pool, connection)
+
+    def _discard(self, pool: _Pool, connection: _Connection, release: bool = True) -> None:
+        connection.close()
+        pool.stats.open_connections -= 1
+        pool.stats.connections_closed += 1
+        if release:
+            pool.slots.release()
+
+    def _encode_request(
+        self,
+        method: str,
+        origin: _Origin,
+        target: str,
+        headers: dict[str, str],
+        body: bytes | None,
+    ) -> bytes:
+        default_port = 443 if origin.scheme == "https" else 80
+        host = origin.host if origin.port == default_port else f"{origin.host}:{origin.port}"
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host}"]
+        present = {name.lower() for name in headers}
+        if "user-agent" not in present:
+            lines.append(f"User-Agent: {self.user_agent}")
+        if "accept-encoding" not in present:
+            lines.append("Accept-Encoding: gzip, deflate")
+        if "connection" not in present:
+            lines.append("Connection: keep-alive")
+        if body is not None or method in {"POST", "PUT", "PATCH"}:
+            lines.append(f"Content-Length: {len(body or b'')}")
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b"")
+
+
+_SHARED: HttpClient | None = None
+
+
+def shared_client() -> HttpClient:
+    """The process-wide client, so every run talking to one origin shares its pool."""
+    global _SHARED
+    if _SHARED is None:
+        _SHARED = HttpClient()
+    return _SHARED
+
+
+def _origin(url: str) -> _Origin:
+    parts = urlsplit(url)
+    scheme = (parts.scheme or "http").lower()
+    if scheme not in {"http", "https"}:
+        raise ValueError(f"Unsupported URL scheme: {scheme!r}")
+    if not parts.hostname:
+        raise ValueError(f"URL has no host: {url!r}")
+    port = parts.port or (443 if scheme == "https" else 80)
+    return _Origin(scheme, parts.hostname, port)
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from swarm.net.client import HttpError
+
+# Statuses worth retrying: the request may well succeed once the server recovers.
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(RuntimeError):
+    def __init__(self, key: str, retry_in: float) -> None:
+        super().__init__(f"circuit open for {key}; next probe in {retry_in:.1f}s")
+        self.key = key
+        self.retry_in = retry_in
+
+
+@dataclass(slots=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter.
+
+    Retry ``n`` (0-based) sleeps a uniform random time in
+    ``[0, min(max_delay, base_delay * multiplier**n)]``, so callers that failed
+    together do not come back together.
+    """
+
+    retries: int = 1
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    multiplier: float = 2.0
+
+    def __post_init__(self) -> None:
+        if self.retries < 0:
+            raise ValueError("retries must be >= 0")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("base_delay and max_delay must be >= 0")
+        if self.multiplier < 1:
+            raise ValueError("multiplier must be >= 1")
+
+    def delay(self, retry: int, rng: random.Random | None = None) -> float:
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier**retry)
+        return (rng or random).uniform(0.0, ceiling)
+
+
+@dataclass(slots=True)
+class RetryStats:
+    attempts: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    backoff_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "backoff_seconds": round(self.backoff_seconds, 4),
+        }
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, HttpError):
+        return exc.status in RETRYABLE_STATUSES
+    return isinstance(exc, (TimeoutError, OSError))
+
+
+class AdaptiveTimeout:
+    """Per-request timeout from the latency of recent successful calls.
+
+    Once ``min_samples`` latencies are known the timeout is ``multiplier``
+    times their ``percentile``, kept within ``[floor, ceiling]``; until then it
+    is ``ceiling``. Each retry doubles it (still capped at ``ceiling``) so a
+    slow but healthy call is not cut off on every attempt.
+    """
+
+    def __init__(
+        self,
+        ceiling: float,
+        floor: float = 1.0,
+        percentile: float = 0.99,
+        multiplier: float = 3.0,
+        min_samples: int = 20,
+        window: int = 200,
+    ) -> None:
+        if not 0 < percentile <= 1:
+            raise ValueError("percentile must be in (0, 1]")
+        self.ceiling = ceiling
+        self.floor = min(floor, ceiling)
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def observe(self, latency: float) -> None:
+        self._samples.append(latency)
+
+    def timeout(self, attempt: int = 0) -> float:
+        if len(self._samples) < self.min_samples:
+            return self.ceiling
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        base = max(self.floor, ordered[index] * self.multiplier)
+        return min(self.ceiling, base * 2**attempt)
+
+
+@dataclass(slots=True)
+class BreakerStats:
+    opened: int = 0
+    rejected: int = 0
+    probes: int = 0
+    failures: int = 0
+    successes: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "probes": self.probes,
+            "failures": self.failures,
+            "successes": self.successes,
+        }
+
+
+class CircuitBreaker:
+    """Fails fast while a backend is down.
+
+    ``failure_threshold`` consecutive failures open the circuit. After
+    ``reset_timeout`` seconds it goes half-open and lets ``half_open_probes``
+    calls through; a probe success closes it again, a probe failure reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        key: str = "",
+        failure_threshold: int = 5,
+        reset_timeout: float = 10.0,
+        half_open_probes: int = 1,
+    ) -> None:
+        if failure_threshold < 1 or half_open_probes < 1:
+            raise ValueError("failure_threshold and half_open_probes must be >= 1")
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.stats = BreakerStats()
+        self._state = self.CLOSED
+        self._consecutive = 0
+        self._opened_at = 0.0
+        self._probing = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and self._retry_in() <= 0:
+            return self.HALF_OPEN
+        return self._state
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"state": self.state, "consecutive_failures": self._consecutive, **self.stats.as_dict()}
+
+    def before_call(self) -> None:
+        """Raise :class:`CircuitOpenError` unless a call may go through now."""
+        if self._state == self.OPEN:
+            if self._retry_in() > 0:
+                self.stats.rejected += 1
+                raise CircuitOpenError(self.key, self._retry_in())
+            self._state = self.HALF_OPEN
+            self._probing = 0
+        if self._state == self.HALF_OPEN:
+            if self._probing >= self.half_open_probes:
+                self.stats.rejected += 1
+                raise CircuitOpenError(self.key, 0.0)
+            self._probing += 1
+            self.stats.probes += 1
+
+    def record_success(self) -> None:
+        self.stats.successes += 1
+        self._consecutive = 0
+        self._state = self.CLOSED
+        self._probing = 0
+
+    def record_failure(self) -> None:
+        self.stats.failures += 1
+        self._consecutive += 1
+        if self._state == self.OPEN:
+            # A call that started before the circuit opened; keep the original timer.
+            return
+        if self._state == self.HALF_OPEN or self._consecutive >= self.failure_threshold:
+            self.stats.opened += 1
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._probing = 0
+
+    def record_ignored(self) -> None:
+        """Release a half-open probe slot for a call that says nothing about health."""
+        if self._state == self.HALF_OPEN and self._probing:
+            self._probing -= 1
+
+    def _retry_in(self) -> float:
+        return self._opened_at + self.reset_timeout - time.monotonic()
+
+
+_BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+def shared_breaker(key: str, **options: Any) -> CircuitBreaker:
+    """The process-wide breaker for ``key`` (usually a base URL); ``options`` apply on first use."""
+    breaker = _BREAKERS.get(key)
+    if breaker is None:
+        breaker = _BREAKERS[key] = CircuitBreaker(key, **options)
+    return breaker
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import cProfile
+import pstats
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+_AGENTS_DIR = Path(__file__).resolve().parent / "agents"
+
+
+@dataclass(slots=True)
+class ProfileReport:
+    wall_seconds: float
+    cpu_seconds: float
+    agent_seconds: dict[str, float] = field(default_factory=dict)
+    agent_self_seconds: dict[str, float] = field(default_factory=dict)
+    top_functions: list[tuple[str, int, float, float]] = field(default_factory=list)
+    stats_path: Path | None = None
+    summary_path: Path | None = None
+
+
+def profile_call(fn: Callable[[], T]) -> tuple[T, cProfile.Profile, float, float]:
+    """Run ``fn`` under cProfile and return its result, the profiler, wall and CPU seconds."""
+    profiler = cProfile.Profile()
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    profiler.enable()
+    try:
+        result = fn()
+    finally:
+        profiler.disable()
+    return result, profiler, time.perf_counter() - wall_started, time.process_time() - cpu_started
+
+
+def build_report(
+    profiler: cProfile.Profile, wall_seconds: float, cpu_seconds: float, top: int = 25
+) -> ProfileReport:
+    stats = pstats.Stats(profiler)
+    report = ProfileReport(wall_seconds=wall_seconds, cpu_seconds=cpu_seconds)
+    rows = []
+    for (filename, lineno, funcname), (_, calls, tottime, cumtime, _) in stats.stats.items():  # type: ignore[attr-defined]
+        path = Path(filename)
+        label = f"{_short_path(path)}:{lineno}({funcname})"
+        rows.append((label, calls, tottime, cumtime))
+        if path.parent == _AGENTS_DIR and path.stem not in {"__init__", "base", "instructions"}:
+            agent = path.stem
+            report.agent_self_seconds[agent] = report.agent_self_seconds.get(agent, 0.0) + tottime
+            # Coroutine frames return to the profiler at every await, so the
+            # cumulative time of an agent's run() only counts time it was on the CPU.
+            if funcname == "run":
+                report.agent_seconds[agent] = report.agent_seconds.get(agent, 0.0) + cumtime
+    rows.sort(key=lambda row: row[2], reverse=True)
+    report.top_functions = rows[:top]
+    return report
+
+
+def write_report(
+    profiler: cProfile.Profile, report: ProfileReport, output_dir: Path
+) -> ProfileReport:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report.stats_path = output_dir / "profile.pstats"
+    report.summary_path = output_dir / "profile.txt"
+    profiler.dump_stats(str(report.stats_path))
+    report.summary_path.write_text(format_report(report), encoding="utf-8")
+    return report
+
+
+def format_report(report: ProfileReport) -> str:
+    waiting = max(0.0, report.wall_seconds - report.cpu_seconds)
+    lines = [
+        "# Swarm profile",
+        "",
+        f"Wall clock: {report.wall_seconds:.3f}s",
+        f"CPU time:   {report.cpu_seconds:.3f}s",
+        f"Waiting:    {waiting:.3f}s (I/O, LLM and other off-CPU time)",
+        "",
+        "## CPU time per agent",
+        "",
+        f"{'agent':<12} {'run() cumulative':>18} {'module self':>12}",
+    ]
+    agents = sorted(
+        set(report.agent_seconds) | set(report.agent_self_seconds),
+        key=lambda name: report.agent_seconds.get(name, 0.0),
+        reverse=True,
+    )
+    for agent in agents:
+        lines.append(
+            f"{agent:<12} {report.agent_seconds.get(agent, 0.0):>17.4f}s "
+            f"{report.agent_self_seconds.get(agent, 0.0):>11.4f}s"
+        )
+    lines.extend(
+        [
+            "",
+            "## Top functions by self time",
+            "",
+            f"{'self':>9} {'cumulative':>11} {'calls':>9}  function",
+        ]
+    )
+    for label, calls, tottime, cumtime in report.top_functions:
+        lines.append(f"{tottime:>8.4f}s {cumtime:>10.4f}s {calls:>9}  {label}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _short_path(path: Path) -> str:
+    parts = path.parts
+    if "swarm" in parts:
+        return "/".join(parts[parts.index("swarm") :])
+    return path.name or str(path)
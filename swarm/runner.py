@@ -5,8 +5,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
 
+from swarm.bus import EventHub, Subscription
 from swarm.config import SwarmConfig
 from swarm.coordinator import Coordinator
+from swarm.runtime import SwarmRuntime
 
 
 @dataclass(slots=True)
@@ -18,6 +20,7 @@ class RunSpec:
     dry_run: bool = False
     verbose: bool = False
     config: SwarmConfig | None = None
+    resume: bool = False
 
 
 @dataclass(slots=True)
@@ -27,6 +30,8 @@ class RunResult:
     final: str
     output_dir: str
     events: list[dict[str, object]]
+    events_total: int = 0
+    events_path: str | None = None
 
 
 class SwarmRunner:
@@ -39,6 +44,33 @@ class SwarmRunner:
         self._results: list[RunResult] = []
         self._results_lock: asyncio.Lock | None = None
         self._semaphore: asyncio.Semaphore | None = None
+        self._runtimes: dict[int, tuple[SwarmConfig, SwarmRuntime]] = {}
+        self.event_hub = EventHub()
+
+    def subscribe(
+        self,
+        event_types: Iterable[str] | None = None,
+        run_id: str | None = None,
+        max_queue: int = 1000,
+        policy: str = "drop_oldest",
+    ) -> Subscription:
+        """Stream events from every run executed by this runner as they are logged."""
+        return self.event_hub.subscribe(event_types, run_id, max_queue, policy)
+
+    def runtime_for(self, config: SwarmConfig | None = None) -> SwarmRuntime:
+        """Return the shared runtime for ``config``, creating it on first use."""
+        config = config or self._config
+        entry = self._runtimes.get(id(config))
+        if entry is None:
+            entry = (config, SwarmRuntime(config, event_hub=self.event_hub))
+            self._runtimes[id(config)] = entry
+        return entry[1]
+
+    def close(self) -> None:
+        self.event_hub.close()
+        for _, runtime in self._runtimes.values():
+            runtime.close()
+        self._runtimes.clear()
 
     def spawn(self, spec: RunSpec) -> "asyncio.Task[RunResult]":
         if self._task_group is None or self._semaphore is None:
@@ -60,24 +92,39 @@ class SwarmRunner:
         if self._semaphore is None or self._results_lock is None:
             raise RuntimeError("SwarmRunner not initialized; call run() first")
         async with self._semaphore:
+            config = spec.config or self._config
             coordinator = Coordinator(
-                config=spec.config or self._config,
+                config=config,
                 spawner=self.spawn,
+                runtime=self.runtime_for(config),
             )
-            result = await coordinator.run(
-                objective=spec.objective,
-                run_id=spec.run_id,
-                output_dir=spec.output_dir,
-                max_steps=spec.max_steps,
-                dry_run=spec.dry_run,
-                verbose=spec.verbose,
-            )
+            if spec.resume:
+                if not spec.run_id:
+                    raise ValueError("RunSpec.resume requires a run_id")
+                result = await coordinator.resume(
+                    run_id=spec.run_id,
+                    output_dir=spec.output_dir,
+                    max_steps=spec.max_steps,
+                    dry_run=spec.dry_run,
+                    verbose=spec.verbose,
+                )
+            else:
+                result = await coordinator.run(
+                    objective=spec.objective,
+                    run_id=spec.run_id,
+                    output_dir=spec.output_dir,
+                    max_steps=spec.max_steps,
+                    dry_run=spec.dry_run,
+                    verbose=spec.verbose,
+                )
             run_result = RunResult(
                 run_id=result["run_id"],
                 objective=result["objective"],
                 final=result["final"],
                 output_dir=result["output_dir"],
                 events=result["events"],
+                events_total=result["events_total"],
+                events_path=result["events_path"],
             )
             async with self._results_lock:
                 self._results.append(run_result)
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from typing import Any
+
+from swarm.agents import (
+    BaseAgent,
+    CoderAgent,
+    CriticAgent,
+    DispatcherAgent,
+    PlannerAgent,
+    ResearcherAgent,
+)
+from swarm.agents.instructions import load_agent_instructions
+from swarm.bus import EventHub
+from swarm.config import SwarmConfig
+from swarm.llm import (
+    LLM,
+    CachingLLM,
+    CoalescingLLM,
+    HedgedLLM,
+    AimdLimiter,
+    ChatSessions,
+    LatencyProfile,
+    LimitedLLM,
+    MockLLM,
+    OllamaLLM,
+    OpenAICompatibleLLM,
+    RouterLLM,
+    SimulatedLLM,
+    shared_limiter,
+)
+from swarm.memory import PersistentMemory, SqliteCache
+from swarm.net import CircuitBreaker, RetryPolicy, shared_breaker
+from swarm.tools import FilesystemTool, HttpTool, ShellTool
+
+
+class SwarmRuntime:
+    """Long-lived resources shared by every run built from one config.
+
+    Owns the sqlite handles, tools, LLM client and agent registry so that a
+    Coordinator per run only has to create its EventLog and short-term memory.
+    """
+
+    def __init__(
+        self, config: SwarmConfig, llm: LLM | None = None, event_hub: EventHub | None = None
+    ) -> None:
+        self.config = config
+        # Built first so a bad config fails before any database handle is opened.
+        self.agents: dict[str, BaseAgent] = build_agents(config)
+        unknown = sorted(set(config.agent_llm) - set(self.agents))
+        if unknown:
+            raise ValueError(f"LLM profiles set for unknown agents: {', '.join(unknown)}")
+        self.event_hub = event_hub or EventHub()
+        self.persistent = PersistentMemory(config.db_path)
+        self.filesystem = FilesystemTool(list(config.filesystem_allowlist))
+        self.shell = ShellTool(list(config.shell_allowlist))
+        self.http = HttpTool()
+        # ``backend`` is the raw client; ``llm`` adds the configured limit/cache/coalescing layers.
+        # Counts prefill for every Ollama run; resumes chat sessions only when asked to.
+        self.llm_sessions = (
+            ChatSessions(resume=config.ollama_chat_sessions)
+            if llm is None and config.llm_provider == "ollama"
+            else None
+        )
+        resuming = self.llm_sessions is not None and self.llm_sessions.resume
+        self.backend = llm or build_llm(config, sessions=self.llm_sessions)
+        self.llm_identity = llm_identity(config, llm)
+        self.llm = self.backend
+        self.llm_router = self.backend if isinstance(self.backend, RouterLLM) else None
+        # Innermost, so cache hits and collapsed duplicates never take a slot.
+        self.llm_limiter = build_limiter(config, self.backend) if config.llm_adaptive_limit else None
+        if self.llm_limiter is not None:
+            self.llm = LimitedLLM(self.llm, self.llm_limiter)
+        # Above the limiter so a hedge takes a slot like any other call.
+        self.llm_hedger = (
+            HedgedLLM(self.llm, percentile=config.llm_hedge_percentile, budget=config.llm_hedge_budget)
+            if config.llm_hedge
+            else None
+        )
+        if self.llm_hedger is not None:
+            self.llm = self.llm_hedger
+        self.llm_cache = (
+            SqliteCache(
+                config.db_path,
+                table="llm_cache",
+                max_entries=config.llm_cache_max_entries,
+                ttl=config.llm_cache_ttl,
+            )
+            # An answer in a session depends on the turns before it, not just the prompt.
+            if config.llm_cache and not resuming
+            else None
+        )
+        if self.llm_cache is not None:
+            identity = self.llm_identity
+            if config.llm_stop_at_json:
+                # Streams cut at the first JSON object are cached without the rest of the answer.
+                identity = {**identity, "stop_at_json": True}
+            self.llm = CachingLLM(self.llm, self.llm_cache, identity)
+        # Outermost, so concurrent identical prompts also share one cache lookup and write.
+        self.llm_coalescer = CoalescingLLM(self.llm) if config.llm_coalesce and not resuming else None
+        if self.llm_coalescer is not None:
+            self.llm = self.llm_coalescer
+        self.step_cache = (
+            SqliteCache(
+                config.db_path,
+                table="step_cache",
+                max_entries=config.step_cache_max_entries,
+                ttl=config.step_cache_ttl,
+            )
+            if config.step_cache
+            else None
+        )
+        self._closed = False
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self.step_cache is not None:
+            self.step_cache.close()
+        if self.llm_cache is not None:
+            self.llm_cache.close()
+        self.persistent.close()
+
+
+def build_llm(config: SwarmConfig, sessions: ChatSessions | None = None) -> LLM:
+    if config.llm_provider == "ollama":
+        urls = ollama_urls(config)
+        if len(urls) == 1:
+            return _ollama_llm(config, urls[0], sessions)
+        return RouterLLM(
+            [_ollama_llm(config, url, sessions) for url in urls],
+            names=urls,
+            strategy=config.llm_route_strategy,
+            pin_runs=config.llm_route_pin_runs,
+        )
+    if config.llm_provider == "openai-compatible":
+        url = config.openai_url.rstrip("/")
+        return OpenAICompatibleLLM(
+            model=config.openai_model,
+            base_url=url,
+            timeout=config.ollama_timeout,
+            retries=config.ollama_retries,
+            api_key=config.openai_api_key,
+            pool_size=config.openai_pool_size,
+            retry=_retry_policy(config),
+            breaker=_breaker(config, url),
+            adaptive_timeout=config.ollama_adaptive_timeout,
+        )
+    if config.llm_provider == "simulated":
+        return SimulatedLLM(
+            profile=LatencyProfile.from_dict(config.simulated_llm),
+            seed=config.seed,
+        )
+    return MockLLM(seed=config.seed)
+
+
+def ollama_urls(config: SwarmConfig) -> list[str]:
+    """Every configured Ollama base URL; ``ollama_urls`` wins over the single ``ollama_url``."""
+    return [url.rstrip("/") for url in (config.ollama_urls or [config.ollama_url])]
+
+
+def _ollama_llm(config: SwarmConfig, url: str, sessions: ChatSessions | None = None) -> OllamaLLM:
+    return OllamaLLM(
+        model=config.ollama_model,
+        base_url=url,
+        endpoint=config.ollama_endpoint,
+        timeout=config.ollama_timeout,
+        retries=config.ollama_retries,
+        pool_size=config.ollama_pool_size,
+        retry=_retry_policy(config),
+        breaker=_breaker(config, url),
+        adaptive_timeout=config.ollama_adaptive_timeout,
+        sessions=sessions,
+    )
+
+
+def _retry_policy(config: SwarmConfig) -> RetryPolicy:
+    return RetryPolicy(
+        retries=max(0, config.ollama_retries),
+        base_delay=config.ollama_backoff,
+        max_delay=config.ollama_backoff_max,
+    )
+
+
+def _breaker(config: SwarmConfig, url: str) -> CircuitBreaker:
+    return shared_breaker(
+        url,
+        failure_threshold=config.ollama_breaker_threshold,
+        reset_timeout=config.ollama_breaker_reset,
+    )
+
+
+def build_limiter(config: SwarmConfig, backend: LLM) -> AimdLimiter:
+    """Servers get one limiter per URL (set) for the whole process; in-process backends get their own."""
+    options = {
+        "initial_limit": min(config.llm_limit_initial, config.llm_limit_max),
+        "max_limit": config.llm_limit_max,
+    }
+    if config.llm_provider == "ollama" and isinstance(backend, (OllamaLLM, RouterLLM)):
+        return shared_limiter(f"ollama {','.join(ollama_urls(config))}", **options)
+    if isinstance(backend, OpenAICompatibleLLM):
+        return shared_limiter(f"openai-compatible {config.openai_url.rstrip('/')}", **options)
+    return AimdLimiter(**options)
+
+
+def llm_identity(config: SwarmConfig, llm: LLM | None = None) -> dict[str, Any]:
+    """What makes two completions of the same prompt interchangeable, for cache keys."""
+    if llm is not None:
+        # A caller-supplied client names its own model when it has one.
+        return {
+            "provider": f"{type(llm).__module__}.{type(llm).__qualname__}",
+            "model": getattr(llm, "model", None) or configured_model(config),
+        }
+    if config.llm_provider == "ollama":
+        # As with OpenAI-compatible servers, each may serve different weights under one model name.
+        options: dict[str, Any] = {"endpoint": config.ollama_endpoint, "urls": ollama_urls(config)}
+        if config.ollama_chat_sessions:
+            options["chat_sessions"] = True
+        return {"provider": "ollama", "model": configured_model(config), "options": options}
+    if config.llm_provider == "openai-compatible":
+        # Different servers may serve different weights under the same model name.
+        return {
+            "provider": "openai-compatible",
+            "model": configured_model(config),
+            "options": {"url": config.openai_url.rstrip("/")},
+        }
+    return {"provider": config.llm_provider, "model": None, "options": {"seed": config.seed}}
+
+
+def configured_model(config: SwarmConfig) -> str | None:
+    """The model ``config`` selects for its provider; None for providers without one."""
+    if config.llm_provider == "ollama":
+        return config.ollama_model
+    if config.llm_provider == "openai-compatible":
+        return config.openai_model
+    return None
+
+
+def build_agents(config: SwarmConfig) -> dict[str, BaseAgent]:
+    return {
+        "researcher": ResearcherAgent(
+            instructions=load_agent_instructions(config.repo_root, "researcher")
+        ),
+        "planner": PlannerAgent(
+            instructions=load_agent_instructions(config.repo_root, "planner")
+        ),
+        "coder": CoderAgent(
+            instructions=load_agent_instructions(config.repo_root, "coder")
+        ),
+        "dispatcher": DispatcherAgent(
+            instructions=load_agent_instructions(config.repo_root, "dispatcher")
+        ),
+        "critic": CriticAgent(
+            instructions=load_agent_instructions(config.repo_root, "critic")
+        ),
+    }
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Sequence
+
+StepId = Hashable
+RunStep = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+class PlanError(ValueError):
+    """Raised when a plan's dependency graph cannot be executed."""
+
+
+@dataclass(slots=True)
+class StepGraph:
+    steps: dict[StepId, dict[str, Any]]
+    dependencies: dict[StepId, list[StepId]]
+    dependents: dict[StepId, list[StepId]] = field(default_factory=dict)
+    skipped: list[StepId] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.dependents:
+            self.dependents = {step_id: [] for step_id in self.steps}
+            for step_id, deps in self.dependencies.items():
+                for dep in deps:
+                    self.dependents[dep].append(step_id)
+
+    def in_degrees(self) -> dict[StepId, int]:
+        return {step_id: len(deps) for step_id, deps in self.dependencies.items()}
+
+    def critical_path_weights(
+        self, durations: dict[str, float], default: float | None = None
+    ) -> dict[StepId, float]:
+        """Return each step's longest remaining path, weighted by agent duration.
+
+        A step's weight is its own expected duration plus the heaviest chain of
+        dependents below it. Agents without history fall back to ``default``,
+        or the mean of the known durations (1.0 when there is no history).
+        """
+        if default is None:
+            default = sum(durations.values()) / len(durations) if durations else 1.0
+        order = _topological_order(list(self.steps), self.dependencies)
+        weights: dict[StepId, float] = {}
+        for step_id in reversed(order):
+            agent = self.steps[step_id].get("agent", "")
+            own = durations.get(agent, default)
+            tail = max((weights[dep] for dep in self.dependents[step_id]), default=0.0)
+            weights[step_id] = own + tail
+        return weights
+
+    @classmethod
+    def from_plan(
+        cls,
+        steps: Sequence[dict[str, Any]],
+        limit: int | None = None,
+        exclude_agents: Iterable[str] = (),
+    ) -> "StepGraph":
+        """Validate a planner step list and build the executable graph.
+
+        The whole plan is checked for duplicate ids, dangling ``depends_on``
+        references and cycles before anything is trimmed. Steps owned by an
+        excluded agent are removed and their dependents inherit their
+        dependencies; steps whose dependencies were cut by ``limit`` are
+        reported in ``skipped`` instead of being scheduled.
+        """
+        all_steps = _index_steps(steps)
+        all_deps = {step_id: _depends_on(step) for step_id, step in all_steps.items()}
+        for step_id, deps in all_deps.items():
+            missing = [dep for dep in deps if dep not in all_steps]
+            if missing:
+                raise PlanError(f"Step {step_id!r} depends on unknown steps: {missing}")
+        _check_acyclic(all_deps)
+
+        excluded = set(exclude_agents)
+        kept_ids = list(all_steps)[:limit] if limit is not None else list(all_steps)
+        removed = {step_id for step_id in all_steps if all_steps[step_id].get("agent") in excluded}
+        resolved = _resolve_through(all_deps, removed)
+
+        kept = [step_id for step_id in kept_ids if step_id not in removed]
+        available = set(kept)
+        skipped: list[StepId] = []
+        ordered: list[StepId] = []
+        for step_id in _topological_order(kept, resolved):
+            if all(dep in available for dep in resolved[step_id]):
+                ordered.append(step_id)
+            else:
+                available.discard(step_id)
+                skipped.append(step_id)
+        ordered_set = set(ordered)
+        graph_steps = {step_id: all_steps[step_id] for step_id in kept if step_id in ordered_set}
+        dependencies = {step_id: list(resolved[step_id]) for step_id in graph_steps}
+        return cls(steps=graph_steps, dependencies=dependencies, skipped=skipped)
+
+
+class StepScheduler:
+    """Run a StepGraph, starting each step as soon as its last dependency completes.
+
+    Ready steps are launched highest ``priorities`` first (plan order breaks
+    ties). ``agent_limits`` caps how many steps of one agent run at once; a
+    capped agent never blocks ready steps that belong to other agents.
+    """
+
+    def __init__(
+        self,
+        graph: StepGraph,
+        priorities: dict[StepId, float] | None = None,
+        agent_limits: dict[str, int] | None = None,
+    ) -> None:
+        for agent, limit in (agent_limits or {}).items():
+            if limit < 1:
+                raise ValueError(f"Concurrency limit for {agent} must be >= 1")
+        self._graph = graph
+        self._priorities = priorities or {}
+        self._agent_limits = dict(agent_limits or {})
+        self._position = {step_id: index for index, step_id in enumerate(graph.steps)}
+
+    async def run(
+        self, run_step: RunStep, completed: dict[StepId, Any] | None = None
+    ) -> dict[StepId, Any]:
+        """Execute every step not already present in ``completed`` and return all results."""
+        graph = self._graph
+        remaining = graph.in_degrees()
+        ready: dict[str, list[tuple[float, int, StepId]]] = {}
+        active: dict[str, int] = {}
+        running: dict[asyncio.Task[Any], StepId] = {}
+        completed = dict(completed or {})
+        for step_id in completed:
+            for dependent in graph.dependents[step_id]:
+                remaining[dependent] -= 1
+        for step_id, count in remaining.items():
+            if count == 0 and step_id not in completed:
+                self._push(ready, step_id)
+        try:
+            while ready or running:
+                while (agent := self._next_agent(ready, active)) is not None:
+                    _, _, step_id = heapq.heappop(ready[agent])
+                    if not ready[agent]:
+                        del ready[agent]
+                    active[agent] = active.get(agent, 0) + 1
+                    task = asyncio.create_task(run_step(graph.steps[step_id]))
+                    running[task] = step_id
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step_id = running.pop(task)
+                    active[self._agent(step_id)] -= 1
+                    completed[step_id] = task.result()
+                    for dependent in graph.dependents[step_id]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            self._push(ready, dependent)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        return completed
+
+    def _agent(self, step_id: StepId) -> str:
+        return str(self._graph.steps[step_id].get("agent", ""))
+
+    def _push(self, ready: dict[str, list[tuple[float, int, StepId]]], step_id: StepId) -> None:
+        entry = (-self._priorities.get(step_id, 0.0), self._position[step_id], step_id)
+        heapq.heappush(ready.setdefault(self._agent(step_id), []), entry)
+
+    def _next_agent(
+        self, ready: dict[str, list[tuple[float, int, StepId]]], active: dict[str, int]
+    ) -> str | None:
+        best: str | None = None
+        for agent, heap in ready.items():
+            limit = self._agent_limits.get(agent)
+            if limit is not None and active.get(agent, 0) >= limit:
+                continue
+            if best is None or heap[0][:2] < ready[best][0][:2]:
+                best = agent
+        return best
+
+
+def _index_steps(steps: Sequence[dict[str, Any]]) -> dict[StepId, dict[str, Any]]:
+    if not isinstance(steps, (list, tuple)):
+        raise PlanError(f"Plan steps must be a list, got {type(steps).__name__}")
+    indexed: dict[StepId, dict[str, Any]] = {}
+    for step in steps:
+        if not isinstance(step, dict) or "id" not in step:
+            raise PlanError(f"Plan step is missing an id: {step!r}")
+        step_id = step["id"]
+        if step_id in indexed:
+            raise PlanError(f"Duplicate step id: {step_id!r}")
+        indexed[step_id] = step
+    return indexed
+
+
+def _depends_on(step: dict[str, Any]) -> list[StepId]:
+    deps = step.get("depends_on") or []
+    if not isinstance(deps, list):
+        raise PlanError(f"Step {step.get('id')!r} has non-list depends_on: {deps!r}")
+    return list(dict.fromkeys(deps))
+
+
+def _check_acyclic(dependencies: dict[StepId, list[StepId]]) -> None:
+    order = _topological_order(list(dependencies), dependencies)
+    if len(order) != len(dependencies):
+        ordered = set(order)
+        blocked = sorted(str(step_id) for step_id in dependencies if step_id not in ordered)
+        raise PlanError(f"Plan contains a dependency cycle among steps: {blocked}")
+
+
+def _topological_order(
+    step_ids: list[StepId], dependencies: dict[StepId, list[StepId]]
+) -> list[StepId]:
+    members = set(step_ids)
+    remaining = {
+        step_id: sum(1 for dep in dependencies[step_id] if dep in members) for step_id in step_ids
+    }
+    dependents: dict[StepId, list[StepId]] = {step_id: [] for step_id in step_ids}
+    for step_id in step_ids:
+        for dep in dependencies[step_id]:
+            if dep in members:
+                dependents[dep].append(step_id)
+    queue = deque(step_id for step_id in step_ids if remaining[step_id] == 0)
+    order: list[StepId] = []
+    while queue:
+        step_id = queue.popleft()
+        order.append(step_id)
+        for dependent in dependents[step_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                queue.append(dependent)
+    return order
+
+
+def _resolve_through(
+    dependencies: dict[StepId, list[StepId]], removed: set[StepId]
+) -> dict[StepId, list[StepId]]:
+    resolved: dict[StepId, list[StepId]] = {}
+
+    def visit(step_id: StepId) -> list[StepId]:
+        if step_id in resolved:
+            return resolved[step_id]
+        deps: list[StepId] = []
+        for dep in dependencies[step_id]:
+            deps.extend(visit(dep) if dep in removed else [dep])
+        resolved[step_id] = list(dict.fromkeys(deps))
+        return resolved[step_id]
+
+    for step_id in _topological_order(list(dependencies), dependencies):
+        visit(step_id)
+    return resolved
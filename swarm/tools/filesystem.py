@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from swarm.tracing import span
+
 
 class FilesystemTool:
     def __init__(self, allowlist: list[Path]) -> None:
@@ -19,18 +21,21 @@ class FilesystemTool:
     def write_text(self, path: Path, content: str) -> None:
         if not self._is_allowed(path):
             raise PermissionError(f"Path not allowed: {path}")
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+        with span("fs.write_text", path=str(path), chars=len(content)):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
 
     def append_text(self, path: Path, content: str) -> None:
         if not self._is_allowed(path):
             raise PermissionError(f"Path not allowed: {path}")
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(content)
+        with span("fs.append_text", path=str(path), chars=len(content)):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(content)
 
     def write_bytes(self, path: Path, content: bytes) -> None:
         if not self._is_allowed(path):
             raise PermissionError(f"Path not allowed: {path}")
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_bytes(content)
+        with span("fs.write_bytes", path=str(path), bytes=len(content)):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
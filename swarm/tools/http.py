@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
-import json
+from typing import Any, Coroutine, TypeVar
+
+from swarm.net import HttpClient, shared_client
+from swarm.tracing import span
+
+T = TypeVar("T")
 
 
 @dataclass(slots=True)
@@ -14,34 +19,29 @@ class HttpResponse:
 
 
 class HttpTool:
-    def __init__(self, user_agent: str = "SwarmHttpTool/1.0") -> None:
+    """HTTP for agents on the shared asyncio client (keep-alive, redirects, gzip).
+
+    Agents await :meth:`aget` and :meth:`apost`; :meth:`get` and :meth:`post`
+    are blocking wrappers for synchronous callers.
+    """
+
+    def __init__(self, user_agent: str = "SwarmHttpTool/1.0", client: HttpClient | None = None) -> None:
         self._user_agent = user_agent
+        self._client = client
 
-    def get(
+    @property
+    def client(self) -> HttpClient:
+        return self._client or shared_client()
+
+    async def aget(
         self, url: str, timeout: float = 5.0, headers: dict[str, str] | None = None
     ) -> HttpResponse:
-        request_headers = {"User-Agent": self._user_agent}
-        if headers:
-            request_headers.update(headers)
-        req = Request(url, headers=request_headers)
-        try:
-            with urlopen(req, timeout=timeout) as response:
-                body = response.read().decode("utf-8", errors="replace")
-                status = getattr(response, "status", None) or getattr(response, "getcode", lambda: 0)()
-                return HttpResponse(url=url, status=int(status), text=body)
-        except HTTPError as exc:
-            # HTTPError contains status code and may contain a body
-            try:
-                body = exc.read().decode("utf-8", errors="replace")
-            except Exception:
-                body = str(exc)
-            return HttpResponse(url=url, status=getattr(exc, "code", 0), text=body)
-        except URLError as exc:
-            return HttpResponse(url=url, status=0, text=str(exc))
-        except Exception as exc:
-            return HttpResponse(url=url, status=0, text=str(exc))
+        with span("http.get", url=url) as active:
+            response = await self._request("GET", url, None, timeout, headers)
+            active.set(status=response.status)
+            return response
 
-    def post(
+    async def apost(
         self,
         url: str,
         payload: dict,
@@ -53,23 +53,57 @@ class HttpTool:
         Errors are returned as HttpResponse objects with `status==0` for network errors
         or the HTTP status code for server responses.
         """
-        data = json.dumps(payload).encode("utf-8")
-        request_headers = {"User-Agent": self._user_agent, "Content-Type": "application/json"}
+        with span("http.post", url=url) as active:
+            response = await self._request("POST", url, payload, timeout, headers)
+            active.set(status=response.status)
+            return response
+
+    def get(
+        self, url: str, timeout: float = 5.0, headers: dict[str, str] | None = None
+    ) -> HttpResponse:
+        return _run_sync(self._closing(self.aget(url, timeout, headers)))
+
+    def post(
+        self,
+        url: str,
+        payload: dict,
+        timeout: float = 10.0,
+        headers: dict[str, str] | None = None,
+    ) -> HttpResponse:
+        return _run_sync(self._closing(self.apost(url, payload, timeout, headers)))
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        payload: dict | None,
+        timeout: float,
+        headers: dict[str, str] | None,
+    ) -> HttpResponse:
+        request_headers = {"User-Agent": self._user_agent}
         if headers:
             request_headers.update(headers)
-        req = Request(url, data=data, headers=request_headers)
         try:
-            with urlopen(req, timeout=timeout) as response:
-                body = response.read().decode("utf-8", errors="replace")
-                status = getattr(response, "status", None) or getattr(response, "getcode", lambda: 0)()
-                return HttpResponse(url=url, status=int(status), text=body)
-        except HTTPError as exc:
-            try:
-                body = exc.read().decode("utf-8", errors="replace")
-            except Exception:
-                body = str(exc)
-            return HttpResponse(url=url, status=getattr(exc, "code", 0), text=body)
-        except URLError as exc:
-            return HttpResponse(url=url, status=0, text=str(exc))
+            response = await self.client.request(
+                method, url, headers=request_headers, json=payload, timeout=timeout
+            )
         except Exception as exc:
-            return HttpResponse(url=url, status=0, text=str(exc))
+            return HttpResponse(url=url, status=0, text=str(exc) or type(exc).__name__)
+        return HttpResponse(url=response.url, status=response.status, text=response.text())
+
+    async def _closing(self, job: Coroutine[Any, Any, T]) -> T:
+        # A blocking call runs on a throwaway event loop; close its connections before it ends.
+        try:
+            return await job
+        finally:
+            await self.client.aclose()
+
+
+def _run_sync(job: Coroutine[Any, Any, T]) -> T:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(job)
+    # Called from inside an event loop: run on a worker thread with its own loop.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, job).result()
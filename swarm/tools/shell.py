@@ -4,6 +4,8 @@ import shlex
 import subprocess
 from dataclasses import dataclass
 
+from swarm.tracing import span
+
 
 @dataclass(slots=True)
 class ShellResult:
@@ -22,12 +24,14 @@ class ShellTool:
             raise ValueError("Command is empty")
         if parts[0] not in self._allowlist:
             raise PermissionError(f"Command not allowed: {parts[0]}")
-        completed = subprocess.run(
-            parts,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        with span("shell.run", command=parts[0]) as active:
+            completed = subprocess.run(
+                parts,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            active.set(return_code=completed.returncode)
         return ShellResult(
             stdout=completed.stdout,
             stderr=completed.stderr,
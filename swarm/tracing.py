@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+_TRACER: ContextVar["Tracer | None"] = ContextVar("swarm_tracer", default=None)
+_PARENT: ContextVar[int | None] = ContextVar("swarm_trace_parent", default=None)
+
+
+@dataclass(slots=True)
+class SpanRecord:
+    span_id: int
+    parent_id: int | None
+    name: str
+    start_ns: int
+    lane: int
+    attrs: dict[str, Any]
+    duration_ns: int = 0
+    error: str | None = None
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def set(self, **attrs: Any) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    __slots__ = ("_tracer", "_record", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._record = SpanRecord(
+            span_id=tracer._next_id(),
+            parent_id=_PARENT.get(),
+            name=name,
+            start_ns=0,
+            lane=tracer._lane(),
+            attrs=attrs,
+        )
+        self._token: Token[int | None] | None = None
+
+    def set(self, **attrs: Any) -> None:
+        self._record.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        self._token = _PARENT.set(self._record.span_id)
+        self._record.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: object) -> None:
+        record = self._record
+        record.duration_ns = time.perf_counter_ns() - record.start_ns
+        if exc_type is not None:
+            record.error = exc_type.__name__
+        if self._token is not None:
+            _PARENT.reset(self._token)
+        self._tracer._finish(record)
+
+
+@dataclass(slots=True)
+class Tracer:
+    """Collects nested spans for one run and exports them as a Chrome trace."""
+
+    run_id: str
+    spans: list[SpanRecord] = field(default_factory=list)
+    _ids: int = 0
+    _lanes: dict[int, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def span(self, name: str, **attrs: Any) -> Span:
+        return Span(self, name, attrs)
+
+    def export_chrome(self, path: Path) -> Path:
+        """Write spans in Chrome trace-event format (opens in Perfetto or chrome://tracing)."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {"ph": "M", "name": "process_name", "pid": pid, "args": {"name": f"swarm run {self.run_id}"}}
+        ]
+        for record in sorted(self.spans, key=lambda item: item.start_ns):
+            args = dict(record.attrs)
+            if record.error:
+                args["error"] = record.error
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": record.start_ns / 1000,
+                    "dur": record.duration_ns / 1000,
+                    "pid": pid,
+                    "tid": record.lane,
+                    "args": args,
+                }
+            )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, default=str),
+            encoding="utf-8",
+        )
+        return path
+
+    def export_jsonl(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            for record in sorted(self.spans, key=lambda item: item.start_ns):
+                handle.write(
+                    json.dumps(
+                        {
+                            "span_id": record.span_id,
+                            "parent_id": record.parent_id,
+                            "name": record.name,
+                            "start_ns": record.start_ns,
+                            "duration_ns": record.duration_ns,
+                            "attrs": record.attrs,
+                            "error": record.error,
+                        },
+                        default=str,
+                    )
+                    + "\n"
+                )
+        return path
+
+    def _next_id(self) -> int:
+        with self._lock:
+            self._ids += 1
+            return self._ids
+
+    def _lane(self) -> int:
+        # Concurrent asyncio tasks (and worker threads) get separate lanes so
+        # their spans nest correctly in a flamegraph view.
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = id(task) if task is not None else threading.get_ident()
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane is None:
+                lane = len(self._lanes) + 1
+                self._lanes[key] = lane
+            return lane
+
+    def _finish(self, record: SpanRecord) -> None:
+        with self._lock:
+            self.spans.append(record)
+
+
+def span(name: str, **attrs: Any) -> Span | _NoopSpan:
+    """Open a span under the active tracer; a shared no-op when tracing is off."""
+    tracer = _TRACER.get()
+    if tracer is None:
+        return _NOOP_SPAN
+    return Span(tracer, name, attrs)
+
+
+def current_tracer() -> Tracer | None:
+    return _TRACER.get()
+
+
+def activate(tracer: Tracer | None) -> Token["Tracer | None"]:
+    return _TRACER.set(tracer)
+
+
+def deactivate(token: Token["Tracer | None"]) -> None:
+    _TRACER.reset(token)
@@ -93,3 +93,14 @@ def test_coordinator_run_smoke_more_assertions(tmp_path: Path) -> None:
     assert len(messages) >= 1
 
     coordinator.persistent.close()
+
+
+def test_persistent_memory_agent_durations_uses_recent_window(tmp_path: Path) -> None:
+    persistent = PersistentMemory(tmp_path / "swarm.db")
+    for duration in (10.0, 1.0, 3.0):
+        persistent.put_step_timing("run", "1", "coder", duration, "2024-01-01T00:00:00")
+    persistent.put_step_timing("run", "2", "researcher", 4.0, "2024-01-01T00:00:00")
+
+    assert persistent.agent_durations(window=2) == {"coder": 2.0, "researcher": 4.0}
+
+    persistent.close()
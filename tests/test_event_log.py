@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from swarm.bus import EventHub, EventLog
+from swarm.bus.event_log import LARGE_TEXT_BYTES, Event, event_code
+
+
+def test_event_log_spills_overflow_to_disk(tmp_path: Path) -> None:
+    spill = tmp_path / "events" / "run.jsonl"
+    log = EventLog(max_events=3, spill_path=spill)
+    for index in range(10):
+        log.log("tick", {"index": index, "path": tmp_path})
+
+    assert [event.payload["index"] for event in log.list_events()] == [7, 8, 9]
+    assert log.spilled == 7
+    assert len(log) == 10
+    assert log.spill_path == spill
+    assert [event.payload["index"] for event in log] == list(range(10))
+    log.close()
+    assert [event.event_type for event in log] == ["tick"] * 10
+
+
+def test_event_log_without_spill_path_drops_oldest() -> None:
+    log = EventLog(max_events=2)
+    for index in range(5):
+        log.log("tick", {"index": index})
+
+    assert [event.payload["index"] for event in log] == [3, 4]
+    assert log.dropped == 3
+    assert log.spill_path is None
+
+
+def test_event_log_rejects_invalid_size() -> None:
+    with pytest.raises(ValueError):
+        EventLog(max_events=0)
+
+
+def test_subscribers_filter_by_type_and_run() -> None:
+    hub = EventHub()
+    first = EventLog(run_id="a", hub=hub)
+    second = EventLog(run_id="b", hub=hub)
+    steps = hub.subscribe(event_types=["step_started"])
+    only_b = second.subscribe()
+
+    async def scenario() -> tuple[list[str], list[str]]:
+        first.log("step_started", {"step_id": 1})
+        first.log("agent_message", {"message": "hi"})
+        second.log("step_started", {"step_id": 2})
+        steps.close()
+        only_b.close()
+        seen_steps = [f"{event.run_id}:{event.payload['step_id']}" async for event in steps]
+        seen_b = [event.event_type async for event in only_b]
+        return seen_steps, seen_b
+
+    seen_steps, seen_b = asyncio.run(scenario())
+    assert seen_steps == ["a:1", "b:2"]
+    assert seen_b == ["step_started"]
+    assert hub.subscriber_count == 0
+
+
+def test_subscriber_wakes_on_new_event() -> None:
+    log = EventLog(run_id="run")
+
+    async def scenario() -> str:
+        subscription = log.subscribe(event_types=["step_completed"])
+        waiter = asyncio.create_task(subscription.get())
+        await asyncio.sleep(0)
+        log.log("step_completed", {"step_id": 1})
+        event = await asyncio.wait_for(waiter, timeout=1)
+        subscription.close()
+        return event.event_type
+
+    assert asyncio.run(scenario()) == "step_completed"
+
+
+def test_subscriber_overflow_policies() -> None:
+    log = EventLog()
+    oldest = log.subscribe(max_queue=2, policy="drop_oldest")
+    newest = log.subscribe(max_queue=2, policy="drop_newest")
+    disconnect = log.subscribe(max_queue=2, policy="disconnect")
+    for index in range(4):
+        log.log("tick", {"index": index})
+
+    assert [oldest.get_nowait().payload["index"] for _ in range(2)] == [2, 3]
+    assert [newest.get_nowait().payload["index"] for _ in range(2)] == [0, 1]
+    assert oldest.dropped == 2 and newest.dropped == 2
+    assert disconnect.closed and disconnect.overflowed
+    with pytest.raises(ValueError):
+        log.subscribe(policy="block")
+
+
+def test_compact_events_expose_type_and_wall_clock_timestamp() -> None:
+    log = EventLog()
+    before = datetime.now(timezone.utc)
+    log.log("step_started", {"step_id": 1})
+    log.log("step_started", {"step_id": 2})
+    first, second = log.list_events()
+
+    assert first.event_type == "step_started"
+    assert first.code == second.code == event_code("step_started")
+    assert first.ts_ns <= second.ts_ns
+    assert abs((first.timestamp - before).total_seconds()) < 5
+
+
+def test_spill_writes_large_strings_once(tmp_path: Path) -> None:
+    spill = tmp_path / "run.jsonl"
+    prompt = "x" * (LARGE_TEXT_BYTES * 2)
+    log = EventLog(max_events=1, spill_path=spill)
+    for index in range(4):
+        log.log("llm_prompt", {"prompt": prompt, "index": index})
+    log.close()
+
+    assert spill.read_text(encoding="utf-8").count(prompt) == 1
+    replayed = list(log)
+    assert [event.payload["index"] for event in replayed] == [0, 1, 2, 3]
+    assert all(event.payload["prompt"] == prompt for event in replayed)
+
+
+def test_spilled_payloads_round_trip_keys_that_look_like_references(tmp_path: Path) -> None:
+    spill = tmp_path / "run.jsonl"
+    prompt = "y" * LARGE_TEXT_BYTES
+    payload = {"ref": {"$text": "not a digest"}, "prompt": prompt, "note": None}
+    log = EventLog(max_events=1, spill_path=spill)
+    log.log("llm_prompt", payload)
+    log.log("llm_prompt", {"index": 1})
+    log.close()
+
+    replayed = next(iter(log))
+    assert replayed.payload == payload
+    assert list(replayed.payload) == ["ref", "prompt", "note"]
+
+
+def test_events_accept_the_earlier_keyword_form() -> None:
+    now = datetime.now(timezone.utc)
+    event = Event(timestamp=now, event_type="step_started", payload={"step_id": 1})
+
+    assert event.event_type == "step_started"
+    assert abs((event.timestamp - now).total_seconds()) < 1e-3
+    assert event.run_id is None
+    with pytest.raises(TypeError):
+        Event(payload={})
+
+
+def test_resumed_log_appends_to_the_earlier_spill(tmp_path: Path) -> None:
+    spill = tmp_path / "run.jsonl"
+    prompt = "x" * (LARGE_TEXT_BYTES * 2)
+    first = EventLog(max_events=1, spill_path=spill)
+    for index in range(3):
+        first.log("llm_prompt", {"prompt": prompt, "index": index})
+    first.close()
+
+    resumed = EventLog(max_events=1, spill_path=spill, append=True)
+    assert resumed.spilled == 2 and resumed.spill_path == spill
+    for index in range(3, 6):
+        resumed.log("llm_prompt", {"prompt": prompt, "index": index})
+    resumed.close()
+
+    # The first log's in-memory tail (index 2) was never spilled.
+    assert [event.payload["index"] for event in resumed] == [0, 1, 3, 4, 5]
+    assert spill.read_text(encoding="utf-8").count(prompt) == 1
+    assert len(resumed) == 5
+
+    fresh = EventLog(max_events=1, spill_path=spill)
+    for index in range(2):
+        fresh.log("tick", {"index": index})
+    fresh.close()
+    assert [event.payload["index"] for event in fresh] == [0, 1]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from swarm.llm import OllamaLLM, OllamaStubServer
+from swarm.net import HttpClient
+
+PLANNER_PROMPT = "Role: planner\nObjective: build a landing page"
+
+
+def test_client_reuses_keep_alive_connections() -> None:
+    client = HttpClient()
+    with OllamaStubServer() as server:
+        llm = OllamaLLM("llama3.1", server.url, "/api/generate", timeout=5, retries=0, client=client)
+
+        async def sequential() -> None:
+            for _ in range(5):
+                await llm.complete(PLANNER_PROMPT)
+
+        asyncio.run(sequential())
+
+    stats = llm.pool_stats()
+    assert stats.requests == 5
+    assert stats.connections_opened == 1
+    assert stats.connections_reused == 4
+    assert server.stats.connections == 1
+
+
+def test_client_bounds_pool_per_origin() -> None:
+    client = HttpClient()
+    with OllamaStubServer() as server:
+        llm = OllamaLLM("llama3.1", server.url, "/api/chat", timeout=5, retries=0, pool_size=2, client=client)
+
+        async def burst() -> None:
+            await asyncio.gather(*(llm.complete(PLANNER_PROMPT) for _ in range(8)))
+            await client.aclose()
+
+        asyncio.run(burst())
+
+    stats = llm.pool_stats()
+    assert stats.peak_open_connections == 2
+    assert stats.waits > 0
+    assert stats.open_connections == 0
+
+
+def test_client_is_shared_by_loops_in_several_threads() -> None:
+    client = HttpClient()
+    with OllamaStubServer() as server:
+        llm = OllamaLLM("llama3.1", server.url, "/api/generate", timeout=5, retries=0, client=client)
+
+        def run_in_thread(_: int) -> str:
+            return asyncio.run(llm.complete(PLANNER_PROMPT)).content
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            answers = list(pool.map(run_in_thread, range(64)))
+
+    assert len(set(answers)) == 1
+    assert server.stats.requests == 64
+    # Pools of finished loops are dropped as new ones open, so at most the last few remain.
+    assert len(client._pools) <= 8
+
+
+def test_abandoned_stream_discards_connection() -> None:
+    client = HttpClient()
+    with OllamaStubServer(chunk_tokens=2) as server:
+        llm = OllamaLLM("llama3.1", server.url, "/api/generate", timeout=5, retries=0, client=client)
+
+        async def first_chunk_then_complete() -> str:
+            stream = llm.stream(PLANNER_PROMPT)
+            await stream.__anext__()
+            await stream.aclose()
+            return (await llm.complete(PLANNER_PROMPT)).content
+
+        content = asyncio.run(first_chunk_then_complete())
+
+    assert content
+    assert llm.pool_stats().connections_opened == 2
+    assert llm.pool_stats().connections_closed >= 1
+
+
+def test_client_retries_when_server_dropped_idle_connection() -> None:
+    async def scenario() -> tuple[list[int], int]:
+        accepted = 0
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            nonlocal accepted
+            accepted += 1
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+            # Close without "Connection: close", like a server whose idle timeout fired.
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = HttpClient()
+        statuses = []
+        for _ in range(3):
+            response = await client.request("GET", f"http://127.0.0.1:{port}/")
+            statuses.append(response.status)
+            await asyncio.sleep(0.01)
+        server.close()
+        await server.wait_closed()
+        return statuses, accepted
+
+    statuses, accepted = asyncio.run(scenario())
+
+    assert statuses == [200, 200, 200]
+    assert accepted == 3
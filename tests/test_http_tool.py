@@ -1,51 +1,89 @@
 from __future__ import annotations
 
-import io
-from types import SimpleNamespace
+import asyncio
+import gzip
+import json
 
+from swarm.net import HttpClient
+from swarm.net import HttpResponse as ClientResponse
 from swarm.tools.http import HttpTool, HttpResponse
 
 
-class DummyResp:
-    def __init__(self, data: bytes, status: int = 200):
-        self._data = io.BytesIO(data)
-        self.status = status
+class FakeClient(HttpClient):
+    def __init__(self, handler):
+        super().__init__()
+        self._handler = handler
 
-    def read(self):
-        return self._data.read()
+    async def request(self, method, url, body=None, headers=None, json=None, timeout=None, follow_redirects=True):
+        return self._handler(method, url, headers, json)
 
-    def __enter__(self):
-        return self
 
-    def __exit__(self, exc_type, exc, tb):
-        return False
+def test_http_get_success():
+    tool = HttpTool(client=FakeClient(lambda *args: ClientResponse(200, "OK", {}, b"ok", "http://example")))
 
-
-def test_http_get_success(monkeypatch):
-    tool = HttpTool()
-
-    def fake_urlopen(req, timeout=None):
-        return DummyResp(b"ok", status=200)
-
-    monkeypatch.setattr("swarm.tools.http.urlopen", fake_urlopen)
     res = tool.get("http://example")
     assert isinstance(res, HttpResponse)
     assert res.status == 200
     assert res.text == "ok"
 
 
-def test_http_get_404(monkeypatch):
-    tool = HttpTool()
+def test_http_get_404():
+    def fail(*args):
+        raise ConnectionError("Not Found")
 
-    class FakeHTTPError(Exception):
-        pass
+    tool = HttpTool(client=FakeClient(fail))
 
-    def fake_urlopen(req, timeout=None):
-        raise FakeHTTPError("Not Found")
-
-    # Simulate URLError path
-    monkeypatch.setattr("swarm.tools.http.urlopen", fake_urlopen)
+    # Network errors come back as status 0
     res = tool.get("http://example")
     assert isinstance(res, HttpResponse)
     assert res.status == 0
     assert "Not Found" in res.text
+
+
+def test_http_tool_async_follows_redirects_and_decodes_gzip():
+    async def scenario() -> tuple[HttpResponse, HttpResponse, list[bytes]]:
+        seen: list[bytes] = []
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    break
+                seen.append(head)
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                posted = await reader.readexactly(length) if length else b""
+                if head.startswith(b"GET /old") or head.startswith(b"POST /submit"):
+                    writer.write(b"HTTP/1.1 303 See Other\r\nLocation: /new\r\nContent-Length: 0\r\n\r\n")
+                else:
+                    data = gzip.compress(json.dumps({"path": "new", "posted": posted.decode()}).encode())
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Encoding: gzip\r\n"
+                        + f"Content-Length: {len(data)}\r\n\r\n".encode()
+                        + data
+                    )
+                await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        tool = HttpTool(client=HttpClient())
+        got = await tool.aget(f"http://127.0.0.1:{port}/old")
+        posted = await tool.apost(f"http://127.0.0.1:{port}/submit", {"q": 1})
+        await tool.client.aclose()
+        server.close()
+        await server.wait_closed()
+        return got, posted, seen
+
+    got, posted, seen = asyncio.run(scenario())
+
+    assert got.status == 200
+    assert got.url.endswith("/new")
+    assert json.loads(got.text) == {"path": "new", "posted": ""}
+    # 303 turns the POST into a GET without a body.
+    assert json.loads(posted.text) == {"path": "new", "posted": ""}
+    assert seen[-1].startswith(b"GET /new")
+    assert all(b"Accept-Encoding: gzip" in head for head in seen)
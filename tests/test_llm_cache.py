@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator
+
+from swarm.config import SwarmConfig
+from swarm.coordinator import Coordinator
+from swarm.llm import LLM, CachingLLM, LLMResponse, MockLLM, OllamaLLM, until_json_object
+from swarm.memory import SqliteCache
+from swarm.runtime import SwarmRuntime, llm_identity
+
+PLANNER_PROMPT = "Role: planner\nObjective: build a landing page"
+
+
+class CountingLLM(MockLLM):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        self.calls += 1
+        return await super().complete(prompt)
+
+
+def test_caching_llm_keys_on_identity_and_prompt(tmp_path: Path) -> None:
+    inner = CountingLLM()
+    cache = SqliteCache(tmp_path / "swarm.db", table="llm_cache")
+    llm = CachingLLM(inner, cache, {"provider": "ollama", "model": "llama3.1"})
+    other_model = CachingLLM(inner, cache, {"provider": "ollama", "model": "qwen2.5"})
+
+    first = asyncio.run(llm.complete(PLANNER_PROMPT))
+    second = asyncio.run(llm.complete(PLANNER_PROMPT))
+    asyncio.run(llm.complete(PLANNER_PROMPT + " "))
+    asyncio.run(other_model.complete(PLANNER_PROMPT))
+    cache.close()
+
+    assert first.content == second.content
+    assert inner.calls == 3
+    assert llm.stats.hits == 1
+    assert llm.stats.misses == 3
+
+
+def test_caching_llm_replays_drained_streams(tmp_path: Path) -> None:
+    inner = CountingLLM()
+    cache = SqliteCache(tmp_path / "swarm.db", table="llm_cache")
+    llm = CachingLLM(inner, cache, {"provider": "mock"})
+
+    async def drain() -> str:
+        return "".join([chunk async for chunk in llm.stream(PLANNER_PROMPT)])
+
+    streamed = asyncio.run(drain())
+    replayed = asyncio.run(drain())
+    cache.close()
+
+    assert streamed == replayed == MockLLM().respond(PLANNER_PROMPT)
+    assert inner.calls == 1
+
+
+class ChunkedLLM(LLM):
+    CHUNKS = ("Here is the review: ", '{"approved": ', "true}", " Hope that helps!")
+
+    def __init__(self) -> None:
+        self.streams = 0
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        return LLMResponse(content="".join(self.CHUNKS))
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        self.streams += 1
+        for chunk in self.CHUNKS:
+            yield chunk
+
+
+def test_caching_llm_stores_streams_cut_after_a_json_object(tmp_path: Path) -> None:
+    inner = ChunkedLLM()
+    cache = SqliteCache(tmp_path / "swarm.db", table="llm_cache")
+    llm = CachingLLM(inner, cache, {"provider": "chunked"})
+
+    async def first_chunk() -> str:
+        stream = llm.stream(PLANNER_PROMPT)
+        chunk = await stream.__anext__()
+        await stream.aclose()
+        return chunk
+
+    async def until_object() -> str:
+        return "".join([chunk async for chunk in until_json_object(llm.stream(PLANNER_PROMPT))])
+
+    asyncio.run(first_chunk())
+    assert len(cache) == 0
+    cut = asyncio.run(until_object())
+    replayed = asyncio.run(until_object())
+    cache.close()
+
+    assert cut == replayed == 'Here is the review: {"approved": true}'
+    assert inner.streams == 2
+
+
+def test_repeated_runs_hit_llm_cache(tmp_path: Path) -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    config = SwarmConfig.from_repo_root(repo_root)
+    config.db_path = tmp_path / "swarm.db"
+    config.artifacts_dir = tmp_path / "artifacts"
+    config.output_root = tmp_path / "output"
+    config.filesystem_allowlist = [repo_root, config.artifacts_dir, config.output_root]
+    config.step_cache = False
+    config.llm_cache = True
+    inner = CountingLLM()
+    runtime = SwarmRuntime(config, llm=inner)
+
+    asyncio.run(Coordinator(config, runtime=runtime).run(objective="cached objective", dry_run=True))
+    calls_after_first = inner.calls
+    result = asyncio.run(Coordinator(config, runtime=runtime).run(objective="cached objective", dry_run=True))
+    runtime.close()
+
+    stats = [event.payload for event in result["events"] if event.event_type == "llm_cache_stats"]
+    assert calls_after_first > 0
+    assert inner.calls == calls_after_first
+    assert stats and stats[-1]["misses"] == calls_after_first
+    assert stats[-1]["hit_rate"] > 0.5
+
+
+def test_caller_supplied_llms_key_on_their_model(tmp_path: Path) -> None:
+    config = SwarmConfig.from_repo_root(tmp_path)
+    config.llm_provider = "ollama"
+    llama = OllamaLLM("llama3.1", "http://gpu:11434", "/api/generate", timeout=5, retries=0)
+    qwen = OllamaLLM("qwen2.5", "http://gpu:11434", "/api/generate", timeout=5, retries=0)
+
+    assert llm_identity(config, llama)["model"] == "llama3.1"
+    assert llm_identity(config, llama) != llm_identity(config, qwen)
+    # Clients that do not name a model fall back to the configured one.
+    assert llm_identity(config, MockLLM())["model"] == config.ollama_model
+    config.ollama_model = "mistral"
+    assert llm_identity(config, MockLLM())["model"] == "mistral"
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from swarm.llm import CoalescingLLM, LLM, LLMResponse
+
+
+class SlowLLM(LLM):
+    def __init__(self, delay: float = 0.02, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError("backend down")
+        return LLMResponse(content=f"answer to {prompt}")
+
+
+def test_identical_concurrent_prompts_share_one_call() -> None:
+    inner = SlowLLM()
+    llm = CoalescingLLM(inner)
+
+    async def burst() -> list[LLMResponse]:
+        return await asyncio.gather(
+            *(llm.complete("plan") for _ in range(5)), llm.complete("critique")
+        )
+
+    responses = asyncio.run(burst())
+
+    assert inner.calls == 2
+    assert {response.content for response in responses[:5]} == {"answer to plan"}
+    assert llm.stats.as_dict() == {"requests": 6, "leaders": 2, "collapsed": 4, "abandoned": 0}
+    # Sequential calls are not coalesced.
+    asyncio.run(llm.complete("plan"))
+    assert inner.calls == 3
+
+
+def test_errors_reach_every_waiter() -> None:
+    llm = CoalescingLLM(SlowLLM(fail=True))
+
+    async def burst() -> list[object]:
+        return await asyncio.gather(*(llm.complete("plan") for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(burst())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_cancelling_one_caller_keeps_the_shared_call() -> None:
+    inner = SlowLLM()
+    llm = CoalescingLLM(inner)
+
+    async def scenario() -> str:
+        first = asyncio.create_task(llm.complete("plan"))
+        second = asyncio.create_task(llm.complete("plan"))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return (await second).content
+
+    assert asyncio.run(scenario()) == "answer to plan"
+    assert inner.calls == 1
+    assert inner.cancelled == 0
+
+
+def test_shared_call_is_cancelled_when_every_caller_leaves() -> None:
+    inner = SlowLLM(delay=1.0)
+    llm = CoalescingLLM(inner)
+
+    async def scenario() -> str:
+        callers = [asyncio.create_task(llm.complete("plan")) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+        inner.delay = 0.0
+        return (await llm.complete("plan")).content
+
+    assert asyncio.run(scenario()) == "answer to plan"
+    assert inner.cancelled == 1
+    assert inner.calls == 2
+    assert llm.stats.abandoned == 1
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from swarm.llm import HedgedLLM, LLM, LLMResponse
+
+
+class ScriptedLLM(LLM):
+    """Each call takes the next delay from ``delays`` (then ``default``); ``None`` means fail."""
+
+    def __init__(self, delays: list[float | None], default: float = 0.001) -> None:
+        self.delays = list(delays)
+        self.default = default
+        self.calls = 0
+        self.cancelled = 0
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        self.calls += 1
+        delay = self.delays.pop(0) if self.delays else self.default
+        if delay is None:
+            raise RuntimeError("backend failed")
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return LLMResponse(content=f"{prompt} after {delay}")
+
+
+def _warm(llm: HedgedLLM, count: int = 20) -> None:
+    async def run() -> None:
+        for _ in range(count):
+            await llm.complete("warm")
+
+    asyncio.run(run())
+
+
+def test_slow_call_is_hedged_and_the_loser_cancelled() -> None:
+    inner = ScriptedLLM([0.001] * 20 + [2.0])
+    llm = HedgedLLM(inner, budget=0.5)
+    _warm(llm)
+    assert llm.hedge_delay() is not None
+
+    response = asyncio.run(asyncio.wait_for(llm.complete("critic"), timeout=1.0))
+
+    assert response.content == "critic after 0.001"
+    assert inner.calls == 22
+    assert inner.cancelled == 1
+    stats = llm.stats.as_dict()
+    assert stats["hedges"] == 1 and stats["hedge_wins"] == 1
+    assert stats["hedge_rate"] == round(1 / 21, 4) and stats["win_rate"] == 1.0
+
+
+def test_no_hedging_without_latency_history() -> None:
+    inner = ScriptedLLM([0.05])
+    llm = HedgedLLM(inner)
+
+    asyncio.run(llm.complete("planner"))
+
+    assert inner.calls == 1
+    assert llm.stats.hedges == 0
+
+
+def test_budget_caps_duplicate_load() -> None:
+    inner = ScriptedLLM([0.001] * 20 + [0.3])
+    llm = HedgedLLM(inner, budget=0.0)
+    _warm(llm)
+
+    response = asyncio.run(llm.complete("critic"))
+
+    assert response.content == "critic after 0.3"
+    assert inner.calls == 21
+    assert llm.stats.skipped == 1 and llm.stats.hedges == 0
+
+
+def test_hedge_covers_a_slow_primary_and_errors_surface_when_both_fail() -> None:
+    inner = ScriptedLLM([])
+    llm = HedgedLLM(inner, budget=1.0)
+    _warm(llm)
+
+    inner.delays = [0.3, 0.001]  # primary slow, hedge fast
+    assert asyncio.run(llm.complete("critic")).content == "critic after 0.001"
+
+    class SlowThenFail(ScriptedLLM):
+        async def complete(self, prompt: str) -> LLMResponse:
+            await asyncio.sleep(0.3)
+            raise RuntimeError("backend failed")
+
+    llm.inner = llm.hedge = SlowThenFail([])
+    with pytest.raises(RuntimeError, match="backend failed"):
+        asyncio.run(llm.complete("critic"))
+    assert llm.stats.hedges == 2
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import random
+
+import pytest
+
+from swarm.llm import AimdLimiter, LatencyProfile, LimitedLLM, LLM, LLMResponse, SimulatedLLM, agent_scope
+from swarm.net import HttpError
+
+
+class CountingLLM(LLM):
+    def __init__(self, delay: float = 0.01, error: Exception | None = None) -> None:
+        self.delay = delay
+        self.error = error
+        self.active = 0
+        self.peak = 0
+        self.order: list[str] = []
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.order.append(prompt)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if self.error is not None:
+            raise self.error
+        return LLMResponse(content=prompt)
+
+
+def test_limit_caps_concurrency_and_serves_waiters_in_order() -> None:
+    inner = CountingLLM()
+    limiter = AimdLimiter(initial_limit=2, max_limit=2)
+    llm = LimitedLLM(inner, limiter)
+
+    async def burst() -> list[LLMResponse]:
+        return await asyncio.gather(*(llm.complete(f"p{i}") for i in range(6)))
+
+    responses = asyncio.run(burst())
+
+    assert [response.content for response in responses] == [f"p{i}" for i in range(6)]
+    assert inner.peak == 2
+    assert inner.order == [f"p{i}" for i in range(6)]
+    snapshot = limiter.snapshot()
+    assert snapshot["limit"] == 2
+    assert snapshot["in_flight"] == 0 and snapshot["queued"] == 0
+    assert snapshot["waits"] == 4 and snapshot["peak_queued"] == 4
+    assert snapshot["wait_seconds"] > 0
+
+
+def test_limit_grows_while_callers_queue_at_steady_latency() -> None:
+    limiter = AimdLimiter(initial_limit=1, max_limit=16)
+    llm = LimitedLLM(CountingLLM(delay=0.002), limiter)
+
+    async def burst() -> None:
+        await asyncio.gather(*(llm.complete("p") for _ in range(60)))
+
+    asyncio.run(burst())
+
+    assert limiter.limit > 1
+    assert limiter.stats.increases > 0
+    assert limiter.stats.decreases == 0
+
+
+@pytest.mark.parametrize(
+    "error",
+    [TimeoutError("slow"), HttpError(503, "http://llm", b"busy")],
+)
+def test_overload_halves_the_limit_once_per_round(error: Exception) -> None:
+    limiter = AimdLimiter(initial_limit=8)
+    llm = LimitedLLM(CountingLLM(error=error), limiter)
+
+    async def burst() -> list[object]:
+        return await asyncio.gather(*(llm.complete("p") for _ in range(8)), return_exceptions=True)
+
+    results = asyncio.run(burst())
+
+    assert all(result is error for result in results)
+    # Eight concurrent failures started before the first cut count as one signal.
+    assert limiter.limit == 4
+    assert limiter.stats.overloads == 8 and limiter.stats.decreases == 1
+
+
+def test_wrapped_timeouts_count_as_overload_but_other_errors_do_not() -> None:
+    limiter = AimdLimiter(initial_limit=4)
+
+    async def fail(error: Exception) -> None:
+        with pytest.raises(RuntimeError):
+            await LimitedLLM(CountingLLM(error=error), limiter).complete("p")
+
+    wrapped = RuntimeError("Ollama request failed")
+    wrapped.__cause__ = TimeoutError()
+    asyncio.run(fail(RuntimeError("bad prompt")))
+    assert limiter.limit == 4
+    asyncio.run(fail(wrapped))
+    assert limiter.limit == 2
+
+
+def test_latency_spike_cuts_the_limit() -> None:
+    limiter = AimdLimiter(initial_limit=8, min_slowdown=0.01)
+    llm = LimitedLLM(CountingLLM(delay=0.001), limiter)
+
+    async def calls(count: int) -> None:
+        for _ in range(count):
+            await llm.complete("same kind")
+
+    asyncio.run(calls(6))
+    assert limiter.limit == 8
+    llm.inner = CountingLLM(delay=0.05)
+    asyncio.run(calls(1))
+
+    assert limiter.limit == 4
+
+
+def test_slowdown_in_one_kind_of_call_is_not_diluted_by_others() -> None:
+    limiter = AimdLimiter(initial_limit=8)
+
+    async def call(key: str, latency: float) -> None:
+        started = await limiter.acquire()
+        limiter.release(started, latency, key=key)
+
+    async def calls() -> list[int]:
+        for _ in range(6):
+            await call("coder", 1.0)
+            await call("critic", 1.0)
+        limits = []
+        # Coder calls are three times slower; critic calls in between stay at their baseline.
+        for _ in range(4):
+            await call("coder", 3.0)
+            for _ in range(3):
+                await call("critic", 1.0)
+            limits.append(limiter.limit)
+        return limits
+
+    assert asyncio.run(calls()) == [8, 8, 8, 4]
+
+
+class MixedLLM(LLM):
+    """Coder prompts take six times as long as critic prompts, whatever the load."""
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        await asyncio.sleep(0.06 if prompt.startswith("ROLE: Coder") else 0.01)
+        return LLMResponse(content=prompt)
+
+
+def test_mixed_prompt_latencies_do_not_cut_the_limit() -> None:
+    limiter = AimdLimiter(initial_limit=4)
+    llm = LimitedLLM(MixedLLM(), limiter)
+    rng = random.Random(7)
+
+    async def call(agent: str) -> None:
+        prompt = "ROLE: Coder\n" + "plan " * 80 if agent == "coder" else "ROLE: Critic\nok?"
+        with agent_scope(agent):
+            await llm.complete(prompt)
+
+    async def burst() -> None:
+        await asyncio.gather(*(call(rng.choice(["coder", "critic"])) for _ in range(300)))
+
+    asyncio.run(burst())
+
+    assert limiter.stats.decreases == 0
+    assert limiter.limit >= 4
+
+
+def test_cancelled_waiter_does_not_leak_a_slot() -> None:
+    limiter = AimdLimiter(initial_limit=1, max_limit=1)
+    llm = LimitedLLM(CountingLLM(delay=0.02), limiter)
+
+    async def scenario() -> str:
+        first = asyncio.ensure_future(llm.complete("first"))
+        queued = asyncio.ensure_future(llm.complete("queued"))
+        await asyncio.sleep(0)
+        assert limiter.queued == 1
+        queued.cancel()
+        await first
+        response = await llm.complete("after")
+        return response.content
+
+    assert asyncio.run(scenario()) == "after"
+    assert limiter.in_flight == 0 and limiter.queued == 0
+
+
+def test_limiter_settles_near_a_saturated_backend() -> None:
+    backend = SimulatedLLM(
+        profile=LatencyProfile(distribution="fixed", latency=0.01, max_concurrency=4)
+    )
+    limiter = AimdLimiter(initial_limit=32, max_limit=64, min_slowdown=0.005)
+    llm = LimitedLLM(backend, limiter)
+
+    async def burst() -> None:
+        await asyncio.gather(*(llm.complete(f"p{i}") for i in range(200)))
+
+    asyncio.run(burst())
+
+    # Queueing inside the backend shows up as latency and pulls the limit back down.
+    assert limiter.stats.decreases > 0
+    assert limiter.limit < 16
+
+
+def test_runtime_wraps_the_backend(tmp_path) -> None:
+    from swarm.config import SwarmConfig
+    from swarm.runtime import SwarmRuntime
+
+    config = SwarmConfig.from_repo_root(tmp_path)
+    runtime = SwarmRuntime(config)
+    try:
+        assert runtime.llm_limiter is not None
+        assert asyncio.run(runtime.llm.complete("hello")).content
+        assert runtime.llm_limiter.stats.acquired == 1
+    finally:
+        runtime.close()
+
+    config.llm_adaptive_limit = False
+    runtime = SwarmRuntime(config)
+    try:
+        assert runtime.llm_limiter is None
+    finally:
+        runtime.close()
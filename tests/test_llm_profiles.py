@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from swarm.config import SwarmConfig
+from swarm.coordinator import Coordinator
+from swarm.llm import (
+    LLM,
+    LLMProfile,
+    LLMResponse,
+    OllamaLLM,
+    OllamaStubServer,
+    current_profile,
+    profile_scope,
+)
+
+PROMPT = "Role: planner\nObjective: build a landing page"
+
+
+class RecordingLLM(LLM):
+    def __init__(self) -> None:
+        self.seen: list[LLMProfile | None] = []
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        self.seen.append(current_profile())
+        return LLMResponse(content=json.dumps({"approved": True, "notes": "ok"}))
+
+
+def test_profile_from_dict_coerces_cli_strings() -> None:
+    profile = LLMProfile.from_dict(
+        {"model": "llama3.2:1b", "max_tokens": "200", "temperature": "0.1", "stop": "}\n|END"}
+    )
+
+    assert profile == LLMProfile(model="llama3.2:1b", max_tokens=200, temperature=0.1, stop=("}\n", "END"))
+    assert profile.as_dict() == {
+        "model": "llama3.2:1b",
+        "max_tokens": 200,
+        "temperature": 0.1,
+        "stop": ["}\n", "END"],
+    }
+    with pytest.raises(ValueError, match="Unknown LLM profile option"):
+        LLMProfile.from_dict({"top_k": "4"})
+    with pytest.raises(ValueError):
+        LLMProfile.from_dict({"max_tokens": "0"})
+
+
+def test_ollama_sends_the_profile_as_model_and_options() -> None:
+    profile = LLMProfile(model="tiny", max_tokens=8, temperature=0.0, stop=("\n\n",), num_ctx=2048)
+    with OllamaStubServer() as server:
+        llm = OllamaLLM("llama3.1", server.url, "/api/chat", timeout=5, retries=0)
+        assert llm._payload("/api/chat", PROMPT)["model"] == "llama3.1"
+        with profile_scope(profile):
+            payload = llm._payload("/api/generate", PROMPT)
+            capped = asyncio.run(llm.complete(PROMPT))
+        full = asyncio.run(llm.complete(PROMPT))
+
+    assert payload["options"] == {"num_predict": 8, "temperature": 0.0, "stop": ["\n\n"], "num_ctx": 2048}
+    assert server.stats.by_model == {"tiny": 1, "llama3.1": 1}
+    assert len(capped.content) <= 32 < len(full.content)
+
+
+def test_agents_call_the_llm_with_their_own_profile(tmp_path: Path) -> None:
+    from swarm.runtime import SwarmRuntime
+
+    repo_root = Path(__file__).resolve().parents[1]
+    config = SwarmConfig.from_repo_root(repo_root)
+    config.db_path = tmp_path / "swarm.db"
+    config.artifacts_dir = tmp_path / "artifacts"
+    config.output_root = tmp_path / "output"
+    config.filesystem_allowlist = [repo_root, config.artifacts_dir, config.output_root]
+    config.agent_llm = {"critic": {"model": "tiny", "max_tokens": "64"}}
+    llm = RecordingLLM()
+    runtime = SwarmRuntime(config, llm=llm)
+    try:
+        result = asyncio.run(
+            Coordinator(config, runtime=runtime).run(objective="profiled objective", dry_run=True)
+        )
+    finally:
+        runtime.close()
+
+    prompts = [event.payload for event in result["events"] if event.event_type == "llm_prompt"]
+    critic_calls = [payload for payload in prompts if payload["agent"] == "critic"]
+    assert critic_calls
+    assert all(payload["profile"] == {"model": "tiny", "max_tokens": 64} for payload in critic_calls)
+    assert all("profile" not in payload for payload in prompts if payload["agent"] != "critic")
+    assert llm.seen.count(LLMProfile(model="tiny", max_tokens=64)) == len(critic_calls)
+    assert llm.seen.count(None) == len(prompts) - len(critic_calls)
+
+
+def test_profiles_for_unknown_agents_are_rejected(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    from swarm.main import main
+    from swarm.runtime import SwarmRuntime
+
+    with pytest.raises(SystemExit):
+        main(["objective", "--agent-llm", "codr:model=tiny"])
+    assert "unknown agent 'codr'" in capsys.readouterr().err
+
+    config = SwarmConfig.from_repo_root(tmp_path)
+    config.db_path = tmp_path / "swarm.db"
+    config.agent_llm = {"codr": {"model": "tiny"}}
+    with pytest.raises(ValueError, match="unknown agents: codr"):
+        SwarmRuntime(config)
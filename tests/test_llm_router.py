@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from swarm.llm import LatencyProfile, LLM, LLMResponse, RouterLLM, SimulatedLLM, run_scope
+from swarm.net import HttpError
+
+
+class Backend(LLM):
+    def __init__(self, name: str, delay: float = 0.01, error: Exception | None = None) -> None:
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return LLMResponse(content=self.name)
+
+    async def stream(self, prompt: str):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        yield self.name
+
+
+def _gather(llm: LLM, count: int) -> list[LLMResponse]:
+    async def burst() -> list[LLMResponse]:
+        return await asyncio.gather(*(llm.complete(f"p{i}") for i in range(count)))
+
+    return asyncio.run(burst())
+
+
+def test_least_outstanding_spreads_load_and_scales_throughput() -> None:
+    def backend() -> SimulatedLLM:
+        return SimulatedLLM(profile=LatencyProfile(distribution="fixed", latency=0.02, max_concurrency=1))
+
+    single = backend()
+    started = time.perf_counter()
+    _gather(single, 12)
+    single_seconds = time.perf_counter() - started
+
+    backends = [backend() for _ in range(3)]
+    router = RouterLLM(backends)
+    started = time.perf_counter()
+    _gather(router, 12)
+    routed_seconds = time.perf_counter() - started
+
+    assert [len(b.stats.latencies) for b in backends] == [4, 4, 4]
+    assert routed_seconds < single_seconds / 2
+    assert all(route["outstanding"] == 0 for route in router.route_stats())
+
+
+def test_failing_backend_is_ejected_and_calls_fail_over() -> None:
+    bad = Backend("bad", error=RuntimeError("Ollama request failed: connection refused"))
+    good = Backend("good")
+    router = RouterLLM([bad, good], names=["bad", "good"], failure_threshold=2, eject_seconds=60)
+
+    responses = [asyncio.run(router.complete("p")) for _ in range(6)]
+
+    assert {response.content for response in responses} == {"good"}
+    assert bad.calls == 2
+    stats = {route["name"]: route for route in router.route_stats()}
+    assert stats["bad"]["healthy"] is False and stats["bad"]["ejections"] == 1
+    assert stats["good"]["healthy"] is True
+
+
+def test_bad_requests_neither_fail_over_nor_eject() -> None:
+    error = RuntimeError("Ollama request failed")
+    error.__cause__ = HttpError(400, "http://a/api/generate", b"bad prompt")
+    first, second = Backend("a", error=error), Backend("b", error=error)
+    router = RouterLLM([first, second], failure_threshold=1)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(router.complete("p"))
+
+    assert first.calls + second.calls == 1
+    assert all(route["healthy"] and route["failures"] == 0 for route in router.route_stats())
+
+
+def test_pinned_runs_stick_to_one_backend() -> None:
+    backends = [Backend(f"b{i}", delay=0) for i in range(3)]
+    router = RouterLLM(backends, names=["b0", "b1", "b2"], pin_runs=True)
+
+    async def run(run_id: str) -> set[str]:
+        with run_scope(run_id):
+            responses = await asyncio.gather(*(router.complete(f"p{i}") for i in range(5)))
+        return {response.content for response in responses}
+
+    homes = [asyncio.run(run(f"run-{i}")) for i in range(12)]
+
+    assert all(len(home) == 1 for home in homes)
+    assert len(set().union(*homes)) > 1
+    # Without a run id the router balances as usual.
+    assert len({response.content for response in _gather(router, 6)}) == 3
+
+
+def test_stream_fails_over_before_the_first_chunk() -> None:
+    router = RouterLLM([Backend("down", error=OSError("refused")), Backend("up")])
+
+    async def collect() -> list[str]:
+        return [chunk async for chunk in router.stream("p")]
+
+    assert asyncio.run(collect()) == ["up"]
+    assert [route["failures"] for route in router.route_stats()] == [1, 0]
+
+
+def test_cancelled_calls_free_their_route() -> None:
+    router = RouterLLM([Backend("slow", delay=1.0), Backend("other", delay=1.0)])
+
+    async def cancel_in_flight() -> None:
+        task = asyncio.ensure_future(router.complete("p"))
+        await asyncio.sleep(0.01)
+        assert sum(route["outstanding"] for route in router.route_stats()) == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_in_flight())
+
+    stats = router.route_stats()
+    assert [route["outstanding"] for route in stats] == [0, 0]
+    assert [route["failures"] for route in stats] == [0, 0]
+    assert all(route["healthy"] for route in stats)
+
+
+def test_runtime_routes_over_every_ollama_url(tmp_path) -> None:
+    from swarm.config import SwarmConfig
+    from swarm.runtime import SwarmRuntime
+
+    config = SwarmConfig.from_repo_root(tmp_path)
+    config.llm_provider = "ollama"
+    config.ollama_urls = ["http://gpu-a:11434/", "http://gpu-b:11434"]
+    runtime = SwarmRuntime(config)
+    try:
+        assert runtime.llm_router is not None
+        assert [route["name"] for route in runtime.llm_router.route_stats()] == [
+            "http://gpu-a:11434",
+            "http://gpu-b:11434",
+        ]
+    finally:
+        runtime.close()
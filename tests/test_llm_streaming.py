@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import AsyncIterator
+
+from swarm.config import SwarmConfig
+from swarm.coordinator import Coordinator
+from swarm.llm import JsonObjectScanner, LLM, LLMResponse, MockLLM, OllamaLLM, OllamaStubServer, until_json_object
+
+PLANNER_PROMPT = "Role: planner\nObjective: build a landing page"
+
+
+class ChattyLLM(LLM):
+    """Streams a JSON answer followed by prose, recording whether the stream was closed early."""
+
+    def __init__(self) -> None:
+        self.inner = MockLLM()
+        self.closed_early = False
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        return LLMResponse(content=self.inner.respond(prompt) + "\nHope this helps!")
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        text = self.inner.respond(prompt)
+        finished = False
+        try:
+            for index in range(0, len(text), 7):
+                yield text[index : index + 7]
+            yield " Let me know if you need anything else."
+            finished = True
+        finally:
+            self.closed_early = not finished
+
+
+def _collect(chunks: AsyncIterator[str]) -> list[str]:
+    async def gather() -> list[str]:
+        return [chunk async for chunk in chunks]
+
+    return asyncio.run(gather())
+
+
+def test_scanner_ignores_braces_inside_strings() -> None:
+    scanner = JsonObjectScanner()
+    text = 'Sure: {"a": "}{", "b": "quote \\" }", "c": {"d": [1, {"e": 2}]}} trailing'
+
+    end = None
+    for index in range(0, len(text), 5):
+        end = scanner.feed(text[index : index + 5])
+        if end is not None:
+            consumed = index + end
+            break
+
+    assert end is not None
+    assert json.loads(text[text.index("{") : consumed]) == {
+        "a": "}{",
+        "b": 'quote " }',
+        "c": {"d": [1, {"e": 2}]},
+    }
+
+
+def test_until_json_object_truncates_and_closes_source() -> None:
+    llm = ChattyLLM()
+
+    chunks = _collect(until_json_object(llm.stream(PLANNER_PROMPT)))
+
+    assert "".join(chunks) == MockLLM().respond(PLANNER_PROMPT)
+    assert llm.closed_early is True
+
+
+def test_default_stream_yields_completion_once() -> None:
+    chunks = _collect(MockLLM().stream(PLANNER_PROMPT))
+
+    assert chunks == [MockLLM().respond(PLANNER_PROMPT)]
+
+
+def test_ollama_stream_consumes_ndjson_incrementally() -> None:
+    with OllamaStubServer(chunk_tokens=4) as server:
+        for endpoint in ("/api/generate", "/api/chat"):
+            llm = OllamaLLM("llama3.1", server.url, endpoint, timeout=5, retries=0)
+            chunks = _collect(llm.stream(PLANNER_PROMPT))
+
+            assert len(chunks) > 2
+            assert "".join(chunks) == MockLLM().respond(PLANNER_PROMPT)
+
+        assert server.stats.streamed == 2
+
+
+def test_agents_stream_chunks_and_stop_at_json(tmp_path: Path) -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    config = SwarmConfig.from_repo_root(repo_root)
+    config.db_path = tmp_path / "swarm.db"
+    config.artifacts_dir = tmp_path / "artifacts"
+    config.output_root = tmp_path / "output"
+    config.filesystem_allowlist = [repo_root, config.artifacts_dir, config.output_root]
+    config.llm_stop_at_json = True
+    llm = ChattyLLM()
+    coordinator = Coordinator(config=config, llm=llm)
+
+    result = asyncio.run(coordinator.run(objective="streamed landing page", dry_run=True))
+    coordinator.close()
+
+    events = result["events"]
+    chunks = [event for event in events if event.event_type == "llm_chunk"]
+    responses = [event.payload["response"] for event in events if event.event_type == "llm_response"]
+    assert chunks
+    assert responses
+    assert all("Let me know" not in response for response in responses)
+    assert json.loads(responses[0])["steps"]
+    assert llm.closed_early is True
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from swarm.config import SwarmConfig
+from swarm.coordinator import Coordinator
+from swarm.llm import ChatSessions, MockLLM, OllamaLLM, OllamaStubServer, agent_scope, run_scope
+
+PROMPTS = (
+    "Research summary: " + "the landing page needs a hero, pricing and a signup form. " * 40,
+    "Review step 1.",
+    "Review step 2.",
+)
+
+
+def _conversation(server: OllamaStubServer, sessions: ChatSessions) -> list[str]:
+    llm = OllamaLLM("llama3.1", server.url, "/api/generate", timeout=5, retries=0, sessions=sessions)
+
+    async def calls() -> list[str]:
+        answers = []
+        with run_scope("run-1"), agent_scope("critic"):
+            for prompt in PROMPTS:
+                answers.append((await llm.complete(prompt)).content)
+        return answers
+
+    return asyncio.run(calls())
+
+
+def test_resumed_sessions_evaluate_only_the_new_turn() -> None:
+    with OllamaStubServer() as baseline_server:
+        baseline = ChatSessions()
+        _conversation(baseline_server, baseline)
+    with OllamaStubServer() as server:
+        sessions = ChatSessions(resume=True)
+        answers = _conversation(server, sessions)
+
+    before, after = baseline.stats("run-1"), sessions.stats("run-1")
+    assert before.calls == after.calls == 3
+    assert before.resumed_calls == 0
+    assert after.resumed_calls == 2
+    # Later turns resend the research, but the server finds it in its prompt cache.
+    assert after.sent_tokens > 2 * before.sent_tokens
+    assert after.evaluated_tokens < before.evaluated_tokens + 20
+    assert after.saved_ratio > 0.6
+    assert server.stats.prompt_eval_tokens == after.evaluated_tokens
+    assert server.stats.by_path == {"/api/chat": 3}
+    # The stub answers the last user turn, as without a session.
+    assert answers == [MockLLM().respond(prompt) for prompt in PROMPTS]
+
+
+def test_sessions_are_kept_per_agent_and_dropped_with_the_run() -> None:
+    sessions = ChatSessions(resume=True, max_turns=1)
+    with run_scope("run-1"), agent_scope("critic"):
+        first = sessions.open("llama3.1", "one")
+        sessions.close("llama3.1", first, "answer one", {"prompt_eval_count": 3})
+        concurrent = sessions.open("llama3.1", "two")
+        second = sessions.open("llama3.1", "three")
+        sessions.close("llama3.1", second, "answer three", {"prompt_eval_count": 2})
+        # Finished second against the same history, so it does not join the session.
+        sessions.close("llama3.1", concurrent, "answer two", {"prompt_eval_count": 2})
+        latest = sessions.open("llama3.1", "four")
+    with run_scope("run-1"), agent_scope("coder"):
+        other = sessions.open("llama3.1", "five")
+
+    assert [message["content"] for message in second.messages or ()] == ["one", "answer one", "three"]
+    assert [message["content"] for message in latest.messages or ()] == ["three", "answer three", "four"]
+    assert other.base == 0
+    assert sessions.forget("run-1").as_dict() == {
+        "calls": 3,
+        "resumed_calls": 2,
+        "sent_tokens": 12,
+        "evaluated_tokens": 7,
+        "saved_ratio": 0.4167,
+    }
+    assert len(sessions) == 0
+
+
+def test_coordinator_logs_prefill_stats_for_chat_sessions(tmp_path: Path) -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    config = SwarmConfig.from_repo_root(repo_root)
+    config.db_path = tmp_path / "swarm.db"
+    config.artifacts_dir = tmp_path / "artifacts"
+    config.output_root = tmp_path / "output"
+    config.filesystem_allowlist = [repo_root, config.artifacts_dir, config.output_root]
+    config.llm_provider = "ollama"
+    config.llm_cache = True
+    config.ollama_chat_sessions = True
+    with OllamaStubServer() as server:
+        config.ollama_url = server.url
+        coordinator = Coordinator(config=config)
+        try:
+            assert coordinator.runtime.llm_cache is None
+            result = asyncio.run(coordinator.run(objective="landing page in sessions", dry_run=True))
+        finally:
+            coordinator.close()
+
+    stats = [event.payload for event in result["events"] if event.event_type == "llm_prefill_stats"]
+    assert len(stats) == 1
+    payload = stats[0]
+    assert payload["chat_sessions"] is True
+    assert payload["calls"] == server.stats.requests
+    # The critic reviews every step, so its later reviews resume its session.
+    assert payload["resumed_calls"] > 0
+    assert payload["evaluated_tokens"] == server.stats.prompt_eval_tokens
+    assert len(coordinator.runtime.llm_sessions or ()) == 0
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+import pytest
+
+from swarm.llm import OllamaLLM, OllamaStubServer
+from swarm.llm.limiter import latency_key
+from swarm.net import AdaptiveTimeout, CircuitBreaker, CircuitOpenError, RetryPolicy
+
+PROMPT = "Role: critic\nObjective: review the plan"
+
+
+def _client(server: OllamaStubServer, retries: int = 2, breaker: CircuitBreaker | None = None) -> OllamaLLM:
+    return OllamaLLM(
+        "llama3.1",
+        server.url,
+        "/api/generate",
+        timeout=5,
+        retries=retries,
+        retry=RetryPolicy(retries=retries, base_delay=0.01, max_delay=0.05),
+        breaker=breaker or CircuitBreaker(server.url),
+    )
+
+
+def test_backoff_grows_exponentially_with_full_jitter() -> None:
+    policy = RetryPolicy(retries=5, base_delay=0.5, max_delay=3.0)
+    rng = random.Random(7)
+
+    delays = [[policy.delay(retry, rng) for _ in range(200)] for retry in range(4)]
+
+    assert [max(batch) <= cap for batch, cap in zip(delays, (0.5, 1.0, 2.0, 3.0))] == [True] * 4
+    assert all(min(batch) >= 0 for batch in delays)
+    assert max(delays[3]) > 2.0
+    with pytest.raises(ValueError):
+        RetryPolicy(multiplier=0.5)
+
+
+def test_adaptive_timeout_follows_latency_percentile() -> None:
+    timeouts = AdaptiveTimeout(ceiling=120.0, floor=1.0, min_samples=10)
+    assert timeouts.timeout() == 120.0
+    for _ in range(99):
+        timeouts.observe(2.0)
+    timeouts.observe(5.0)
+
+    assert timeouts.timeout() == 15.0
+    assert timeouts.timeout(attempt=1) == 30.0
+    assert timeouts.timeout(attempt=5) == 120.0
+
+
+def test_short_calls_do_not_shrink_the_timeout_for_long_prompts() -> None:
+    long_prompt = PROMPT + "\nResearch: " + "pricing, hero and signup form. " * 200
+    with OllamaStubServer() as server:
+        llm = OllamaLLM("llama3.1", server.url, "/api/generate", timeout=60, retries=0)
+        for _ in range(20):
+            asyncio.run(llm.complete(PROMPT))
+
+    assert llm._attempt_timeout((False, latency_key(PROMPT)), 0) == 10.0
+    assert llm._attempt_timeout((False, latency_key(long_prompt)), 0) == 60.0
+    assert llm._attempt_timeout((True, latency_key(PROMPT)), 0) == 60.0
+
+
+def test_breaker_opens_then_probes_half_open() -> None:
+    breaker = CircuitBreaker("http://llm", failure_threshold=2, reset_timeout=0.05)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    time.sleep(0.06)
+    assert breaker.state == "half_open"
+    breaker.before_call()  # the probe
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # everyone else still fails fast
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.snapshot()["opened"] == 2
+    assert breaker.stats.rejected == 2
+
+
+def test_ollama_backs_off_and_recovers_from_server_errors() -> None:
+    with OllamaStubServer() as server:
+        server.fail_next(2, status=503)
+        llm = _client(server)
+        response = asyncio.run(llm.complete(PROMPT))
+
+    assert response.content
+    assert server.stats.requests == 3
+    stats = llm.retry_stats.as_dict()
+    assert stats["attempts"] == 3 and stats["retries"] == 2
+    assert llm.breaker.state == "closed"
+
+
+def test_client_errors_are_not_retried() -> None:
+    with OllamaStubServer() as server:
+        server.fail_next(1, status=400)
+        llm = _client(server)
+        with pytest.raises(RuntimeError, match="Ollama request failed"):
+            asyncio.run(llm.complete(PROMPT))
+
+    assert server.stats.requests == 1
+    assert llm.breaker.stats.failures == 0
+
+
+def test_open_breaker_fails_fast_without_touching_the_server() -> None:
+    with OllamaStubServer() as server:
+        breaker = CircuitBreaker(server.url, failure_threshold=2, reset_timeout=60)
+        server.fail_next(2, status=500)
+        llm = _client(server, retries=1, breaker=breaker)
+        with pytest.raises(RuntimeError):
+            asyncio.run(llm.complete(PROMPT))
+        sent = server.stats.requests
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(_client(server, breaker=breaker).complete(PROMPT))
+
+    assert sent == 2
+    assert server.stats.requests == 2
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import urllib.request
+
+import pytest
+
+from swarm.llm import LatencyProfile, MockLLM, OllamaLLM, OllamaStubServer
+
+PLANNER_PROMPT = "Role: planner\nObjective: build a landing page"
+
+
+def _client(server: OllamaStubServer, endpoint: str = "/api/generate", timeout: int = 5, retries: int = 1) -> OllamaLLM:
+    return OllamaLLM(model="llama3.1", base_url=server.url, endpoint=endpoint, timeout=timeout, retries=retries)
+
+
+def test_stub_generate_matches_mock_llm() -> None:
+    expected = asyncio.run(MockLLM().complete(PLANNER_PROMPT)).content
+    with OllamaStubServer() as server:
+        generated = asyncio.run(_client(server).complete(PLANNER_PROMPT))
+        chatted = asyncio.run(_client(server, endpoint="/api/chat").complete(PLANNER_PROMPT))
+
+    assert generated.content == expected
+    assert chatted.content == expected
+    assert server.stats.by_path == {"/api/generate": 1, "/api/chat": 1}
+
+
+def test_stub_streams_ndjson_chunks() -> None:
+    expected = MockLLM().respond(PLANNER_PROMPT)
+    with OllamaStubServer(chunk_tokens=4) as server:
+        request = urllib.request.Request(
+            f"{server.url}/api/generate",
+            data=json.dumps({"model": "llama3.1", "prompt": PLANNER_PROMPT, "stream": True}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=5) as response:
+            records = [json.loads(line) for line in response.read().decode("utf-8").splitlines()]
+
+    assert len(records) > 2
+    assert all(not record["done"] for record in records[:-1])
+    assert records[-1]["done"] is True
+    assert records[-1]["eval_count"] > 0
+    assert "".join(record["response"] for record in records) == expected
+    assert server.stats.streamed == 1
+
+
+def test_ollama_falls_back_to_chat_when_generate_is_missing() -> None:
+    with OllamaStubServer(endpoints=["/api/chat"]) as server:
+        response = asyncio.run(_client(server).complete(PLANNER_PROMPT))
+
+    assert json.loads(response.content)["steps"]
+    assert server.stats.not_found == 1
+    assert server.stats.by_path == {"/api/chat": 1}
+
+
+def test_ollama_retries_after_server_error() -> None:
+    with OllamaStubServer() as server:
+        server.fail_next(1, status=500)
+        response = asyncio.run(_client(server, retries=1).complete(PLANNER_PROMPT))
+
+    assert json.loads(response.content)["steps"]
+    assert server.stats.requests == 2
+    assert server.stats.errors == 1
+
+
+def test_ollama_times_out_against_hanging_server() -> None:
+    profile = LatencyProfile(distribution="fixed", latency=0.0, timeout_rate=1.0, timeout=2.0)
+    with OllamaStubServer(profile=profile) as server:
+        with pytest.raises(RuntimeError, match="Ollama request failed"):
+            asyncio.run(_client(server, timeout=1, retries=0).complete(PLANNER_PROMPT))
+
+    assert server.stats.timeouts == 1
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from swarm.config import SwarmConfig
+from swarm.coordinator import Coordinator
+from swarm.llm import LLMProfile, MockLLM, OllamaStubServer, OpenAICompatibleLLM, profile_scope
+from swarm.net import HttpClient
+
+PROMPT = "Role: planner\nObjective: build a landing page"
+
+
+def _client(server: OllamaStubServer, **kwargs: object) -> OpenAICompatibleLLM:
+    return OpenAICompatibleLLM("local-model", server.url, timeout=5, retries=0, **kwargs)  # type: ignore[arg-type]
+
+
+def test_chat_completions_match_mock_llm() -> None:
+    expected = MockLLM().respond(PROMPT)
+    with OllamaStubServer() as server:
+        response = asyncio.run(_client(server).complete(PROMPT))
+
+    assert response.content == expected
+    assert server.stats.by_path == {"/v1/chat/completions": 1}
+    assert server.stats.by_model == {"local-model": 1}
+
+
+def test_stream_reads_server_sent_events() -> None:
+    expected = MockLLM().respond(PROMPT)
+
+    async def collect(llm: OpenAICompatibleLLM) -> list[str]:
+        return [chunk async for chunk in llm.stream(PROMPT)]
+
+    with OllamaStubServer(chunk_tokens=4) as server:
+        chunks = asyncio.run(collect(_client(server)))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == expected
+    assert server.stats.streamed == 1
+
+
+def test_profile_maps_to_openai_fields() -> None:
+    llm = OpenAICompatibleLLM("local-model", "http://gpu:8000", timeout=5, retries=0, api_key="secret")
+    with profile_scope(LLMProfile(model="small", max_tokens=16, temperature=0.0, stop=("}",), num_ctx=4096)):
+        payload = llm._payload("/v1/chat/completions", PROMPT)
+
+    assert payload == {
+        "model": "small",
+        "messages": [{"role": "user", "content": PROMPT}],
+        "stream": False,
+        "max_tokens": 16,
+        "temperature": 0.0,
+        "stop": ["}"],
+    }
+    assert llm._headers == {"Authorization": "Bearer secret"}
+
+
+def test_concurrent_requests_share_a_bounded_keep_alive_pool() -> None:
+    async def burst(llm: OpenAICompatibleLLM) -> None:
+        await asyncio.gather(*(llm.complete(f"{PROMPT} {i}") for i in range(24)))
+
+    with OllamaStubServer() as server:
+        llm = _client(server, pool_size=6, client=HttpClient())
+        asyncio.run(burst(llm))
+
+    stats = llm.pool_stats()
+    assert stats.requests == 24
+    assert stats.connections_opened <= 6
+    assert server.stats.connections <= 6
+
+
+def test_coordinator_runs_against_an_openai_compatible_server(tmp_path: Path) -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    config = SwarmConfig.from_repo_root(repo_root)
+    config.db_path = tmp_path / "swarm.db"
+    config.artifacts_dir = tmp_path / "artifacts"
+    config.output_root = tmp_path / "output"
+    config.filesystem_allowlist = [repo_root, config.artifacts_dir, config.output_root]
+    config.llm_provider = "openai-compatible"
+    config.step_cache = False
+
+    with OllamaStubServer() as server:
+        config.openai_url = server.url
+        result = asyncio.run(Coordinator(config=config).run(objective="openai objective", dry_run=True))
+
+    assert result["final"]
+    assert server.stats.by_path["/v1/chat/completions"] > 0
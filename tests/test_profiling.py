@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from swarm.config import SwarmConfig
+from swarm.coordinator import Coordinator
+from swarm.profiling import build_report, profile_call, write_report
+
+
+def test_profile_report_covers_agents_and_writes_files(tmp_path: Path) -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    config = SwarmConfig.from_repo_root(repo_root)
+    config.db_path = tmp_path / "swarm.db"
+    config.artifacts_dir = tmp_path / "artifacts"
+    config.output_root = tmp_path / "output"
+    config.filesystem_allowlist = [repo_root, config.artifacts_dir, config.output_root]
+    config.step_cache = False
+    coordinator = Coordinator(config=config)
+
+    result, profiler, wall_seconds, cpu_seconds = profile_call(
+        lambda: asyncio.run(coordinator.run(objective="profile an animation", run_id="prof"))
+    )
+    report = write_report(
+        profiler, build_report(profiler, wall_seconds, cpu_seconds), Path(result["output_dir"])
+    )
+
+    assert {"planner", "researcher", "coder", "critic"} <= set(report.agent_seconds)
+    assert report.agent_self_seconds["coder"] > 0
+    assert report.stats_path is not None and report.stats_path.exists()
+    summary = report.summary_path.read_text(encoding="utf-8") if report.summary_path else ""
+    assert "CPU time per agent" in summary and "Wall clock" in summary
+    coordinator.close()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from swarm.config import SwarmConfig
+from swarm.coordinator import Coordinator
+from swarm.runner import RunSpec, SwarmRunner
+
+
+def _config_for(tmp_path: Path) -> SwarmConfig:
+    repo_root = Path(__file__).resolve().parents[1]
+    config = SwarmConfig.from_repo_root(repo_root)
+    config.db_path = tmp_path / "swarm.db"
+    config.artifacts_dir = tmp_path / "artifacts"
+    config.output_root = tmp_path / "output"
+    config.filesystem_allowlist = [repo_root, config.artifacts_dir, config.output_root]
+    return config
+
+
+def test_resume_only_runs_unfinished_steps(tmp_path: Path) -> None:
+    config = _config_for(tmp_path)
+    coordinator = Coordinator(config=config)
+    original_run_step = coordinator._run_step
+
+    async def crash_on_coder(step, context, **kwargs):
+        if step["agent"] == "coder":
+            raise RuntimeError("worker died")
+        return await original_run_step(step, context, **kwargs)
+
+    coordinator._run_step = crash_on_coder  # type: ignore[method-assign]
+    with pytest.raises(RuntimeError, match="worker died"):
+        asyncio.run(coordinator.run(objective="resume me", run_id="r1", dry_run=True))
+    coordinator.persistent.close()
+
+    resumed = Coordinator(config=config)
+    agents_run: list[str] = []
+    resumed_run_step = resumed._run_step
+
+    async def record(step, context, **kwargs):
+        agents_run.append(step["agent"])
+        return await resumed_run_step(step, context, **kwargs)
+
+    resumed._run_step = record  # type: ignore[method-assign]
+    result = asyncio.run(resumed.resume("r1", dry_run=True))
+
+    assert agents_run == ["coder"]
+    assert result["objective"] == "resume me"
+    assert "researcher:" in result["final"]
+    assert resumed.short_term.get("r1", "researcher", "research")
+    assert any(event.event_type == "run_resumed" for event in result["events"])
+    resumed.persistent.close()
+
+
+def test_runner_resume_requires_known_run(tmp_path: Path) -> None:
+    runner = SwarmRunner(config=_config_for(tmp_path), concurrency=1)
+    with pytest.raises(ExceptionGroup) as excinfo:
+        asyncio.run(runner.run([RunSpec(objective="", run_id="missing", resume=True)]))
+    assert excinfo.group_contains(ValueError, match="Unknown run_id")
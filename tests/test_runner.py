@@ -58,3 +58,41 @@ def test_swarm_runner_can_spawn_additional_runs(tmp_path: Path) -> None:
     results = asyncio.run(run_with_spawn())
     objectives = {result.objective for result in results}
     assert objectives == {"parent", "child"}
+
+
+def test_swarm_runner_shares_one_runtime_across_runs(tmp_path: Path, monkeypatch) -> None:
+    import swarm.runtime
+
+    config = _config_for(tmp_path)
+    created: list[object] = []
+    original = swarm.runtime.PersistentMemory
+
+    def counting_memory(db_path: Path) -> object:
+        memory = original(db_path)
+        created.append(memory)
+        return memory
+
+    monkeypatch.setattr(swarm.runtime, "PersistentMemory", counting_memory)
+    runner = SwarmRunner(config=config, concurrency=4)
+    specs = [RunSpec(objective=f"objective {index}", dry_run=True) for index in range(5)]
+
+    results = asyncio.run(runner.run(specs))
+
+    assert len(results) == 5
+    assert len(created) == 1
+    assert len({id(result.events) for result in results}) == 5
+    runner.close()
+
+
+def test_swarm_runner_subscription_streams_step_events(tmp_path: Path) -> None:
+    runner = SwarmRunner(config=_config_for(tmp_path), concurrency=2)
+
+    async def scenario() -> list[str]:
+        subscription = runner.subscribe(event_types=["step_started", "step_completed"])
+        await runner.run([RunSpec(objective="stream me", run_id="s1", dry_run=True)])
+        subscription.close()
+        return [f"{event.run_id}:{event.event_type}" async for event in subscription]
+
+    seen = asyncio.run(scenario())
+    assert "s1:step_started" in seen and "s1:step_completed" in seen
+    runner.close()
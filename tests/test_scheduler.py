@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from swarm.scheduler import PlanError, StepGraph, StepScheduler
+
+
+def _step(step_id: int, agent: str, depends_on: list[int]) -> dict[str, Any]:
+    return {"id": step_id, "agent": agent, "task": f"task {step_id}", "depends_on": depends_on}
+
+
+def test_step_graph_rejects_dangling_dependency() -> None:
+    with pytest.raises(PlanError, match="unknown steps"):
+        StepGraph.from_plan([_step(1, "researcher", []), _step(2, "coder", [7])])
+
+
+def test_step_graph_rejects_cycle() -> None:
+    steps = [_step(1, "researcher", [3]), _step(2, "coder", [1]), _step(3, "coder", [2])]
+    with pytest.raises(PlanError, match="cycle"):
+        StepGraph.from_plan(steps)
+
+
+def test_step_graph_rewires_excluded_and_skips_truncated() -> None:
+    steps = [
+        _step(1, "researcher", []),
+        _step(2, "critic", [1]),
+        _step(3, "coder", [2]),
+        _step(4, "coder", [5]),
+        _step(5, "researcher", []),
+    ]
+    graph = StepGraph.from_plan(steps, limit=4, exclude_agents=("critic",))
+    assert list(graph.steps) == [1, 3]
+    assert graph.dependencies[3] == [1]
+    assert graph.skipped == [4]
+
+
+def test_scheduler_starts_dependents_without_waiting_for_wave() -> None:
+    steps = [
+        _step(1, "researcher", []),
+        _step(2, "researcher", []),
+        _step(3, "coder", [1]),
+    ]
+    graph = StepGraph.from_plan(steps)
+    order: list[str] = []
+
+    async def run_step(step: dict[str, Any]) -> int:
+        order.append(f"start {step['id']}")
+        await asyncio.sleep(0.05 if step["id"] == 2 else 0)
+        order.append(f"end {step['id']}")
+        return step["id"]
+
+    results = asyncio.run(StepScheduler(graph).run(run_step))
+
+    assert results == {1: 1, 2: 2, 3: 3}
+    assert order.index("start 3") < order.index("end 2")
+
+
+def test_scheduler_cancels_running_steps_on_failure() -> None:
+    graph = StepGraph.from_plan([_step(1, "coder", []), _step(2, "coder", [])])
+    cancelled: list[int] = []
+
+    async def run_step(step: dict[str, Any]) -> None:
+        if step["id"] == 1:
+            raise RuntimeError("boom")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(step["id"])
+            raise
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(StepScheduler(graph).run(run_step))
+    assert cancelled == [2]
+
+
+def test_critical_path_weights_use_agent_durations() -> None:
+    steps = [
+        _step(1, "researcher", []),
+        _step(2, "coder", [1]),
+        _step(3, "coder", []),
+    ]
+    graph = StepGraph.from_plan(steps)
+    weights = graph.critical_path_weights({"researcher": 2.0, "coder": 5.0})
+    assert weights == {1: 7.0, 2: 5.0, 3: 5.0}
+
+
+def test_scheduler_orders_by_priority_and_respects_agent_limits() -> None:
+    steps = [_step(1, "coder", []), _step(2, "coder", []), _step(3, "coder", []), _step(4, "researcher", [])]
+    graph = StepGraph.from_plan(steps)
+    started: list[int] = []
+    active = {"coder": 0}
+    peak = {"coder": 0}
+
+    async def run_step(step: dict[str, Any]) -> None:
+        started.append(step["id"])
+        if step["agent"] == "coder":
+            active["coder"] += 1
+            peak["coder"] = max(peak["coder"], active["coder"])
+        await asyncio.sleep(0.01)
+        if step["agent"] == "coder":
+            active["coder"] -= 1
+
+    scheduler = StepScheduler(
+        graph,
+        priorities={1: 1.0, 2: 3.0, 3: 2.0, 4: 0.5},
+        agent_limits={"coder": 1},
+    )
+    asyncio.run(scheduler.run(run_step))
+
+    assert started == [2, 4, 3, 1]
+    assert peak["coder"] == 1
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from pathlib import Path
+
+import pytest
+
+from swarm.config import SwarmConfig
+from swarm.llm import LatencyProfile, MockLLM, SimulatedLLM
+from swarm.runner import RunSpec, SwarmRunner
+
+PLANNER_PROMPT = "Role: planner\nObjective: build a landing page"
+
+
+def test_simulated_llm_keeps_mock_responses() -> None:
+    llm = SimulatedLLM(LatencyProfile(distribution="fixed", latency=0.0))
+
+    simulated = asyncio.run(llm.complete(PLANNER_PROMPT))
+    expected = asyncio.run(MockLLM().complete(PLANNER_PROMPT))
+
+    assert simulated.content == expected.content
+    assert json.loads(simulated.content)["steps"]
+
+
+def test_simulated_llm_applies_latency_and_token_rate() -> None:
+    profile = LatencyProfile(distribution="fixed", latency=0.02, ttft=0.01, tokens_per_s=20_000)
+    llm = SimulatedLLM(profile)
+
+    started = time.perf_counter()
+    response = asyncio.run(llm.complete(PLANNER_PROMPT))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed >= 0.03 + profile.generation_time(response.content) * 0.9
+    assert llm.stats.calls == 1
+
+
+def test_simulated_stats_keep_a_bounded_latency_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("swarm.llm.simulated.LATENCY_WINDOW", 3)
+    llm = SimulatedLLM(LatencyProfile(distribution="fixed", latency=0.0))
+
+    async def calls() -> None:
+        for _ in range(5):
+            await llm.complete(PLANNER_PROMPT)
+
+    asyncio.run(calls())
+
+    assert llm.stats.calls == 5
+    assert len(llm.stats.latencies) == 3
+    assert llm.stats.as_dict()["p99_s"] >= 0
+
+
+def test_simulated_llm_stream_yields_full_response() -> None:
+    llm = SimulatedLLM(LatencyProfile(distribution="fixed", latency=0.0, tokens_per_s=100_000), chunk_tokens=4)
+
+    async def collect() -> list[str]:
+        return [chunk async for chunk in llm.stream(PLANNER_PROMPT)]
+
+    chunks = asyncio.run(collect())
+    expected = asyncio.run(MockLLM().complete(PLANNER_PROMPT)).content
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == expected
+
+
+def test_simulated_llm_caps_server_concurrency() -> None:
+    llm = SimulatedLLM(LatencyProfile(distribution="fixed", latency=0.01, max_concurrency=2))
+
+    async def burst() -> None:
+        await asyncio.gather(*(llm.complete(PLANNER_PROMPT) for _ in range(6)))
+
+    asyncio.run(burst())
+    asyncio.run(burst())
+
+    assert llm.stats.calls == 12
+    assert llm.stats.peak_in_flight == 2
+    assert llm.stats.peak_waiting == 4
+    assert llm.stats.queue_seconds > 0
+
+
+def test_simulated_llm_injects_failures_and_timeouts() -> None:
+    failing = SimulatedLLM(LatencyProfile(distribution="fixed", latency=0.0, failure_rate=1.0))
+    with pytest.raises(RuntimeError):
+        asyncio.run(failing.complete(PLANNER_PROMPT))
+    assert failing.stats.failures == 1
+
+    hanging = SimulatedLLM(LatencyProfile(distribution="fixed", latency=0.0, timeout_rate=1.0, timeout=0.01))
+    with pytest.raises(TimeoutError):
+        asyncio.run(hanging.complete(PLANNER_PROMPT))
+    assert hanging.stats.timeouts == 1
+    assert hanging.stats.in_flight == 0
+
+
+def test_latency_distributions_sample_plausible_values() -> None:
+    rng = random.Random(7)
+    samples = {
+        name: [LatencyProfile(distribution=name, latency=0.5, jitter=0.2).sample(rng) for _ in range(2000)]
+        for name in ("fixed", "normal", "lognormal", "pareto")
+    }
+
+    assert set(samples["fixed"]) == {0.5}
+    assert min(samples["normal"]) >= 0
+    assert 0.45 < sorted(samples["lognormal"])[1000] < 0.55
+    assert min(samples["pareto"]) >= 0.5
+    assert max(samples["pareto"]) > 10 * 0.5
+
+
+def test_latency_profile_from_dict_coerces_and_validates() -> None:
+    profile = LatencyProfile.from_dict({"distribution": "pareto", "latency": "0.2", "max_concurrency": "3"})
+
+    assert profile.latency == 0.2
+    assert profile.max_concurrency == 3
+    with pytest.raises(ValueError):
+        LatencyProfile.from_dict({"distribution": "uniform"})
+    with pytest.raises(ValueError):
+        LatencyProfile.from_dict({"latency_ms": "5"})
+
+
+def test_runner_uses_simulated_provider(tmp_path: Path) -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    config = SwarmConfig.from_repo_root(repo_root)
+    config.db_path = tmp_path / "swarm.db"
+    config.artifacts_dir = tmp_path / "artifacts"
+    config.output_root = tmp_path / "output"
+    config.filesystem_allowlist = [repo_root, config.artifacts_dir, config.output_root]
+    config.llm_provider = "simulated"
+    config.simulated_llm = {"distribution": "fixed", "latency": "0.001", "max_concurrency": "1"}
+    runner = SwarmRunner(config=config, concurrency=3)
+
+    results = asyncio.run(runner.run([RunSpec(objective=f"sim {index}", dry_run=True) for index in range(3)]))
+    llm = runner.runtime_for(config).backend
+    runner.close()
+
+    assert len(results) == 3
+    assert isinstance(llm, SimulatedLLM)
+    assert llm.stats.peak_in_flight == 1
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import shutil
+import time
+from pathlib import Path
+from typing import Any
+
+from swarm.config import SwarmConfig
+from swarm.coordinator import Coordinator
+from swarm.llm import LLM, LLMResponse, MockLLM
+from swarm.memory import SqliteCache
+
+
+def _config_for(tmp_path: Path) -> SwarmConfig:
+    repo_root = Path(__file__).resolve().parents[1]
+    config = SwarmConfig.from_repo_root(repo_root)
+    config.db_path = tmp_path / "swarm.db"
+    config.artifacts_dir = tmp_path / "artifacts"
+    config.output_root = tmp_path / "output"
+    config.filesystem_allowlist = [repo_root, config.artifacts_dir, config.output_root]
+    return config
+
+
+class CountingLLM(MockLLM):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def complete(self, prompt: str) -> LLMResponse:
+        self.calls += 1
+        return await super().complete(prompt)
+
+
+def test_sqlite_cache_lru_and_ttl(tmp_path: Path) -> None:
+    cache = SqliteCache(tmp_path / "cache.db", table="demo", max_entries=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.get("a") == "1"
+    time.sleep(0.01)
+    cache.put("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.stats.hits == 2 and cache.stats.misses == 1
+
+    expiring = SqliteCache(tmp_path / "cache.db", table="short", ttl=0.0)
+    expiring.put("k", "v")
+    time.sleep(0.01)
+    assert expiring.get("k") is None
+    cache.close()
+    expiring.close()
+
+
+def test_step_cache_replays_outputs_and_artifacts(tmp_path: Path) -> None:
+    config = _config_for(tmp_path)
+    first_llm = CountingLLM()
+    first = Coordinator(config=config, llm=first_llm)
+    first_result = asyncio.run(first.run(objective="cache me", run_id="one"))
+    assert first_llm.calls > 0
+    output_dir = Path(first_result["output_dir"])
+    shutil.rmtree(output_dir)
+
+    second_llm = CountingLLM()
+    second = Coordinator(config=config, llm=second_llm)
+    second_result = asyncio.run(second.run(objective="cache me", run_id="two"))
+
+    assert second_llm.calls == 0
+    assert second.step_cache is not None and second.step_cache.stats.misses == 0
+    assert (output_dir / "research.md").exists()
+    assert (output_dir / "plan.json").exists()
+    assert second.short_term.get("two", "researcher", "research")
+    assert second_result["final"] == first_result["final"]
+    first.persistent.close()
+    second.persistent.close()
+
+
+def test_step_cache_bypass(tmp_path: Path) -> None:
+    config = _config_for(tmp_path)
+    config.step_cache = False
+    asyncio.run(Coordinator(config=config).run(objective="no cache", run_id="a", dry_run=True))
+    llm = CountingLLM()
+    coordinator = Coordinator(config=config, llm=llm)
+    asyncio.run(coordinator.run(objective="no cache", run_id="b", dry_run=True))
+    assert coordinator.step_cache is None
+    assert llm.calls > 0
+
+
+
+class NamedLLM(CountingLLM):
+    def __init__(self, model: str) -> None:
+        super().__init__()
+        self.model = model
+
+
+def _cache_hits(
+    config: SwarmConfig, run_id: str, llm: LLM | None = None, instructions: str | None = None
+) -> list[Any]:
+    coordinator = Coordinator(config=config, llm=llm)
+    if instructions is not None:
+        coordinator.agents[instructions].instructions += " Cite every source."
+    try:
+        result = asyncio.run(coordinator.run(objective="cache inputs", run_id=run_id, dry_run=True))
+    finally:
+        coordinator.close()
+    return [event.payload["step_id"] for event in result["events"] if event.event_type == "step_cache_hit"]
+
+
+def _warm(config: SwarmConfig, llm: LLM | None = None) -> None:
+    _cache_hits(config, "first", llm)
+    assert "plan" in _cache_hits(config, "same", llm)
+
+
+def test_step_cache_misses_when_http_is_enabled(tmp_path: Path) -> None:
+    config = _config_for(tmp_path)
+    _warm(config)
+    config.enable_http = True
+    assert _cache_hits(config, "changed") == []
+
+
+def test_step_cache_misses_when_search_endpoint_changes(tmp_path: Path) -> None:
+    config = _config_for(tmp_path)
+    _warm(config)
+    config.search_endpoint = "https://search.example/api"
+    assert _cache_hits(config, "changed") == []
+
+
+def test_step_cache_misses_when_instructions_change(tmp_path: Path) -> None:
+    config = _config_for(tmp_path)
+    _warm(config)
+    assert "plan" not in _cache_hits(config, "planner", instructions="planner")
+    # Only the plan step itself is cached without the critic's review.
+    assert _cache_hits(config, "critic", instructions="critic") == ["plan"]
+
+
+def test_step_cache_misses_when_the_injected_llm_changes(tmp_path: Path) -> None:
+    config = _config_for(tmp_path)
+    _warm(config, NamedLLM("llama3.1"))
+    other = NamedLLM("qwen2.5")
+    assert _cache_hits(config, "changed", other) == []
+    assert other.calls > 0
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+from swarm import tracing
+from swarm.config import SwarmConfig
+from swarm.coordinator import Coordinator
+from swarm.tracing import Tracer
+
+
+def _config_for(tmp_path: Path) -> SwarmConfig:
+    repo_root = Path(__file__).resolve().parents[1]
+    config = SwarmConfig.from_repo_root(repo_root)
+    config.db_path = tmp_path / "swarm.db"
+    config.artifacts_dir = tmp_path / "artifacts"
+    config.output_root = tmp_path / "output"
+    config.filesystem_allowlist = [repo_root, config.artifacts_dir, config.output_root]
+    return config
+
+
+def test_span_is_shared_noop_without_tracer() -> None:
+    assert tracing.current_tracer() is None
+    assert tracing.span("a") is tracing.span("b")
+
+
+def test_spans_nest_under_active_tracer() -> None:
+    tracer = Tracer("demo")
+    token = tracing.activate(tracer)
+    try:
+        with tracing.span("outer", kind="test"):
+            with tracing.span("inner") as inner:
+                inner.set(items=3)
+    finally:
+        tracing.deactivate(token)
+
+    inner_record, outer_record = tracer.spans
+    assert inner_record.parent_id == outer_record.span_id
+    assert inner_record.attrs == {"items": 3}
+    assert outer_record.duration_ns >= inner_record.duration_ns
+
+
+def test_coordinator_writes_chrome_trace(tmp_path: Path) -> None:
+    config = _config_for(tmp_path)
+    config.trace = True
+    config.step_cache = False
+    coordinator = Coordinator(config=config)
+    result = asyncio.run(coordinator.run(objective="trace me", run_id="traced"))
+
+    trace_path = Path(result["trace_path"])
+    assert trace_path == config.artifacts_dir / "traces" / "traced.trace.json"
+    events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+    names = {event["name"] for event in events if event["ph"] == "X"}
+    assert {"run", "step", "llm.complete", "db.put_message", "fs.write_text"} <= names
+    assert tracing.current_tracer() is None
+    coordinator.close()